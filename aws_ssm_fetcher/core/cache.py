@@ -4,9 +4,53 @@ import json
 import logging
 import os
 import pickle
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency - fall back to uncompressed pickles
+    zstandard = None
+
+try:
+    import orjson
+except ImportError:  # Optional dependency - fall back to stdlib json
+    orjson = None
+
+# Compressed and uncompressed caches use different suffixes so switching
+# between them never tries to load a file in the other format
+CACHE_SUFFIX = ".pkl.zst" if zstandard is not None else ".pkl"
+
+# Per-entry TTLs of local cache files written with an explicit ttl_hours,
+# keyed by file name, so get_info() can report each file's real expiry
+TTL_INDEX_FILE = "ttl_index.json"
+
+# Memory tiers that outlive a single CacheManager, keyed by cache directory.
+# A warm Lambda container keeps these between invocations, so repeat lookups
+# are served from RAM without touching /tmp.
+_SHARED_MEMORY_CACHES: Dict[str, Dict[str, Tuple[float, Any]]] = {}
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize S3 cache payloads, with orjson when it is installed."""
+    if orjson is not None:
+        # Non-string keys are stringified, as the stdlib json module does
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return json.dumps(data, default=str).encode("utf-8")
+
+
+def _json_loads(payload: bytes) -> Any:
+    """Deserialize S3 cache payloads, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
 
 
 class CacheManager:
@@ -24,12 +68,23 @@ class CacheManager:
         self.cache_dir = Path(config.cache_dir)
         self.cache_hours = config.cache_hours
         self.cache_enabled = config.cache_enabled and config.cache_hours > 0
+        # Refresh mode skips cache reads but still writes fresh results
+        self.refresh = getattr(config, "cache_refresh", False)
 
         if self.cache_enabled:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialize in-memory cache
-        self._memory_cache = {}
+        # Initialize in-memory cache: key -> (expiry timestamp, data)
+        self._memory_cache: Dict[str, Tuple[float, Any]]
+        if getattr(config, "memory_cache_shared", False):
+            self._memory_cache = _SHARED_MEMORY_CACHES.setdefault(
+                str(self.cache_dir), {}
+            )
+        else:
+            self._memory_cache = {}
+
+        # Serializes read-modify-write of the TTL index across threads
+        self._ttl_index_lock = threading.Lock()
 
         # Initialize S3 client for Lambda caching if configured
         self.s3_client = None
@@ -46,20 +101,26 @@ class CacheManager:
     def _get_cache_path(self, key: str) -> Path:
         """Get cache file path for a key."""
         safe_key = key.replace("/", "_").replace(":", "_")
-        return self.cache_dir / f"{safe_key}.pkl"
+        return self.cache_dir / f"{safe_key}{CACHE_SUFFIX}"
+
+    def _ttl_hours(self, ttl_hours: Optional[float]) -> float:
+        """Resolve a per-key TTL, defaulting to the configured cache_hours."""
+        return self.cache_hours if ttl_hours is None else ttl_hours
 
-    def _is_cache_valid(self, cache_path: Path) -> bool:
+    def _is_cache_valid(
+        self, cache_path: Path, ttl_hours: Optional[float] = None
+    ) -> bool:
         """Check if cache file is still valid based on TTL."""
         if not cache_path.exists():
             return False
 
         # Get file modification time
         mtime = datetime.fromtimestamp(cache_path.stat().st_mtime)
-        expiry_time = mtime + timedelta(hours=self.cache_hours)
+        expiry_time = mtime + timedelta(hours=self._ttl_hours(ttl_hours))
 
         return datetime.now() < expiry_time
 
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: str, ttl_hours: Optional[float] = None) -> Optional[Any]:
         """Get from cache with multi-tier fallback.
 
         Cache hierarchy:
@@ -69,42 +130,53 @@ class CacheManager:
 
         Args:
             key: Cache key
+            ttl_hours: TTL for this key (defaults to cache_hours)
 
         Returns:
             Cached data if valid, None otherwise
         """
-        if not self.cache_enabled:
+        if not self.cache_enabled or self.refresh:
             return None
 
         # Tier 1: Memory cache (fastest)
-        if key in self._memory_cache:
+        memory_data = self._get_from_memory(key)
+        if memory_data is not None:
             self.logger.debug(f"Cache hit (memory): {key}")
-            return self._memory_cache[key]
+            return memory_data
 
         # Tier 2: Local file cache
-        local_data = self._get_from_local(key)
+        local_data = self._get_from_local(key, ttl_hours=ttl_hours)
         if local_data is not None:
-            self._memory_cache[key] = local_data  # Promote to memory
+            # Promote to memory, expiring together with the file
+            try:
+                expires_at = self._get_cache_path(key).stat().st_mtime
+            except OSError:
+                expires_at = time.time()
+            self._memory_cache[key] = (
+                expires_at + self._ttl_hours(ttl_hours) * 3600,
+                local_data,
+            )
             self.logger.debug(f"Cache hit (local): {key}")
             return local_data
 
         # Tier 3: S3 cache (for Lambda cross-invocation)
         if self.s3_client:
-            s3_data = self._get_from_s3(key)
+            s3_data = self._get_from_s3(key, ttl_hours=ttl_hours)
             if s3_data is not None:
-                self._set_to_local(key, s3_data)  # Cache locally
-                self._memory_cache[key] = s3_data  # Cache in memory
+                self._set_to_local(key, s3_data, ttl_hours)  # Cache locally
+                self._set_to_memory(key, s3_data, ttl_hours)  # Cache in memory
                 self.logger.debug(f"Cache hit (S3): {key}")
                 return s3_data
 
         return None
 
-    def set(self, key: str, data: Any) -> bool:
+    def set(self, key: str, data: Any, ttl_hours: Optional[float] = None) -> bool:
         """Set data in cache across all tiers.
 
         Args:
             key: Cache key
             data: Data to cache
+            ttl_hours: TTL for this key (defaults to cache_hours)
 
         Returns:
             True if cached successfully, False otherwise
@@ -113,10 +185,10 @@ class CacheManager:
             return False
 
         # Always cache in memory
-        self._memory_cache[key] = data
+        self._set_to_memory(key, data, ttl_hours)
 
         # Cache locally
-        success = self._set_to_local(key, data)
+        success = self._set_to_local(key, data, ttl_hours)
 
         # Cache in S3 if available
         if self.s3_client:
@@ -124,34 +196,114 @@ class CacheManager:
 
         return success
 
-    def _get_from_local(self, key: str) -> Optional[Any]:
+    def get_stale(self, key: str) -> Optional[Any]:
+        """Get from memory or local cache ignoring the TTL.
+
+        Used to revalidate expired entries against their source (e.g. with
+        an HTTP conditional request) before throwing them away.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached data if present, None otherwise (always None in refresh mode)
+        """
+        if not self.cache_enabled or self.refresh:
+            return None
+
+        # A fresh entry goes through get() so it is promoted to memory and
+        # later calls skip the disk read; only expired entries are read raw
+        data = self.get(key)
+        if data is not None:
+            return data
+
+        return self._get_from_local(key, check_ttl=False)
+
+    def _get_from_memory(self, key: str) -> Optional[Any]:
+        """Get from the in-memory tier, dropping the entry once it expires."""
+        entry = self._memory_cache.get(key)
+        if entry is None:
+            return None
+
+        expires_at, data = entry
+        if time.time() >= expires_at:
+            self._memory_cache.pop(key, None)
+            return None
+        return data
+
+    def _set_to_memory(
+        self, key: str, data: Any, ttl_hours: Optional[float] = None
+    ) -> None:
+        """Set in the in-memory tier with the key's TTL."""
+        expires_at = time.time() + self._ttl_hours(ttl_hours) * 3600
+        self._memory_cache[key] = (expires_at, data)
+
+    def _get_from_local(
+        self, key: str, check_ttl: bool = True, ttl_hours: Optional[float] = None
+    ) -> Optional[Any]:
         """Get from local file system."""
         cache_path = self._get_cache_path(key)
 
-        if self._is_cache_valid(cache_path):
+        if (
+            self._is_cache_valid(cache_path, ttl_hours)
+            if check_ttl
+            else cache_path.exists()
+        ):
             try:
-                with open(cache_path, "rb") as f:
-                    return pickle.load(f)
+                blob = cache_path.read_bytes()
+                if zstandard is not None:
+                    blob = zstandard.ZstdDecompressor().decompress(blob)
+                return pickle.loads(blob)
             except Exception as e:
                 self.logger.warning(f"Failed to load local cache {key}: {e}")
                 cache_path.unlink(missing_ok=True)
 
         return None
 
-    def _set_to_local(self, key: str, data: Any) -> bool:
-        """Set to local file system."""
+    def _set_to_local(
+        self, key: str, data: Any, ttl_hours: Optional[float] = None
+    ) -> bool:
+        """Set to local file system, recording the entry's TTL."""
         cache_path = self._get_cache_path(key)
 
         try:
-            with open(cache_path, "wb") as f:
-                pickle.dump(data, f)
+            blob = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+            if zstandard is not None:
+                blob = zstandard.ZstdCompressor(level=3).compress(blob)
+            cache_path.write_bytes(blob)
+            self._record_ttl(cache_path.name, ttl_hours)
             self.logger.debug(f"Saved to local cache: {key}")
             return True
         except Exception as e:
             self.logger.error(f"Failed to save local cache {key}: {e}")
             return False
 
-    def _get_from_s3(self, key: str) -> Optional[Any]:
+    def _load_ttl_index(self) -> Dict[str, float]:
+        """Load the per-file TTL index (empty if missing or unreadable)."""
+        try:
+            return _json_loads((self.cache_dir / TTL_INDEX_FILE).read_bytes())
+        except (OSError, ValueError):
+            return {}
+
+    def _record_ttl(self, file_name: str, ttl_hours: Optional[float]) -> None:
+        """Record a file's explicit TTL; default-TTL files are left out."""
+        with self._ttl_index_lock:
+            index = self._load_ttl_index()
+            if ttl_hours is None:
+                if index.pop(file_name, None) is None:
+                    return
+            elif index.get(file_name) == ttl_hours:
+                return
+            else:
+                index[file_name] = ttl_hours
+            try:
+                (self.cache_dir / TTL_INDEX_FILE).write_bytes(_json_dumps(index))
+            except OSError as e:
+                self.logger.debug(f"Failed to save cache TTL index: {e}")
+
+    def _get_from_s3(
+        self, key: str, ttl_hours: Optional[float] = None
+    ) -> Optional[Any]:
         """Get from S3 cache."""
         if not self.s3_client or not self.config.s3_cache_bucket:
             return None
@@ -163,10 +315,11 @@ class CacheManager:
 
             # Check TTL
             last_modified = response["LastModified"].replace(tzinfo=None)
-            if datetime.utcnow() - last_modified > timedelta(hours=self.cache_hours):
+            ttl = timedelta(hours=self._ttl_hours(ttl_hours))
+            if datetime.utcnow() - last_modified > ttl:
                 return None
 
-            return json.loads(response["Body"].read())
+            return _json_loads(response["Body"].read())
         except Exception as e:
             self.logger.debug(f"Failed to get S3 cache {key}: {e}")
             return None
@@ -180,7 +333,7 @@ class CacheManager:
             self.s3_client.put_object(
                 Bucket=self.config.s3_cache_bucket,
                 Key=f"cache/{key}.json",
-                Body=json.dumps(data, default=str),
+                Body=_json_dumps(data),
                 Metadata={"cached_at": datetime.utcnow().isoformat()},
             )
             self.logger.debug(f"Saved to S3 cache: {key}")
@@ -205,6 +358,7 @@ class CacheManager:
             if cache_path.exists():
                 try:
                     cache_path.unlink()
+                    self._record_ttl(cache_path.name, None)
                     cleared += 1
                 except Exception as e:
                     self.logger.error(f"Failed to clear local cache {key}: {e}")
@@ -238,12 +392,13 @@ class CacheManager:
 
         # Clear local cache
         if self.cache_dir.exists():
-            for cache_file in self.cache_dir.glob("*.pkl"):
+            for cache_file in self.cache_dir.glob("*.pkl*"):
                 try:
                     cache_file.unlink()
                     cleared += 1
                 except Exception as e:
                     self.logger.error(f"Failed to clear cache file {cache_file}: {e}")
+            (self.cache_dir / TTL_INDEX_FILE).unlink(missing_ok=True)
 
         self.logger.info(f"Cleared {cleared} cache entries")
         return cleared
@@ -265,14 +420,16 @@ class CacheManager:
 
         files = []
         total_size = 0
+        ttl_index = self._load_ttl_index()
 
-        for cache_file in self.cache_dir.glob("*.pkl"):
+        for cache_file in self.cache_dir.glob("*.pkl*"):
             try:
                 stat = cache_file.stat()
                 size_kb = stat.st_size / 1024
+                ttl_hours = self._ttl_hours(ttl_index.get(cache_file.name))
                 created = datetime.fromtimestamp(stat.st_mtime)
-                expires = created + timedelta(hours=self.cache_hours)
-                valid = self._is_cache_valid(cache_file)
+                expires = created + timedelta(hours=ttl_hours)
+                valid = self._is_cache_valid(cache_file, ttl_hours)
 
                 files.append(
                     {
@@ -280,6 +437,7 @@ class CacheManager:
                         "size_kb": f"{size_kb:.2f}",
                         "created": created.isoformat(),
                         "expires": expires.isoformat(),
+                        "ttl_hours": ttl_hours,
                         "valid": valid,
                     }
                 )
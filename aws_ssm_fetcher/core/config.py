@@ -1,13 +1,17 @@
 """Configuration management for AWS SSM Data Fetcher."""
 
 import os
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
-    """Configuration settings for AWS SSM Data Fetcher."""
+    """Configuration settings for AWS SSM Data Fetcher.
+
+    Instances are immutable so one config can be shared safely across worker
+    threads; use ``dataclasses.replace`` to derive a modified copy.
+    """
 
     # AWS Settings
     aws_region: str = "us-east-1"
@@ -17,6 +21,11 @@ class Config:
     cache_dir: str = ".cache"
     cache_hours: int = 24
     cache_enabled: bool = True
+    # Share the in-memory cache tier across CacheManager instances in this
+    # process, so a warm Lambda container serves repeat lookups from RAM
+    memory_cache_shared: bool = False
+    # Skip cache reads (fresh results are still written back)
+    cache_refresh: bool = False
 
     # Output Settings
     output_dir: str = "output"
@@ -24,6 +33,10 @@ class Config:
     # Performance Settings
     max_retries: int = 3
     max_workers: int = 10
+    ssm_rate_limit: float = 10.0  # SSM calls per second (0 disables pacing)
+
+    # Excel writer: "auto", "openpyxl" or "xlsxwriter"
+    excel_engine: str = "auto"
 
     # S3 Cache Settings (for Lambda)
     s3_cache_bucket: Optional[str] = None
@@ -37,44 +50,52 @@ class Config:
             cache_dir=os.getenv("CACHE_DIR", ".cache"),
             cache_hours=int(os.getenv("CACHE_HOURS", "24")),
             cache_enabled=os.getenv("CACHE_ENABLED", "true").lower() == "true",
+            cache_refresh=os.getenv("CACHE_REFRESH", "false").lower() == "true",
             output_dir=os.getenv("OUTPUT_DIR", "output"),
             max_retries=int(os.getenv("MAX_RETRIES", "3")),
             max_workers=int(os.getenv("MAX_WORKERS", "10")),
+            ssm_rate_limit=float(os.getenv("SSM_RATE_LIMIT", "10")),
+            excel_engine=os.getenv("EXCEL_ENGINE", "auto"),
             s3_cache_bucket=os.getenv("S3_CACHE_BUCKET"),
         )
 
     @classmethod
     def for_lambda(cls, function_type: str = "data_fetcher") -> "Config":
         """Create Lambda-optimized configuration."""
-        config = cls.from_env()
-
         # Lambda-specific overrides
-        config.cache_dir = "/tmp/cache"
-        config.output_dir = "/tmp/output"
+        overrides: Dict[str, Any] = {
+            "cache_dir": "/tmp/cache",
+            "output_dir": "/tmp/output",
+            "memory_cache_shared": True,
+        }
 
         # Function-specific optimizations
         if function_type == "data_fetcher":
-            config.max_workers = 20  # High concurrency for API calls
+            overrides["max_workers"] = 20  # High concurrency for API calls
         elif function_type == "processor":
-            config.max_workers = 10  # Moderate for processing
+            overrides["max_workers"] = 10  # Moderate for processing
         elif function_type == "report_generator":
-            config.max_workers = 5  # Lower for memory-intensive Excel generation
+            overrides["max_workers"] = 5  # Lower for memory-intensive Excel generation
 
-        return config
+        return replace(cls.from_env(), **overrides)
 
     @classmethod
     def from_args(cls, args) -> "Config":
         """Create config from command line arguments."""
-        config = cls.from_env()
+        overrides: Dict[str, Any] = {}
 
         # Override with CLI arguments if provided
         if hasattr(args, "cache_dir") and args.cache_dir:
-            config.cache_dir = args.cache_dir
+            overrides["cache_dir"] = args.cache_dir
         if hasattr(args, "cache_hours") and args.cache_hours:
-            config.cache_hours = args.cache_hours
+            overrides["cache_hours"] = args.cache_hours
         if hasattr(args, "output_dir") and args.output_dir:
-            config.output_dir = args.output_dir
+            overrides["output_dir"] = args.output_dir
         if hasattr(args, "no_cache") and args.no_cache:
-            config.cache_enabled = False
+            overrides["cache_enabled"] = False
+        if hasattr(args, "refresh") and args.refresh:
+            overrides["cache_refresh"] = True
+        if hasattr(args, "excel_engine") and args.excel_engine:
+            overrides["excel_engine"] = args.excel_engine
 
-        return config
+        return replace(cls.from_env(), **overrides)
@@ -2,13 +2,41 @@
 
 import functools
 import random
+import re
+import threading
 import time
-from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
+import requests
+from botocore.exceptions import BotoCoreError, ClientError
+
 from .logging import get_logger
 
+_rand = random.random
+
+# AWS error keywords by category, in classification precedence order, with
+# whether errors in that category should be retried
+_AWS_ERROR_CATEGORIES = (
+    ("throttling", True, ("throttling", "throttled", "rate exceeded")),
+    ("network", True, ("timeout", "connection", "network", "dns")),
+    ("service_unavailable", True, ("service unavailable", "503", "502", "504")),
+    ("authentication", False, ("access denied", "unauthorized", "401", "403")),
+    ("not_found", False, ("not found", "404", "does not exist")),
+    ("validation", False, ("validation", "invalid parameter", "bad request", "400")),
+)
+# Zero-width lookahead so keywords overlapping each other (e.g. "404" and
+# "403" in "40403") are all found; a consuming match would skip the second
+_AWS_ERROR_PATTERN = re.compile(
+    "(?=(?:"
+    + "|".join(
+        f"(?P<{category}>{'|'.join(map(re.escape, keywords))})"
+        for category, _, keywords in _AWS_ERROR_CATEGORIES
+    )
+    + "))",
+    re.IGNORECASE,
+)
+
 
 class RetryStrategy(Enum):
     """Retry strategy types."""
@@ -45,9 +73,77 @@ class CircuitBreakerOpenError(Exception):
     pass
 
 
+class RateLimiter:
+    """Thread-safe token bucket for pacing calls to a throttled API.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Callers that find the bucket empty reserve the next token and sleep
+    exactly until it becomes available, so a burst of concurrent callers is
+    spread evenly instead of tripping the service's throttling and retrying.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize rate limiter.
+
+        Args:
+            rate: Sustained calls per second (0 or less disables limiting)
+            capacity: Maximum burst size (defaults to ``rate``)
+        """
+        self._lock = threading.Lock()
+        self.set_rate(rate, capacity)
+
+    def set_rate(self, rate: float, capacity: Optional[float] = None):
+        """Reconfigure the bucket, starting it full.
+
+        Args:
+            rate: Sustained calls per second (0 or less disables limiting)
+            capacity: Maximum burst size (defaults to ``rate``)
+        """
+        with self._lock:
+            self.rate = rate
+            self.capacity = max(capacity if capacity is not None else rate, 1.0)
+            self._tokens = self.capacity
+            self._last_refill = time.monotonic()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last_refill) * self.rate
+            )
+            self._last_refill = now
+            # Reserve the token even if it has not refilled yet; the balance
+            # going negative queues later callers behind this one.
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
 class RetryConfig:
     """Configuration for retry behavior."""
 
+    __slots__ = (
+        "max_attempts",
+        "base_delay",
+        "max_delay",
+        "strategy",
+        "jitter_factor",
+        "rate_limiter",
+        "retryable_exceptions",
+        "non_retryable_exceptions",
+    )
+
     def __init__(
         self,
         max_attempts: int = 3,
@@ -57,6 +153,7 @@ class RetryConfig:
         retryable_exceptions: Optional[Tuple[Type[Exception], ...]] = None,
         non_retryable_exceptions: Optional[Tuple[Type[Exception], ...]] = None,
         jitter_factor: float = 0.1,
+        rate_limiter: Optional[RateLimiter] = None,
     ):
         """Initialize retry configuration.
 
@@ -68,18 +165,17 @@ class RetryConfig:
             retryable_exceptions: Exception types that should trigger retries
             non_retryable_exceptions: Exception types that should not be retried
             jitter_factor: Jitter factor for randomizing delays (0.0-1.0)
+            rate_limiter: Optional limiter consulted before every attempt
         """
         self.max_attempts = max_attempts
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.strategy = strategy
         self.jitter_factor = jitter_factor
+        self.rate_limiter = rate_limiter
 
         # Default retryable exceptions (network/service errors)
         if retryable_exceptions is None:
-            import requests
-            from botocore.exceptions import ClientError
-
             self.retryable_exceptions = (
                 requests.exceptions.RequestException,
                 requests.exceptions.Timeout,
@@ -107,6 +203,13 @@ class RetryConfig:
 class CircuitBreakerConfig:
     """Configuration for circuit breaker behavior."""
 
+    __slots__ = (
+        "failure_threshold",
+        "recovery_timeout",
+        "expected_exception",
+        "half_open_max_calls",
+    )
+
     def __init__(
         self,
         failure_threshold: int = 5,
@@ -131,6 +234,20 @@ class CircuitBreakerConfig:
 class CircuitBreaker:
     """Circuit breaker for preventing cascading failures."""
 
+    __slots__ = (
+        "config",
+        "logger",
+        "state",
+        "failure_count",
+        "last_failure_time",
+        "half_open_calls",
+        "total_calls",
+        "successful_calls",
+        "failed_calls",
+        "circuit_opens",
+        "_lock",
+    )
+
     def __init__(self, config: CircuitBreakerConfig):
         """Initialize circuit breaker.
 
@@ -138,12 +255,13 @@ class CircuitBreaker:
             config: Circuit breaker configuration
         """
         self.config = config
-        self.logger = get_logger(f"circuit_breaker")
+        self.logger = get_logger("circuit_breaker")
 
         # State tracking
         self.state = CircuitState.CLOSED
         self.failure_count = 0
-        self.last_failure_time: Optional[datetime] = None
+        # time.monotonic() of the last failure; immune to wall-clock changes
+        self.last_failure_time: Optional[float] = None
         self.half_open_calls = 0
 
         # Statistics
@@ -152,6 +270,10 @@ class CircuitBreaker:
         self.failed_calls = 0
         self.circuit_opens = 0
 
+        # Guards the counters and state transitions (never the call itself),
+        # since one breaker is shared by every thread calling the function
+        self._lock = threading.Lock()
+
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """Execute function with circuit breaker protection.
 
@@ -167,16 +289,17 @@ class CircuitBreaker:
             CircuitBreakerOpenError: If circuit is open
             Exception: Original exception from function
         """
-        self.total_calls += 1
-
-        if self.state == CircuitState.OPEN:
-            if self._should_attempt_reset():
-                self.logger.info("Circuit breaker: Attempting reset (HALF_OPEN)")
-                self.state = CircuitState.HALF_OPEN
-                self.half_open_calls = 0
-            else:
-                self.logger.warning("Circuit breaker: OPEN - failing fast")
-                raise CircuitBreakerOpenError("Circuit breaker is open")
+        with self._lock:
+            self.total_calls += 1
+
+            if self.state == CircuitState.OPEN:
+                if self._should_attempt_reset():
+                    self.logger.info("Circuit breaker: Attempting reset (HALF_OPEN)")
+                    self.state = CircuitState.HALF_OPEN
+                    self.half_open_calls = 0
+                else:
+                    self.logger.warning("Circuit breaker: OPEN - failing fast")
+                    raise CircuitBreakerOpenError("Circuit breaker is open")
 
         try:
             result = func(*args, **kwargs)
@@ -192,48 +315,56 @@ class CircuitBreaker:
         if self.last_failure_time is None:
             return True
 
-        time_since_failure = datetime.now() - self.last_failure_time
-        return time_since_failure.total_seconds() >= self.config.recovery_timeout
+        time_since_failure = time.monotonic() - self.last_failure_time
+        return time_since_failure >= self.config.recovery_timeout
 
     def _on_success(self):
         """Handle successful call."""
-        self.successful_calls += 1
-        self.failure_count = 0
+        with self._lock:
+            self.successful_calls += 1
+            self.failure_count = 0
 
-        if self.state == CircuitState.HALF_OPEN:
-            self.half_open_calls += 1
-            if self.half_open_calls >= self.config.half_open_max_calls:
-                self.logger.info("Circuit breaker: Recovery successful (CLOSED)")
-                self.state = CircuitState.CLOSED
-                self.half_open_calls = 0
+            if self.state == CircuitState.HALF_OPEN:
+                self.half_open_calls += 1
+                if self.half_open_calls >= self.config.half_open_max_calls:
+                    self.logger.info("Circuit breaker: Recovery successful (CLOSED)")
+                    self.state = CircuitState.CLOSED
+                    self.half_open_calls = 0
 
     def _on_failure(self):
         """Handle failed call."""
-        self.failed_calls += 1
-        self.failure_count += 1
-        self.last_failure_time = datetime.now()
-
-        if self.state == CircuitState.HALF_OPEN:
-            self.logger.warning("Circuit breaker: Half-open test failed (OPEN)")
-            self.state = CircuitState.OPEN
-            self.circuit_opens += 1
-        elif self.failure_count >= self.config.failure_threshold:
-            self.logger.warning(f"Circuit breaker: Failure threshold reached (OPEN)")
-            self.state = CircuitState.OPEN
-            self.circuit_opens += 1
+        with self._lock:
+            self.failed_calls += 1
+            self.failure_count += 1
+            self.last_failure_time = time.monotonic()
+
+            if self.state == CircuitState.HALF_OPEN:
+                self.logger.warning("Circuit breaker: Half-open test failed (OPEN)")
+                self.state = CircuitState.OPEN
+                self.circuit_opens += 1
+            elif (
+                # Calls already in flight when the circuit opened fail too;
+                # only the transition out of CLOSED counts as an opening
+                self.state == CircuitState.CLOSED
+                and self.failure_count >= self.config.failure_threshold
+            ):
+                self.logger.warning("Circuit breaker: Failure threshold reached (OPEN)")
+                self.state = CircuitState.OPEN
+                self.circuit_opens += 1
 
     def get_stats(self) -> Dict[str, Any]:
         """Get circuit breaker statistics."""
-        return {
-            "state": self.state.value,
-            "total_calls": self.total_calls,
-            "successful_calls": self.successful_calls,
-            "failed_calls": self.failed_calls,
-            "failure_count": self.failure_count,
-            "circuit_opens": self.circuit_opens,
-            "success_rate": self.successful_calls / max(self.total_calls, 1),
-            "failure_rate": self.failed_calls / max(self.total_calls, 1),
-        }
+        with self._lock:
+            return {
+                "state": self.state.value,
+                "total_calls": self.total_calls,
+                "successful_calls": self.successful_calls,
+                "failed_calls": self.failed_calls,
+                "failure_count": self.failure_count,
+                "circuit_opens": self.circuit_opens,
+                "success_rate": self.successful_calls / max(self.total_calls, 1),
+                "failure_rate": self.failed_calls / max(self.total_calls, 1),
+            }
 
 
 def with_retry(retry_config: Optional[RetryConfig] = None):
@@ -249,69 +380,51 @@ def with_retry(retry_config: Optional[RetryConfig] = None):
         retry_config = RetryConfig()
 
     def decorator(func: Callable) -> Callable:
+        logger = get_logger(f"retry.{func.__name__}")
+        rate_limiter = retry_config.rate_limiter
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            logger = get_logger(f"retry.{func.__name__}")
-
             for attempt in range(retry_config.max_attempts):
+                if rate_limiter is not None:
+                    rate_limiter.acquire()
                 try:
                     result = func(*args, **kwargs)
                     if attempt > 0:
-                        logger.info(f"Succeeded on attempt {attempt + 1}")
+                        logger.info("Succeeded on attempt %d", attempt + 1)
                     return result
 
                 except retry_config.non_retryable_exceptions as e:
-                    logger.error(f"Non-retryable error on attempt {attempt + 1}: {e}")
+                    logger.error(
+                        "Non-retryable error on attempt %d: %s", attempt + 1, e
+                    )
                     raise e
 
                 except retry_config.retryable_exceptions as e:
                     if attempt == retry_config.max_attempts - 1:
                         logger.error(
-                            f"All {retry_config.max_attempts} attempts failed. Last error: {e}"
+                            "All %d attempts failed. Last error: %s",
+                            retry_config.max_attempts,
+                            e,
                         )
                         raise e
 
                     # Calculate delay
-                    delay = _calculate_delay(
-                        attempt,
-                        retry_config.base_delay,
-                        retry_config.max_delay,
-                        retry_config.strategy,
-                        retry_config.jitter_factor,
-                    )
+                    delay = _calculate_delay(attempt, retry_config)
 
                     logger.warning(
-                        f"Attempt {attempt + 1} failed: {e}. Retrying in {delay:.2f}s..."
+                        "Attempt %d failed: %s. Retrying in %.2fs...",
+                        attempt + 1,
+                        e,
+                        delay,
                     )
                     time.sleep(delay)
 
                 except Exception as e:
-                    # Unknown exception - check if it should be retried
-                    if any(
-                        isinstance(e, exc_type)
-                        for exc_type in retry_config.retryable_exceptions
-                    ):
-                        if attempt == retry_config.max_attempts - 1:
-                            logger.error(
-                                f"All {retry_config.max_attempts} attempts failed. Last error: {e}"
-                            )
-                            raise e
-
-                        delay = _calculate_delay(
-                            attempt,
-                            retry_config.base_delay,
-                            retry_config.max_delay,
-                            retry_config.strategy,
-                            retry_config.jitter_factor,
-                        )
-
-                        logger.warning(
-                            f"Attempt {attempt + 1} failed: {e}. Retrying in {delay:.2f}s..."
-                        )
-                        time.sleep(delay)
-                    else:
-                        logger.error(f"Unknown error on attempt {attempt + 1}: {e}")
-                        raise e
+                    # Retryable types were matched by the clause above, so
+                    # anything reaching here is unknown and is not retried
+                    logger.error("Unknown error on attempt %d: %s", attempt + 1, e)
+                    raise e
 
             # This should never be reached
             raise RuntimeError("Retry logic error")
@@ -376,45 +489,35 @@ def with_retry_and_circuit_breaker(
     return decorator
 
 
-def _calculate_delay(
-    attempt: int,
-    base_delay: float,
-    max_delay: float,
-    strategy: RetryStrategy,
-    jitter_factor: float,
-) -> float:
+def _calculate_delay(attempt: int, retry_config: RetryConfig) -> float:
     """Calculate delay for retry attempt.
 
     Args:
         attempt: Attempt number (0-based)
-        base_delay: Base delay in seconds
-        max_delay: Maximum delay in seconds
-        strategy: Retry strategy
-        jitter_factor: Jitter factor for randomization
+        retry_config: Retry configuration providing strategy and delays
 
     Returns:
         Delay in seconds
     """
-    if strategy == RetryStrategy.FIXED_INTERVAL:
-        delay = base_delay
+    strategy = retry_config.strategy
 
-    elif strategy == RetryStrategy.LINEAR_BACKOFF:
-        delay = base_delay * (attempt + 1)
+    if strategy == RetryStrategy.EXPONENTIAL_BACKOFF_WITH_JITTER:
+        # Read from the config on each call, as its fields may be changed
+        delay = min(retry_config.base_delay * (1 << attempt), retry_config.max_delay)
+        # Add jitter to prevent thundering herd
+        delay += delay * retry_config.jitter_factor * _rand()
 
     elif strategy == RetryStrategy.EXPONENTIAL_BACKOFF:
-        delay = base_delay * (2**attempt)
+        delay = min(retry_config.base_delay * (1 << attempt), retry_config.max_delay)
 
-    elif strategy == RetryStrategy.EXPONENTIAL_BACKOFF_WITH_JITTER:
-        delay = base_delay * (2**attempt)
-        # Add jitter to prevent thundering herd
-        jitter = delay * jitter_factor * random.random()
-        delay += jitter
+    elif strategy == RetryStrategy.LINEAR_BACKOFF:
+        delay = retry_config.base_delay * (attempt + 1)
 
     else:
-        delay = base_delay
+        delay = retry_config.base_delay
 
     # Apply maximum delay limit
-    return min(delay, max_delay)
+    return min(delay, retry_config.max_delay)
 
 
 class ErrorHandler:
@@ -433,57 +536,26 @@ class ErrorHandler:
         Returns:
             Tuple of (should_retry: bool, error_category: str)
         """
-        error_str = str(error).lower()
-
-        # Throttling errors - always retry
-        if any(
-            keyword in error_str
-            for keyword in ["throttling", "throttled", "rate exceeded"]
-        ):
-            return True, "throttling"
-
-        # Network/connection errors - retry
-        if any(
-            keyword in error_str
-            for keyword in ["timeout", "connection", "network", "dns"]
-        ):
-            return True, "network"
-
-        # Service unavailable - retry
-        if any(
-            keyword in error_str
-            for keyword in ["service unavailable", "503", "502", "504"]
-        ):
-            return True, "service_unavailable"
-
-        # Authentication errors - don't retry
-        if any(
-            keyword in error_str
-            for keyword in ["access denied", "unauthorized", "401", "403"]
-        ):
-            return False, "authentication"
-
-        # Not found errors - don't retry
-        if any(
-            keyword in error_str for keyword in ["not found", "404", "does not exist"]
-        ):
-            return False, "not_found"
-
-        # Parameter validation errors - don't retry
-        if any(
-            keyword in error_str
-            for keyword in ["validation", "invalid parameter", "bad request", "400"]
-        ):
-            return False, "validation"
+        # One pass collects every category mentioned; the earliest category
+        # in precedence order wins, regardless of where it appears
+        found = {m.lastgroup for m in _AWS_ERROR_PATTERN.finditer(str(error))}
+        if found:
+            for category, should_retry, _ in _AWS_ERROR_CATEGORIES:
+                if category in found:
+                    return should_retry, category
 
         # Unknown errors - conservative approach, retry
         return True, "unknown"
 
-    def get_aws_retry_config(self) -> RetryConfig:
-        """Get AWS-optimized retry configuration."""
-        import requests
-        from botocore.exceptions import BotoCoreError, ClientError
+    def get_aws_retry_config(
+        self, rate_limiter: Optional[RateLimiter] = None
+    ) -> RetryConfig:
+        """Get AWS-optimized retry configuration.
 
+        Args:
+            rate_limiter: Limiter paced before every attempt, owned by the
+                caller (no pacing if None)
+        """
         return RetryConfig(
             max_attempts=5,  # More attempts for AWS operations
             base_delay=1.0,
@@ -506,6 +578,7 @@ class ErrorHandler:
                 MemoryError,
             ),
             jitter_factor=0.1,
+            rate_limiter=rate_limiter,
         )
 
     def get_aws_circuit_breaker_config(self) -> CircuitBreakerConfig:
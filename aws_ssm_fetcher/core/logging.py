@@ -6,14 +6,39 @@ and human-readable formatting for development. Features include performance timi
 error context preservation, and CloudWatch optimization.
 """
 
+import atexit
+import functools
 import json
 import logging
 import os
+import queue
 import sys
+import threading
 import time
 from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+except ImportError:  # Optional dependency - fall back to stdlib json
+    orjson = None
+
+
+# The process environment decides the output style; it cannot change later
+_IS_LAMBDA = bool(os.environ.get("AWS_LAMBDA_FUNCTION_NAME"))
+
+# Opt-in background log writer. Off by default: records written from the
+# listener thread would interleave with the CLI's own print() output.
+_ASYNC_LOGGING = os.environ.get("LOG_ASYNC", "false").lower() == "true"
+
+
+def _dumps_log(log_data: Dict[str, Any]) -> str:
+    """Serialize a structured log record, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(log_data, default=str).decode("utf-8")
+    return json.dumps(log_data, default=str)
+
 
 class StructuredFormatter(logging.Formatter):
     """
@@ -23,23 +48,38 @@ class StructuredFormatter(logging.Formatter):
     def __init__(self, include_extra: bool = True):
         super().__init__()
         self.include_extra = include_extra
-        self.is_lambda = bool(os.environ.get("AWS_LAMBDA_FUNCTION_NAME"))
-
-    def format(self, record: logging.LogRecord) -> str:
-        if self.is_lambda:
-            return self._format_json(record)
-        else:
-            return self._format_human(record)
+        self.is_lambda = _IS_LAMBDA
+        # (second, formatted timestamp) of the last record formatted
+        self._last_timestamp = (-1, "")
+
+        # The output style is fixed for the life of the process, so pick the
+        # formatter once instead of branching on every record
+        self.format = (  # type: ignore[method-assign]
+            self._format_json if self.is_lambda else self._format_human
+        )
+
+    def _second_timestamp(self, record: logging.LogRecord) -> str:
+        """Return the record time as ``%Y-%m-%d %H:%M:%S``.
+
+        Records logged within the same second reuse the last string instead
+        of re-running strftime.
+        """
+        second = int(record.created)
+        cached_second, timestamp = self._last_timestamp
+        if second != cached_second:
+            timestamp = time.strftime(self.default_time_format, self.converter(second))
+            self._last_timestamp = (second, timestamp)
+        return timestamp
 
     def _format_json(self, record: logging.LogRecord) -> str:
         """Format log record as JSON for CloudWatch."""
         log_data = {
-            "timestamp": self.formatTime(record, self.datefmt),
+            # Same text as formatTime() without a datefmt, minus the strftime
+            "timestamp": self.default_msec_format
+            % (self._second_timestamp(record), record.msecs),
             "level": record.levelname,
             "message": record.getMessage(),
             "logger": record.name,
-            "function": record.funcName,
-            "line": record.lineno,
         }
 
         # Add extra fields if available
@@ -50,18 +90,19 @@ class StructuredFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data, default=str)
+        return _dumps_log(log_data)
 
     def _format_human(self, record: logging.LogRecord) -> str:
         """Format log record for human readability in development."""
-        timestamp = self.formatTime(record, "%Y-%m-%d %H:%M:%S")
+        timestamp = self._second_timestamp(record)
         message = record.getMessage()
 
         # Add extra context if available
-        if self.include_extra and hasattr(record, "extra_data"):
-            extra_parts = [f"{k}={v}" for k, v in record.extra_data.items()]
-            if extra_parts:
-                message += f" [{', '.join(extra_parts)}]"
+        extra_data = getattr(record, "extra_data", None) if self.include_extra else None
+        if extra_data:
+            message += (
+                " [" + ", ".join([f"{k}={v}" for k, v in extra_data.items()]) + "]"
+            )
 
         formatted = f"{timestamp} - {record.levelname:8} - {message}"
 
@@ -71,15 +112,57 @@ class StructuredFormatter(logging.Formatter):
         return formatted
 
 
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread.
+
+    The stock prepare() formats the record in the caller's thread and strips
+    exc_info, which would lose the structured exception output. Records stay
+    in-process here, so only the %-args are resolved up front (in case the
+    caller mutates them) and the record is otherwise passed through.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = ()
+        return record
+
+
+_queue_handler: Optional[QueueHandler] = None
+_queue_handler_lock = threading.Lock()
+
+
+def _get_queue_handler() -> QueueHandler:
+    """Return the handler feeding the shared background stdout writer.
+
+    With LOG_ASYNC=true, every SSMLogger outside Lambda logs through this one
+    queue, so callers never block on stdout. The listener is stopped,
+    draining the queue, at interpreter exit.
+    """
+    global _queue_handler
+    with _queue_handler_lock:
+        if _queue_handler is None:
+            log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+            stream_handler = logging.StreamHandler(sys.stdout)
+            stream_handler.setFormatter(StructuredFormatter())
+            listener = QueueListener(log_queue, stream_handler)
+            listener.start()
+            atexit.register(listener.stop)
+            _queue_handler = _DeferredQueueHandler(log_queue)
+        return _queue_handler
+
+
 class SSMLogger:
     """
     Enhanced logger for AWS SSM data fetching with performance tracking and context.
     """
 
+    __slots__ = ("logger", "_timers")
+
     def __init__(self, name: str = "aws_ssm_fetcher", level: Optional[str] = None):
         self.logger = logging.getLogger(name)
         self._setup_logger(level)
-        self._timers: Dict[str, float] = {}
+        # Operation name -> time.monotonic_ns() at start
+        self._timers: Dict[str, int] = {}
 
     def _setup_logger(self, level: Optional[str] = None):
         """Configure logger with appropriate formatter and level."""
@@ -87,73 +170,106 @@ class SSMLogger:
             return  # Already configured
 
         # Determine log level
-        if level:
-            log_level = getattr(logging, level.upper())
-        elif os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
-            log_level = logging.INFO
-        else:
-            log_level = logging.INFO
+        log_level = getattr(logging, level.upper()) if level else logging.INFO
 
         self.logger.setLevel(log_level)
 
-        # Create handler
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(StructuredFormatter())
+        # Create handler. Lambda always writes synchronously: a frozen
+        # container would strand records still waiting in a background queue.
+        if _ASYNC_LOGGING and not _IS_LAMBDA:
+            handler = _get_queue_handler()
+        else:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(StructuredFormatter())
         self.logger.addHandler(handler)
 
         # Prevent duplicate logs in Lambda
         self.logger.propagate = False
 
-    def info(self, message: str, **extra):
+    # Each level method checks isEnabledFor (cached by the stdlib per level)
+    # before doing anything else, so disabled calls return immediately
+    def info(self, message: str, *args, **extra):
         """Log info message with optional extra context."""
-        self._log_with_extra(logging.INFO, message, extra)
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log_with_extra(logging.INFO, message, extra, args=args)
 
-    def debug(self, message: str, **extra):
+    def debug(self, message: str, *args, **extra):
         """Log debug message with optional extra context."""
-        self._log_with_extra(logging.DEBUG, message, extra)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log_with_extra(logging.DEBUG, message, extra, args=args)
 
-    def warning(self, message: str, **extra):
+    def warning(self, message: str, *args, **extra):
         """Log warning message with optional extra context."""
-        self._log_with_extra(logging.WARNING, message, extra)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._log_with_extra(logging.WARNING, message, extra, args=args)
 
-    def error(self, message: str, exc_info: bool = False, **extra):
+    def error(self, message: str, *args, exc_info: bool = False, **extra):
         """Log error message with optional exception info and extra context."""
-        self._log_with_extra(logging.ERROR, message, extra, exc_info=exc_info)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._log_with_extra(
+                logging.ERROR, message, extra, exc_info=exc_info, args=args
+            )
 
-    def critical(self, message: str, exc_info: bool = False, **extra):
+    def critical(self, message: str, *args, exc_info: bool = False, **extra):
         """Log critical message with optional exception info and extra context."""
-        self._log_with_extra(logging.CRITICAL, message, extra, exc_info=exc_info)
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self._log_with_extra(
+                logging.CRITICAL, message, extra, exc_info=exc_info, args=args
+            )
+
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether messages at ``level`` would be emitted."""
+        return self.logger.isEnabledFor(level)
 
     def _log_with_extra(
-        self, level: int, message: str, extra: Dict[str, Any], exc_info: bool = False
+        self,
+        level: int,
+        message: str,
+        extra: Dict[str, Any],
+        exc_info: bool = False,
+        args: tuple = (),
     ):
-        """Internal method to log with extra context data."""
+        """Internal method to log with extra context data.
+
+        Callers check the level first. ``args`` are %-formatted into
+        ``message`` only when a handler formats the record.
+        """
+        # Build the record directly: makeRecord/Logger.log would also walk the
+        # stack for a caller, which is always this wrapper and so never useful
+        record = logging.LogRecord(
+            self.logger.name,
+            level,
+            "",
+            0,
+            message,
+            args,
+            sys.exc_info() if exc_info else None,
+        )
         if extra:
-            # Create a custom LogRecord with extra data
-            exc_info_tuple = sys.exc_info() if exc_info else None
-            record = self.logger.makeRecord(
-                self.logger.name, level, "", 0, message, (), exc_info_tuple
-            )
             record.extra_data = extra
-            self.logger.handle(record)
-        else:
-            self.logger.log(level, message, exc_info=exc_info)
+        self.logger.handle(record)
 
     @contextmanager
     def timer(self, operation: str):
         """Context manager for timing operations."""
-        start_time = time.time()
-        self.info(f"Starting {operation}")
+        start_ns = time.monotonic_ns()
+        self.info("Starting %s", operation)
 
         try:
             yield
-            duration = time.time() - start_time
-            self.info(f"Completed {operation}", duration_seconds=f"{duration:.2f}")
+            if self.logger.isEnabledFor(logging.INFO):
+                duration_ns = time.monotonic_ns() - start_ns
+                self.info(
+                    "Completed %s",
+                    operation,
+                    duration_seconds=f"{duration_ns / 1e9:.2f}",
+                )
         except Exception as e:
-            duration = time.time() - start_time
+            duration_ns = time.monotonic_ns() - start_ns
             self.error(
-                f"Failed {operation}",
-                duration_seconds=f"{duration:.2f}",
+                "Failed %s",
+                operation,
+                duration_seconds=f"{duration_ns / 1e9:.2f}",
                 error=str(e),
                 exc_info=True,
             )
@@ -161,17 +277,20 @@ class SSMLogger:
 
     def start_timer(self, operation: str):
         """Start a named timer for an operation."""
-        self._timers[operation] = time.time()
-        self.info(f"Starting {operation}")
+        self._timers[operation] = time.monotonic_ns()
+        self.info("Starting %s", operation)
 
     def end_timer(self, operation: str, **extra):
         """End a named timer and log the duration."""
         if operation not in self._timers:
-            self.warning(f"Timer '{operation}' was not started")
+            self.warning("Timer '%s' was not started", operation)
             return
 
-        duration = time.time() - self._timers.pop(operation)
-        self.info(f"Completed {operation}", duration_seconds=f"{duration:.2f}", **extra)
+        duration = (time.monotonic_ns() - self._timers.pop(operation)) / 1e9
+        if self.logger.isEnabledFor(logging.INFO):
+            self.info(
+                "Completed %s", operation, duration_seconds=f"{duration:.2f}", **extra
+            )
         return duration
 
 
@@ -188,10 +307,14 @@ def setup_logging(level: str = "INFO") -> SSMLogger:
     return SSMLogger(level=level)
 
 
+@functools.lru_cache(maxsize=128)
 def get_logger(name: str = "aws_ssm_fetcher") -> SSMLogger:
     """
     Get a logger instance.
 
+    Loggers are memoized by name, so repeated calls (e.g. one per client or
+    decorated function) share a single SSMLogger.
+
     Args:
         name: Logger name
 
@@ -214,26 +337,26 @@ def get_default_logger() -> SSMLogger:
 
 
 # Convenience functions that use the default logger
-def info(message: str, **extra):
+def info(message: str, *args, **extra):
     """Log info message using default logger."""
-    get_default_logger().info(message, **extra)
+    get_default_logger().info(message, *args, **extra)
 
 
-def debug(message: str, **extra):
+def debug(message: str, *args, **extra):
     """Log debug message using default logger."""
-    get_default_logger().debug(message, **extra)
+    get_default_logger().debug(message, *args, **extra)
 
 
-def warning(message: str, **extra):
+def warning(message: str, *args, **extra):
     """Log warning message using default logger."""
-    get_default_logger().warning(message, **extra)
+    get_default_logger().warning(message, *args, **extra)
 
 
-def error(message: str, exc_info: bool = False, **extra):
+def error(message: str, *args, exc_info: bool = False, **extra):
     """Log error message using default logger."""
-    get_default_logger().error(message, exc_info=exc_info, **extra)
+    get_default_logger().error(message, *args, exc_info=exc_info, **extra)
 
 
-def critical(message: str, exc_info: bool = False, **extra):
+def critical(message: str, *args, exc_info: bool = False, **extra):
     """Log critical message using default logger."""
-    get_default_logger().critical(message, exc_info=exc_info, **extra)
+    get_default_logger().critical(message, *args, exc_info=exc_info, **extra)
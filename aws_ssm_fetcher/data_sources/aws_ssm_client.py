@@ -1,22 +1,56 @@
 """AWS SSM Parameter Store client for fetching service and region data."""
 
+import hashlib
+import json
 import logging
 import re
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union, cast
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from importlib import resources
+from itertools import islice
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import boto3
-from botocore.exceptions import ClientError
+from botocore.config import Config as BotoConfig
+from botocore.exceptions import BotoCoreError, ClientError
 
 from ..core.error_handling import (
     ErrorHandler,
     NonRetryableError,
+    RateLimiter,
     RetryableError,
     with_retry_and_circuit_breaker,
 )
 from ..core.logging import get_logger
 from .base import AWSDataSource
 
+# Parameter-path patterns used in the discovery loops over full SSM subtrees
+_REGION_PATH_RE = re.compile(r"/regions/([^/]+)")
+_REGION_FROM_SERVICE_RE = re.compile(r"/services/[^/]+/regions/([^/]+)")
+_SERVICE_PATH_RE = re.compile(r"/services/([^/]+)")
+
+# Known AZ counts for established regions, used when SSM has no AZ data for
+# a region. Kept in a package data file so it can be updated without code
+# changes.
+_COMMON_AZ_COUNTS: Dict[str, int] = json.loads(
+    resources.files(__package__)
+    .joinpath("_az_fallbacks.json")
+    .read_text(encoding="utf-8")
+)["common_az_counts"]
+
 
 class AWSSSMClient(AWSDataSource):
     """Enhanced client for fetching data from AWS Systems Manager Parameter Store.
@@ -29,6 +63,38 @@ class AWSSSMClient(AWSDataSource):
     - Intelligent caching and retry logic
     """
 
+    # Global-infrastructure data changes on the order of weeks, so most keys
+    # outlive the configured cache_hours; keys not listed use that default
+    CACHE_TTL_HOURS: Dict[str, float] = {
+        "discovered_regions": 7 * 24,
+        "discovered_regions_enhanced": 7 * 24,
+        "discovered_services": 7 * 24,
+        "discovered_services_enhanced": 7 * 24,
+        "region_names": 30 * 24,
+        "service_names": 30 * 24,
+        "availability_zones": 24,
+        "region_services_mapping": 24,
+    }
+
+    __slots__ = (
+        "region",
+        "max_retries",
+        "base_delay",
+        "max_workers",
+        "_boto_config",
+        "logger",
+        "_client",
+        "_client_lock",
+        "_trees",
+        "_memo",
+        "_rate_limiter",
+        "_error_handler",
+        "_retry_config",
+        "_circuit_config",
+        "_discover_regions_with_reliability",
+        "_discover_services_with_reliability",
+    )
+
     def __init__(
         self,
         aws_session=None,
@@ -36,6 +102,9 @@ class AWSSSMClient(AWSDataSource):
         region="us-east-1",
         max_retries=3,
         base_delay=1.0,
+        max_workers=16,
+        boto_config=None,
+        rate_limiter=None,
     ):
         """Initialize enhanced SSM client.
 
@@ -45,29 +114,151 @@ class AWSSSMClient(AWSDataSource):
             region: AWS region for SSM client operations
             max_retries: Maximum retry attempts for failed API calls
             base_delay: Base delay for exponential backoff (seconds)
+            max_workers: Thread pool size for per-service SSM fan-out
+            boto_config: Optional botocore Config for the SSM client; defaults
+                to adaptive retries with keep-alive and a pool sized for
+                max_workers
+            rate_limiter: Optional RateLimiter pacing this client's SSM
+                requests; defaults to a limiter of its own at 10 calls/second
         """
         super().__init__(aws_session, cache_manager)
         self.region = region
         self.max_retries = max_retries
         self.base_delay = base_delay
+        self.max_workers = max_workers
+        self._boto_config = boto_config or BotoConfig(
+            retries={"mode": "adaptive", "max_attempts": 10},
+            max_pool_connections=max(10, max_workers),
+            tcp_keepalive=True,
+        )
         self.logger = get_logger(f"ssm_client.{region}")
         self._client = None
+        self._client_lock = threading.Lock()
+        self._trees: Dict[str, Dict[str, str]] = {}
+        # Results already produced by this client, keyed like the cache, and
+        # reused for the rest of the process even when the cache manager is
+        # disabled or in refresh mode
+        self._memo: Dict[str, Any] = {}
+
+        self._rate_limiter = rate_limiter or RateLimiter(rate=10.0)
 
         # Initialize error handler for enhanced retry logic
         self._error_handler = ErrorHandler()
-        self._retry_config = self._error_handler.get_aws_retry_config()
+        self._retry_config = self._error_handler.get_aws_retry_config(
+            rate_limiter=self._rate_limiter
+        )
         self._circuit_config = self._error_handler.get_aws_circuit_breaker_config()
 
+        # Decorate discovery with this client's retry and circuit breaker
+        self._discover_regions_with_reliability = with_retry_and_circuit_breaker(
+            self._retry_config, self._circuit_config
+        )(self._discover_regions)
+        self._discover_services_with_reliability = with_retry_and_circuit_breaker(
+            self._retry_config, self._circuit_config
+        )(self._discover_services)
+
     def get_client(self):
-        """Get SSM client with connection reuse."""
-        if self._client is None:
+        """Get SSM client with connection reuse.
+
+        The client is built once from the botocore config (adaptive retries,
+        TCP keep-alive and a connection pool sized for the worker threads
+        that share it), so TLS connections are reused across calls.
+        Creation is locked so pool workers racing on first use still build a
+        single client.
+        """
+        if self._client is not None:
+            return self._client
+
+        with self._client_lock:
+            if self._client is not None:
+                return self._client
+
             if self.aws_session:
-                self._client = self.aws_session.client("ssm", region_name=self.region)
+                self._client = self.aws_session.client(
+                    "ssm", region_name=self.region, config=self._boto_config
+                )
             else:
-                self._client = boto3.client("ssm", region_name=self.region)
+                self._client = boto3.client(
+                    "ssm", region_name=self.region, config=self._boto_config
+                )
             self.logger.info(f"Initialized SSM client for region: {self.region}")
         return self._client
 
+    @staticmethod
+    def _scoped_key(
+        cache_key: str, scope: Optional[Tuple[Sequence[str], ...]] = None
+    ) -> str:
+        """Append a digest of the codes a result was computed for to its key.
+
+        Lookups that take region or service lists cache one entry per code
+        set, so a later call with other codes never gets an earlier answer.
+        """
+        if scope is None:
+            return cache_key
+        codes = "\n".join(",".join(sorted(set(codes))) for codes in scope)
+        return f"{cache_key}_{hashlib.sha1(codes.encode('utf-8')).hexdigest()[:16]}"
+
+    def get_cached_data(
+        self,
+        cache_key: str,
+        ttl_hours: Optional[float] = None,
+        scope: Optional[Tuple[Sequence[str], ...]] = None,
+    ) -> Optional[Any]:
+        """Get cached SSM data, scoped to this client's region and key TTL.
+
+        Args:
+            cache_key: Key to look up (its TTL comes from CACHE_TTL_HOURS)
+            ttl_hours: TTL override for this lookup
+            scope: Code lists the result depends on, if any
+        """
+        key = self._scoped_key(cache_key, scope)
+        if key in self._memo:
+            return self._memo[key]
+        if ttl_hours is None:
+            ttl_hours = self.CACHE_TTL_HOURS.get(cache_key)
+        data = super().get_cached_data(f"ssm_{self.region}_{key}", ttl_hours)
+        if data is not None:
+            self._memo[key] = data
+        return data
+
+    def _paced(
+        self, pages: Iterable[Dict[str, Any]], first_token: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield pages, taking a rate-limiter token before each page request.
+
+        Args:
+            pages: Page iterator from an SSM paginator
+            first_token: Whether to take the first page's token here; False
+                when the retry wrapper already took it for this attempt
+        """
+        if first_token:
+            self._rate_limiter.acquire()
+        for page in pages:
+            yield page
+            if page.get("NextToken"):
+                self._rate_limiter.acquire()
+
+    def cache_data(
+        self,
+        cache_key: str,
+        data: Any,
+        ttl_hours: Optional[float] = None,
+        scope: Optional[Tuple[Sequence[str], ...]] = None,
+    ) -> bool:
+        """Cache SSM data, scoped to this client's region and key TTL.
+
+        Args:
+            cache_key: Key to store under (its TTL comes from CACHE_TTL_HOURS)
+            data: Data to cache
+            ttl_hours: TTL override for this entry
+            scope: Code lists the result depends on, if any
+        """
+        key = self._scoped_key(cache_key, scope)
+        self._memo[key] = data
+        if ttl_hours is None:
+            ttl_hours = self.CACHE_TTL_HOURS.get(cache_key)
+        return super().cache_data(f"ssm_{self.region}_{key}", data, ttl_hours)
+
     def fetch_data(self, **kwargs: Any) -> Any:
         """Fetch data based on type.
 
@@ -97,13 +288,16 @@ class AWSSSMClient(AWSDataSource):
         self.logger.error(f"Unknown data type: {data_type}")
         return None
 
-    @with_retry_and_circuit_breaker()
     def discover_regions(self) -> List[str]:
         """Discover all AWS regions from SSM parameters.
 
         Returns:
             List of region codes
         """
+        return cast(List[str], self._discover_regions_with_reliability())
+
+    def _discover_regions(self) -> List[str]:
+        """Discover regions; wrapped with retries in __init__."""
         cache_key = "discovered_regions"
 
         # Try cache first
@@ -116,7 +310,7 @@ class AWSSSMClient(AWSDataSource):
 
         try:
             ssm = self.get_client()
-            regions = []
+            regions = set()
 
             paginator = ssm.get_paginator("get_parameters_by_path")
             page_iterator = paginator.paginate(
@@ -125,24 +319,24 @@ class AWSSSMClient(AWSDataSource):
                 MaxResults=10,
             )
 
-            for page in page_iterator:
+            # with_retry already took this attempt's first token
+            for page in self._paced(page_iterator, first_token=False):
                 for param in page["Parameters"]:
                     region_code = param["Value"]
-                    if region_code and region_code not in regions:
-                        regions.append(region_code)
-
-                # Throttling protection
-                time.sleep(0.1)
+                    if region_code:
+                        regions.add(region_code)
 
-            regions.sort()
-            self.logger.info(f"Successfully discovered {len(regions)} regions from SSM")
+            discovered_regions = sorted(regions)
+            self.logger.info(
+                f"Successfully discovered {len(discovered_regions)} regions from SSM"
+            )
 
             # Cache the results
-            self.cache_data(cache_key, regions)
+            self.cache_data(cache_key, discovered_regions)
 
-            return regions
+            return discovered_regions
 
-        except Exception as e:
+        except (ClientError, BotoCoreError) as e:
             # Classify error for appropriate handling
             should_retry, error_category = self._error_handler.classify_aws_error(e)
             self.logger.error(
@@ -156,13 +350,16 @@ class AWSSSMClient(AWSDataSource):
                 self.logger.warning("Non-retryable error, returning empty list")
                 return []
 
-    @with_retry_and_circuit_breaker()
     def discover_services(self) -> List[str]:
         """Discover all AWS services from SSM parameters.
 
         Returns:
             List of service codes
         """
+        return cast(List[str], self._discover_services_with_reliability())
+
+    def _discover_services(self) -> List[str]:
+        """Discover services; wrapped with retries in __init__."""
         cache_key = "discovered_services"
 
         # Try cache first
@@ -175,7 +372,7 @@ class AWSSSMClient(AWSDataSource):
 
         try:
             ssm = self.get_client()
-            services = []
+            services = set()
 
             paginator = ssm.get_paginator("get_parameters_by_path")
             page_iterator = paginator.paginate(
@@ -184,32 +381,30 @@ class AWSSSMClient(AWSDataSource):
                 MaxResults=10,
             )
 
-            total_processed = 0
-            for page in page_iterator:
+            next_progress = 50
+            # with_retry already took this attempt's first token
+            for page in self._paced(page_iterator, first_token=False):
                 for param in page["Parameters"]:
                     service_code = param["Value"]
-                    if service_code and service_code not in services:
-                        services.append(service_code)
-                        total_processed += 1
-
-                # Log progress
-                if total_processed % 50 == 0:
-                    self.logger.info(f"Processed {total_processed} services...")
+                    if service_code:
+                        services.add(service_code)
 
-                # Throttling protection
-                time.sleep(0.1)
+                # Log progress every 50 unique services
+                if len(services) >= next_progress:
+                    self.logger.info(f"Processed {len(services)} services...")
+                    next_progress = len(services) // 50 * 50 + 50
 
-            services.sort()
+            discovered_services = sorted(services)
             self.logger.info(
-                f"Successfully discovered {len(services)} services from SSM"
+                f"Successfully discovered {len(discovered_services)} services from SSM"
             )
 
             # Cache the results
-            self.cache_data(cache_key, services)
+            self.cache_data(cache_key, discovered_services)
 
-            return services
+            return discovered_services
 
-        except Exception as e:
+        except (ClientError, BotoCoreError) as e:
             # Classify error for appropriate handling
             should_retry, error_category = self._error_handler.classify_aws_error(e)
             self.logger.error(
@@ -246,7 +441,7 @@ class AWSSSMClient(AWSDataSource):
             )
 
             regions = []
-            for page in page_iterator:
+            for page in self._paced(page_iterator):
                 for param in page["Parameters"]:
                     region_code = param["Value"]
                     if region_code:
@@ -254,7 +449,7 @@ class AWSSSMClient(AWSDataSource):
 
             return sorted(regions)
 
-        except Exception as e:
+        except (ClientError, BotoCoreError) as e:
             self.logger.warning(
                 f"Failed to get regions for service {service_code}: {e}"
             )
@@ -270,37 +465,37 @@ class AWSSSMClient(AWSDataSource):
             Dictionary mapping region codes to display names
         """
         cache_key = "region_names"
+        scope = (regions,)
 
-        # Try cache first
-        cached_data = self.get_cached_data(cache_key)
+        # Try cache first; entries are per requested code set
+        cached_data = self.get_cached_data(cache_key, scope=scope)
         if cached_data is not None:
             self.logger.info("Using cached region names")
             return cast(Dict[str, str], cached_data)
 
         self.logger.info("Fetching region display names...")
 
-        region_names = {}
-        ssm = self.get_client()
-
-        for region_code in regions:
-            try:
-                param_name = (
-                    f"/aws/service/global-infrastructure/regions/{region_code}/longName"
-                )
-                response = ssm.get_parameter(Name=param_name)
-                region_names[region_code] = response["Parameter"]["Value"]
-
-            except Exception as e:
-                self.logger.warning(f"Failed to get name for region {region_code}: {e}")
-                region_names[region_code] = region_code  # Fallback to code
-
-            # Small delay to avoid throttling
-            time.sleep(0.05)
+        # Resolve names with batched GetParameters calls (10 per request)
+        # instead of one GetParameter call per region.
+        paths = {
+            region_code: (
+                f"/aws/service/global-infrastructure/regions/{region_code}/longName"
+            )
+            for region_code in regions
+        }
+        values = self.get_parameters_batch(list(paths.values()))
+        region_names = {
+            region_code: values.get(path) or region_code  # Fallback to code
+            for region_code, path in paths.items()
+        }
 
         self.logger.info(f"Successfully fetched names for {len(region_names)} regions")
 
-        # Cache the results
-        self.cache_data(cache_key, region_names)
+        # Cache the results, unless a failed batch left codes as fallbacks
+        if len(values) == len(paths):
+            self.cache_data(cache_key, region_names, scope=scope)
+        else:
+            self.logger.warning("Some region name batches failed; not caching names")
 
         return region_names
 
@@ -314,39 +509,39 @@ class AWSSSMClient(AWSDataSource):
             Dictionary mapping service codes to display names
         """
         cache_key = "service_names"
+        scope = (services,)
 
-        # Try cache first
-        cached_data = self.get_cached_data(cache_key)
+        # Try cache first; entries are per requested code set
+        cached_data = self.get_cached_data(cache_key, scope=scope)
         if cached_data is not None:
             self.logger.info("Using cached service names")
             return cast(Dict[str, str], cached_data)
 
         self.logger.info("Fetching service display names...")
 
-        service_names = {}
-        ssm = self.get_client()
-
-        for service_code in services:
-            try:
-                param_name = f"/aws/service/global-infrastructure/services/{service_code}/longName"
-                response = ssm.get_parameter(Name=param_name)
-                service_names[service_code] = response["Parameter"]["Value"]
-
-            except Exception as e:
-                self.logger.warning(
-                    f"Failed to get name for service {service_code}: {e}"
-                )
-                service_names[service_code] = service_code  # Fallback to code
-
-            # Small delay to avoid throttling
-            time.sleep(0.05)
+        # Resolve names with batched GetParameters calls (10 per request)
+        # instead of one GetParameter call per service.
+        paths = {
+            service_code: (
+                f"/aws/service/global-infrastructure/services/{service_code}/longName"
+            )
+            for service_code in services
+        }
+        values = self.get_parameters_batch(list(paths.values()))
+        service_names = {
+            service_code: values.get(path) or service_code  # Fallback to code
+            for service_code, path in paths.items()
+        }
 
         self.logger.info(
             f"Successfully fetched names for {len(service_names)} services"
         )
 
-        # Cache the results
-        self.cache_data(cache_key, service_names)
+        # Cache the results, unless a failed batch left codes as fallbacks
+        if len(values) == len(paths):
+            self.cache_data(cache_key, service_names, scope=scope)
+        else:
+            self.logger.warning("Some service name batches failed; not caching names")
 
         return service_names
 
@@ -365,9 +560,10 @@ class AWSSSMClient(AWSDataSource):
         """
         try:
             ssm = self.get_client()
+            self._rate_limiter.acquire()
             response = ssm.get_parameter(Name=parameter_path)
             return cast(str, response["Parameter"]["Value"])
-        except ClientError as e:
+        except (ClientError, BotoCoreError) as e:
             self.logger.warning(f"Failed to get parameter {parameter_path}: {e}")
             return None
 
@@ -380,7 +576,8 @@ class AWSSSMClient(AWSDataSource):
             parameter_paths: List of SSM parameter paths
 
         Returns:
-            Dictionary mapping parameter paths to values (None for failed)
+            Dictionary mapping parameter paths to values (None for parameters
+            SSM reports as invalid); paths in a failed batch are left out
         """
         results = {}
         ssm = self.get_client()
@@ -389,6 +586,7 @@ class AWSSSMClient(AWSDataSource):
         for i in range(0, len(parameter_paths), 10):
             batch = parameter_paths[i : i + 10]
             try:
+                self._rate_limiter.acquire()
                 response = ssm.get_parameters(Names=batch)
 
                 # Process successful parameters
@@ -400,58 +598,45 @@ class AWSSSMClient(AWSDataSource):
                     self.logger.warning(f"Invalid parameter: {invalid}")
                     results[invalid] = None
 
-            except ClientError as e:
+            except (ClientError, BotoCoreError) as e:
                 self.logger.error(f"Batch parameter request failed: {e}")
-                for path in batch:
-                    results[path] = None
 
         return results
 
-    def fetch_all_ssm_parameters_by_path(self, parameter_path: str) -> List[str]:
-        """Fetch all SSM parameters using get_parameters_by_path with pagination and throttling protection.
+    def _iter_ssm_parameters_by_path(self, base_path: str) -> Iterator[Tuple[str, str]]:
+        """Yield (name, value) for every parameter under a path as pages arrive.
+
+        A throttled pagination resumes from the last complete page's
+        NextToken after backing off, so nothing is yielded twice. Other
+        errors propagate to the caller.
 
         Args:
-            parameter_path: Base path to fetch parameters from
+            base_path: Base path to fetch parameters from
 
-        Returns:
-            List of parameter names found at the path
+        Yields:
+            Parameter name and value pairs
         """
-        self.logger.info(f"Fetching all SSM parameters by path: {parameter_path}")
-
-        all_parameters = []
-        retry_count = 0
         ssm = self.get_client()
+        retry_count = 0
+        next_token = None
 
-        while retry_count <= self.max_retries:
+        while True:
             try:
                 paginator = ssm.get_paginator("get_parameters_by_path")
                 page_iterator = paginator.paginate(
-                    Path=parameter_path,
+                    Path=base_path,
                     Recursive=True,
-                    MaxResults=10,  # Reduced to minimize throttling
+                    MaxResults=10,  # API maximum for get_parameters_by_path
+                    PaginationConfig=(
+                        {"StartingToken": next_token} if next_token else {}
+                    ),
                 )
 
-                total_params = 0
-                page_count = 0
-                for page in page_iterator:
+                for page in self._paced(page_iterator):
                     for param in page["Parameters"]:
-                        all_parameters.append(param["Name"])
-                        total_params += 1
-
-                    page_count += 1
-
-                    # Add delay between pages to avoid throttling
-                    if page_count % 5 == 0:  # Every 5 pages
-                        time.sleep(0.5)
-
-                    # Log progress every 50 parameters
-                    if total_params % 50 == 0:
-                        self.logger.info(f"Processed {total_params} parameters...")
-
-                self.logger.info(
-                    f"Found {total_params} total parameters at path {parameter_path}"
-                )
-                break  # Success, exit retry loop
+                        yield param["Name"], param["Value"]
+                    next_token = page.get("NextToken")
+                return
 
             except ClientError as e:
                 if "ThrottlingException" in str(e) and retry_count < self.max_retries:
@@ -462,17 +647,64 @@ class AWSSSMClient(AWSDataSource):
                     )
                     time.sleep(delay)
                 else:
-                    self.logger.error(
-                        f"Failed to fetch parameters at path {parameter_path}: {e}"
-                    )
-                    break
-            except Exception as e:
-                self.logger.error(
-                    f"Failed to fetch parameters at path {parameter_path}: {e}"
-                )
-                break
+                    raise
+
+    def fetch_tree(self, base_path: str) -> Dict[str, str]:
+        """Fetch every parameter under a path with one recursive pagination.
+
+        GetParametersByPath returns values alongside names, so callers can
+        derive regions, services and AZ mappings from the tree without
+        further GetParameter calls. Complete trees are memoized per client
+        so repeated scans of the same path in one run are free.
+
+        Args:
+            base_path: Base path to fetch parameters from
+
+        Returns:
+            Dictionary mapping parameter names to values
+
+        Raises:
+            ClientError, BotoCoreError: If the pagination failed part-way, so
+                callers never derive (and cache) data from a partial tree
+        """
+        tree = self._trees.get(base_path)
+        if tree is not None:
+            return tree
 
-        return all_parameters
+        self.logger.info(f"Fetching all SSM parameters by path: {base_path}")
+
+        tree = {}
+        next_progress = 50
+        try:
+            for name, value in self._iter_ssm_parameters_by_path(base_path):
+                tree[name] = value
+
+                # Log progress every 50 parameters
+                if len(tree) >= next_progress:
+                    self.logger.info(f"Processed {len(tree)} parameters...")
+                    next_progress += 50
+
+        except (ClientError, BotoCoreError) as e:
+            self.logger.error(f"Failed to fetch parameters at path {base_path}: {e}")
+            raise
+
+        self.logger.info(f"Found {len(tree)} total parameters at path {base_path}")
+        self._trees[base_path] = tree
+        return tree
+
+    def fetch_all_ssm_parameters_by_path(self, parameter_path: str) -> List[str]:
+        """Fetch all SSM parameter names under a path.
+
+        Args:
+            parameter_path: Base path to fetch parameters from
+
+        Returns:
+            List of parameter names found at the path
+
+        Raises:
+            ClientError, BotoCoreError: If the pagination failed part-way
+        """
+        return list(self.fetch_tree(parameter_path))
 
     def fetch_availability_zones(self, regions: List[str]) -> Dict[str, int]:
         """Fetch availability zone counts for regions from SSM with full pagination.
@@ -484,106 +716,46 @@ class AWSSSMClient(AWSDataSource):
             Dictionary mapping region codes to AZ counts
         """
         cache_key = "availability_zones"
+        scope = (regions,)
 
         # Try to load from cache first
-        cached_data = self.get_cached_data(cache_key)
+        cached_data = self.get_cached_data(cache_key, scope=scope)
         if cached_data is not None:
             self.logger.info("Using cached availability zone data")
             return cast(Dict[str, int], cached_data)
 
         self.logger.info("Fetching availability zone data with full pagination...")
 
-        # Get ALL availability zone parameters with pagination
-        all_az_params = self.fetch_all_ssm_parameters_by_path(
-            "/aws/service/global-infrastructure/availability-zones"
+        # One recursive pull returns each AZ's /region parameter with its
+        # value, so AZs are counted per region without further lookups
+        try:
+            az_tree = self.fetch_tree(
+                "/aws/service/global-infrastructure/availability-zones"
+            )
+            tree_complete = True
+        except (ClientError, BotoCoreError):
+            # Serve fallback counts for this run, but don't cache them
+            az_tree = {}
+            tree_complete = False
+        wanted = set(regions)
+        az_counts = Counter(
+            value
+            for name, value in az_tree.items()
+            if name.endswith("/region") and value in wanted
         )
 
         az_data = {}
-        ssm = self.get_client()
-
-        # Process each region to count its AZs
         for region in regions:
-            az_count = 0
-
-            # Look for AZ parameters that belong to this region
-            for param_name in all_az_params:
-                if "/region" in param_name:
-                    try:
-                        # Get the region for this AZ parameter
-                        response = ssm.get_parameter(Name=param_name)
-                        if response["Parameter"]["Value"] == region:
-                            az_count += 1
-                    except Exception as e:
-                        # If we can't get the parameter, try pattern matching as fallback
-                        az_match = re.search(
-                            r"/availability-zones/([^/]+)/", param_name
-                        )
-                        if az_match:
-                            az_code = az_match.group(1)
-                            # Common AZ to region mappings
-                            region_mappings = {
-                                "use1": "us-east-1",
-                                "use2": "us-east-2",
-                                "usw1": "us-west-1",
-                                "usw2": "us-west-2",
-                                "euw1": "eu-west-1",
-                                "euw2": "eu-west-2",
-                                "euw3": "eu-west-3",
-                                "euc1": "eu-central-1",
-                                "euc2": "eu-central-2",
-                                "eun1": "eu-north-1",
-                                "eus1": "eu-south-1",
-                                "eus2": "eu-south-2",
-                                "apne1": "ap-northeast-1",
-                                "apne2": "ap-northeast-2",
-                                "apne3": "ap-northeast-3",
-                                "aps1": "ap-south-1",
-                                "aps2": "ap-south-2",
-                                "apse1": "ap-southeast-1",
-                                "apse2": "ap-southeast-2",
-                                "apse3": "ap-southeast-3",
-                                "apse4": "ap-southeast-4",
-                                "ape1": "ap-east-1",
-                                "ape2": "ap-east-2",
-                                "cac1": "ca-central-1",
-                                "caw1": "ca-west-1",
-                                "sae1": "sa-east-1",
-                                "afs1": "af-south-1",
-                                "mes1": "me-south-1",
-                                "mec1": "me-central-1",
-                                "ilc1": "il-central-1",
-                            }
-
-                            az_region_prefix = az_code.rstrip("0123456789-az")
-                            if region_mappings.get(az_region_prefix) == region:
-                                az_count += 1
-
+            az_count = az_counts.get(region, 0)
             if az_count > 0:
                 az_data[region] = az_count
                 self.logger.debug(f"Found {az_count} AZs for {region}")
             else:
-                # Fallback to known AZ counts for established regions
-                common_az_counts = {
-                    "us-east-1": 6,
-                    "us-east-2": 3,
-                    "us-west-1": 3,
-                    "us-west-2": 4,
-                    "eu-west-1": 3,
-                    "eu-west-2": 3,
-                    "eu-west-3": 3,
-                    "eu-central-1": 3,
-                    "ap-northeast-1": 3,
-                    "ap-northeast-2": 4,
-                    "ap-southeast-1": 3,
-                    "ap-southeast-2": 3,
-                    "ap-south-1": 3,
-                    "ca-central-1": 3,
-                    "sa-east-1": 3,
-                }
-                az_data[region] = common_az_counts.get(region, 3)  # Default to 3 AZs
+                az_data[region] = _COMMON_AZ_COUNTS.get(region, 3)  # Default to 3 AZs
 
-        # Save to cache
-        self.cache_data(cache_key, az_data)
+        # Save to cache, unless the AZ tree failed to load
+        if tree_complete:
+            self.cache_data(cache_key, az_data, scope=scope)
 
         self.logger.info(f"Successfully fetched AZ data for {len(az_data)} regions")
         return az_data
@@ -603,53 +775,50 @@ class AWSSSMClient(AWSDataSource):
             return cast(List[str], cached_data)
 
         self.logger.info("Discovering all regions from SSM parameters...")
-        discovered_regions = []
+        regions = set()
 
         try:
-            # First try: Get regions from the canonical regions path
-            regions_params = self.fetch_all_ssm_parameters_by_path(
+            # First try: Get regions from the canonical regions path, scanning
+            # parameters as pages arrive
+            for param_name, _ in self._iter_ssm_parameters_by_path(
                 "/aws/service/global-infrastructure/regions"
-            )
-
-            for param_name in regions_params:
+            ):
                 if param_name.endswith("/region"):
                     continue  # Skip the 'region' parameter itself
 
                 # Extract region code from parameter path
-                region_match = re.search(r"/regions/([^/]+)", param_name)
+                region_match = _REGION_PATH_RE.search(param_name)
                 if region_match:
                     region_code = region_match.group(1)
-                    if region_code and region_code not in discovered_regions:
-                        discovered_regions.append(region_code)
+                    if region_code:
+                        regions.add(region_code)
 
-            self.logger.info(
-                f"Found {len(discovered_regions)} regions from direct path"
-            )
+            self.logger.info(f"Found {len(regions)} regions from direct path")
 
             # If we didn't find many regions, try targeted parameter sampling
-            if len(discovered_regions) < 10:
+            if len(regions) < 10:
                 self.logger.info(
                     "Limited regions found, trying targeted parameter sampling..."
                 )
 
-                # Sample from service parameters to find more regions
-                service_params = self.fetch_all_ssm_parameters_by_path(
-                    "/aws/service/global-infrastructure/services"
+                # Sample the first 50 service parameters to find more regions;
+                # only the pages holding them are fetched
+                service_params = islice(
+                    self._iter_ssm_parameters_by_path(
+                        "/aws/service/global-infrastructure/services"
+                    ),
+                    50,
                 )
 
-                for param_name in service_params[
-                    :50
-                ]:  # Sample first 50 service parameters
+                for param_name, _ in service_params:
                     # Look for regional service availability patterns
-                    region_match = re.search(
-                        r"/services/[^/]+/regions/([^/]+)", param_name
-                    )
+                    region_match = _REGION_FROM_SERVICE_RE.search(param_name)
                     if region_match:
                         region_code = region_match.group(1)
-                        if region_code and region_code not in discovered_regions:
-                            discovered_regions.append(region_code)
+                        if region_code:
+                            regions.add(region_code)
 
-            discovered_regions.sort()
+            discovered_regions = sorted(regions)
             self.logger.info(f"Discovered {len(discovered_regions)} regions from SSM")
 
             # Cache the results
@@ -657,7 +826,7 @@ class AWSSSMClient(AWSDataSource):
 
             return discovered_regions
 
-        except Exception as e:
+        except (ClientError, BotoCoreError) as e:
             self.logger.error(f"Failed to discover regions from SSM: {e}")
             return []
 
@@ -679,54 +848,32 @@ class AWSSSMClient(AWSDataSource):
         services = set()
 
         try:
-            # Get all service parameters with pagination
-            service_params = self.fetch_all_ssm_parameters_by_path(
-                "/aws/service/global-infrastructure/services"
-            )
-
-            pages_processed = 0
-            for param_name in service_params:
+            # One recursive pull covers both the per-service subtrees and the
+            # direct children whose values are the service codes, so no
+            # second non-recursive scan of the same path is needed
+            base_path = "/aws/service/global-infrastructure/services"
+            service_tree = self.fetch_tree(base_path)
+
+            params_processed = 0
+            for param_name, value in service_tree.items():
                 # Extract service codes from parameter paths
-                service_match = re.search(r"/services/([^/]+)", param_name)
+                service_match = _SERVICE_PATH_RE.search(param_name)
                 if service_match:
                     service_code = service_match.group(1)
                     if service_code:
                         services.add(service_code)
 
-                pages_processed += 1
-                if pages_processed % 100 == 0:
-                    self.logger.info(
-                        f"Processed {pages_processed} pages, found {len(services)} unique services so far..."
-                    )
-
-            discovered_services = sorted(list(services))
-
-            # If we found fewer services than expected, try recursive approach
-            if len(discovered_services) < 200:
-                self.logger.info(
-                    f"Found {len(services)} services with non-recursive scan, trying recursive approach to find more..."
-                )
+                # Direct children carry the service code as their value
+                if value and param_name.count("/") == base_path.count("/") + 1:
+                    services.add(value)
 
-                # Try getting services list directly
-                try:
-                    ssm = self.get_client()
-                    paginator = ssm.get_paginator("get_parameters_by_path")
-                    page_iterator = paginator.paginate(
-                        Path="/aws/service/global-infrastructure/services",
-                        Recursive=False,
-                        MaxResults=10,
+                params_processed += 1
+                if params_processed % 100 == 0:
+                    self.logger.info(
+                        f"Processed {params_processed} parameters, found {len(services)} unique services so far..."
                     )
 
-                    for page in page_iterator:
-                        for param in page["Parameters"]:
-                            if param["Value"] not in services:
-                                services.add(param["Value"])
-                        time.sleep(0.1)  # Throttling protection
-
-                except Exception as e:
-                    self.logger.warning(f"Recursive approach failed: {e}")
-
-            discovered_services = sorted(list(services))
+            discovered_services = sorted(services)
             self.logger.info(f"Discovered {len(discovered_services)} services from SSM")
 
             # Cache the results
@@ -734,10 +881,42 @@ class AWSSSMClient(AWSDataSource):
 
             return discovered_services
 
-        except Exception as e:
+        except (ClientError, BotoCoreError) as e:
             self.logger.error(f"Failed to discover services from SSM: {e}")
             return []
 
+    def get_region_services(self, region_code: str) -> List[str]:
+        """Get services available in a specific region.
+
+        Args:
+            region_code: AWS region code
+
+        Returns:
+            Sorted list of service codes available in the region
+
+        Raises:
+            ClientError, BotoCoreError: If the region's service list failed to
+                load, so callers can tell a failure from an empty region
+        """
+        ssm = self.get_client()
+        region_path = (
+            f"/aws/service/global-infrastructure/regions/{region_code}/services"
+        )
+
+        paginator = ssm.get_paginator("get_parameters_by_path")
+        page_iterator = paginator.paginate(
+            Path=region_path, Recursive=False, MaxResults=10
+        )
+
+        services = set()
+        for page in self._paced(page_iterator):
+            for param in page["Parameters"]:
+                service_code = param["Value"]
+                if service_code:
+                    services.add(service_code)
+
+        return sorted(services)
+
     def get_region_service_mapping(
         self, regions: List[str], services: List[str]
     ) -> Dict[str, List[str]]:
@@ -751,9 +930,10 @@ class AWSSSMClient(AWSDataSource):
             Dictionary mapping region codes to lists of available services
         """
         cache_key = "region_services_mapping"
+        scope = (regions, services)
 
         # Try cache first
-        cached_data = self.get_cached_data(cache_key)
+        cached_data = self.get_cached_data(cache_key, scope=scope)
         if cached_data is not None:
             self.logger.info("Using cached region-services mapping")
             return cast(Dict[str, List[str]], cached_data)
@@ -762,54 +942,61 @@ class AWSSSMClient(AWSDataSource):
 
         region_services: Dict[str, List[str]] = {}
         total_mappings = 0
+        failed_regions = 0
 
         try:
-            for i, service_code in enumerate(services):
-                self.logger.info(
-                    f"Processing service {i+1:3d}/{len(services)}: {service_code}"
-                )
-
-                try:
-                    # Get regions where this service is available
-                    service_regions = self.get_service_regions(service_code)
-
-                    # Add this service to each region where it's available
-                    for region in service_regions:
-                        if (
-                            region in regions
-                        ):  # Only include regions we're interested in
-                            if region not in region_services:
-                                region_services[region] = []
-                            region_services[region].append(service_code)
-                            total_mappings += 1
-
-                    if service_regions:
-                        self.logger.info(
-                            f"  {service_code} available in {len(service_regions)} regions"
+            # Each region publishes its own service list, so one pagination
+            # per region (tens) replaces one per service (hundreds). The
+            # paginations are I/O bound and fan out over a thread pool sharing
+            # one SSM client; results are merged here on the calling thread.
+            wanted = set(services)
+            found: Dict[str, List[str]] = {}
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                future_map = {
+                    executor.submit(self.get_region_services, region): region
+                    for region in regions
+                }
+                for i, future in enumerate(as_completed(future_map), 1):
+                    region = future_map[future]
+                    try:
+                        available = future.result()
+                    except (ClientError, BotoCoreError) as e:
+                        self.logger.warning(
+                            f"Failed to get services for region {region}: {e}"
                         )
+                        failed_regions += 1
+                        continue
 
-                    # Small delay to avoid throttling
-                    time.sleep(0.05)
+                    # Only include services we're interested in
+                    region_svcs = [svc for svc in available if svc in wanted]
+                    if region_svcs:
+                        found[region] = region_svcs
+                        total_mappings += len(region_svcs)
 
-                except Exception as e:
-                    self.logger.warning(
-                        f"Failed to get regions for service {service_code}: {e}"
+                    self.logger.info(
+                        f"Processed region {i:3d}/{len(regions)}: {region}"
+                        f" ({len(region_svcs)} services)"
                     )
-                    continue
 
-            # Sort services within each region
-            for region in region_services:
-                region_services[region].sort()
+            # Keep the caller's region order
+            for region in regions:
+                if region in found:
+                    region_services[region] = found[region]
 
             self.logger.info(
                 f"Successfully mapped {len(region_services)} regions with {total_mappings} total service mappings"
             )
 
-            # Cache the results
-            self.cache_data(cache_key, region_services)
+            # Cache the results only if every region was mapped
+            if failed_regions:
+                self.logger.warning(
+                    f"{failed_regions} regions failed to map; not caching mapping"
+                )
+            else:
+                self.cache_data(cache_key, region_services, scope=scope)
 
             return region_services
 
-        except Exception as e:
+        except (ClientError, BotoCoreError) as e:
             self.logger.error(f"Failed to map services to regions: {e}")
             return {}
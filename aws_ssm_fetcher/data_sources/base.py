@@ -7,6 +7,8 @@ from typing import Any, Dict, List, Optional
 class DataSource(ABC):
     """Abstract base class for all data sources."""
 
+    __slots__ = ("cache_manager",)
+
     def __init__(self, cache_manager=None):
         """Initialize data source with optional cache manager."""
         self.cache_manager = cache_manager
@@ -23,37 +25,45 @@ class DataSource(ABC):
         """
         pass
 
-    def get_cached_data(self, cache_key: str) -> Optional[Any]:
+    def get_cached_data(
+        self, cache_key: str, ttl_hours: Optional[float] = None
+    ) -> Optional[Any]:
         """Get data from cache if available.
 
         Args:
             cache_key: Key to look up cached data
+            ttl_hours: Optional TTL override for this key
 
         Returns:
             Cached data if available and valid, None otherwise
         """
         if self.cache_manager:
-            return self.cache_manager.get(cache_key)
+            return self.cache_manager.get(cache_key, ttl_hours=ttl_hours)
         return None
 
-    def cache_data(self, cache_key: str, data: Any) -> bool:
+    def cache_data(
+        self, cache_key: str, data: Any, ttl_hours: Optional[float] = None
+    ) -> bool:
         """Cache data for future use.
 
         Args:
             cache_key: Key to store data under
             data: Data to cache
+            ttl_hours: Optional TTL override for this key
 
         Returns:
             True if cached successfully, False otherwise
         """
         if self.cache_manager:
-            return self.cache_manager.set(cache_key, data)
+            return self.cache_manager.set(cache_key, data, ttl_hours=ttl_hours)
         return False
 
 
 class AWSDataSource(DataSource):
     """Base class for AWS-specific data sources."""
 
+    __slots__ = ("aws_session",)
+
     def __init__(self, aws_session=None, cache_manager=None):
         """Initialize AWS data source.
 
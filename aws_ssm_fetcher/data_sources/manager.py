@@ -1,9 +1,13 @@
 """Unified data source manager for coordinating AWS data fetching."""
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple, cast
 
+from botocore.config import Config as BotoConfig
+
+from ..core.error_handling import RateLimiter
 from ..core.logging import get_logger
 from .aws_ssm_client import AWSSSMClient
 from .rss_client import RSSClient
@@ -44,6 +48,9 @@ class DataSourceManager:
         self.aws_session = aws_session
         self.logger = get_logger("data_source_manager")
 
+        # Pace the SSM calls of this manager's clients
+        self.ssm_limiter = RateLimiter(rate=getattr(config, "ssm_rate_limit", 10.0))
+
         # Initialize data source clients
         self.ssm_client = None
         self.rss_client = None
@@ -104,12 +111,24 @@ class DataSourceManager:
         """Get or create SSM client."""
         if self.ssm_client is None:
             region = getattr(self.config, "aws_region", "us-east-1")
+            max_retries = getattr(self.config, "max_retries", 3)
+            max_workers = getattr(self.config, "max_workers", 16)
+
+            # Keep-alive pooled connections avoid a TLS handshake per call
+            boto_config = BotoConfig(
+                retries={"mode": "adaptive", "max_attempts": max_retries},
+                max_pool_connections=max(10, max_workers),
+                tcp_keepalive=True,
+            )
             self.ssm_client = AWSSSMClient(
                 aws_session=self.aws_session,
                 cache_manager=self.cache_manager,
                 region=region,
-                max_retries=getattr(self.config, "max_retries", 3),
+                max_retries=max_retries,
                 base_delay=getattr(self.config, "base_delay", 1.0),
+                max_workers=max_workers,
+                boto_config=boto_config,
+                rate_limiter=self.ssm_limiter,
             )
         return cast(AWSSSMClient, self.ssm_client)
 
@@ -231,26 +250,37 @@ class DataSourceManager:
         """
         self._performance_stats["total_requests"] += 1
 
-        # Fetch region names from SSM
         region_names = {}
         rss_metadata = {}
 
+        # SSM names and RSS metadata are independent network fetches, so run
+        # them side by side; clients are created here so the workers only
+        # do I/O
+        ssm_client = self.get_ssm_client()
+        rss_client = self.get_rss_client()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            ssm_future = executor.submit(ssm_client.fetch_region_names, regions)
+            rss_future = executor.submit(rss_client.fetch_region_rss_data)
+
+            # Fetch region names from SSM
+            try:
+                region_names = ssm_future.result()
+                self._performance_stats["ssm_calls"] += 1
+            except Exception as e:
+                self.logger.error(f"Failed to fetch region names from SSM: {e}")
+
+            # Fetch RSS metadata if available
+            try:
+                rss_metadata = rss_future.result()
+                self._performance_stats["rss_calls"] += 1
+            except Exception as e:
+                self.logger.error(f"Failed to fetch RSS metadata: {e}")
+
+        # Merge RSS data with region names
         try:
-            ssm_client = self.get_ssm_client()
-            region_names = ssm_client.fetch_region_names(regions)
-            self._performance_stats["ssm_calls"] += 1
-        except Exception as e:
-            self.logger.error(f"Failed to fetch region names from SSM: {e}")
-
-        # Fetch RSS metadata if available
-        try:
-            rss_client = self.get_rss_client()
-            rss_metadata = rss_client.fetch_region_rss_data()
-            self._performance_stats["rss_calls"] += 1
-
-            # Merge RSS data with region names
+            wanted = set(regions)
             for region_code, rss_data in rss_metadata.items():
-                if region_code in regions:
+                if region_code in wanted:
                     # Use RSS region name if SSM name is missing or generic
                     ssm_name = region_names.get(region_code, "")
                     rss_name = rss_data.get("region_name", "")
@@ -262,7 +292,7 @@ class DataSourceManager:
                         region_names[region_code] = rss_name
 
         except Exception as e:
-            self.logger.error(f"Failed to fetch RSS metadata: {e}")
+            self.logger.error(f"Failed to merge RSS metadata: {e}")
 
         # Fill in missing region names with fallbacks
         for region in regions:
@@ -440,13 +470,16 @@ class DataSourceManager:
         return list(rss_data.keys()) if rss_data else []
 
     def _fetch_regions_merged(self) -> List[str]:
-        """Fetch regions from both sources and merge."""
-        ssm_regions = set(self._fetch_regions_from_ssm() or [])
-        rss_regions = set(self._fetch_regions_from_rss() or [])
+        """Fetch regions from both sources concurrently and merge."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            ssm_future = executor.submit(self._fetch_regions_from_ssm)
+            rss_future = executor.submit(self._fetch_regions_from_rss)
+            ssm_regions = set(ssm_future.result() or [])
+            rss_regions = set(rss_future.result() or [])
 
         # Merge and prioritize regions that appear in both sources
         all_regions = ssm_regions.union(rss_regions)
-        return sorted(list(all_regions))
+        return sorted(all_regions)
 
     def _fetch_services_from_ssm(self) -> List[str]:
         """Fetch services from SSM client."""
@@ -519,7 +552,7 @@ class DataSourceManager:
             available_services.extend(
                 services[: min(len(services), 20)]
             )  # Add first 20 services
-            mapping[region] = sorted(list(set(available_services)))
+            mapping[region] = sorted(set(available_services))
 
         return mapping
 
@@ -6,6 +6,7 @@ from typing import Dict, List
 import pandas as pd
 import pytz
 from openpyxl.styles import Font, NamedStyle, PatternFill
+from openpyxl.utils import get_column_letter
 
 from .base import BaseOutputGenerator, OutputContext, OutputError
 
@@ -49,6 +50,12 @@ class ExcelGenerator(BaseOutputGenerator):
         )  # Dark blue for headers
         self.white_font = Font(color="FFFFFF")  # White font for headers
 
+        # Extra formatting for specific sheets, keyed by sheet name
+        self._sheet_formatters = {
+            "Service Matrix": self._format_service_matrix,
+            "Service Summary": self._format_service_summary,
+        }
+
     def get_default_filename(self) -> str:
         """Get default filename for Excel output.
 
@@ -104,7 +111,8 @@ class ExcelGenerator(BaseOutputGenerator):
         """
         self.logger.info("Generating Excel sheet data...")
 
-        # Convert to DataFrame for processing
+        # Convert to DataFrame once; the sheet helpers read it but must not
+        # modify it in place
         df = pd.DataFrame(data)
         regions = (
             df["Region Code"].unique().tolist() if "Region Code" in df.columns else []
@@ -114,16 +122,16 @@ class ExcelGenerator(BaseOutputGenerator):
         regional_services_df = df.copy()
 
         # Generate Service Matrix using data transformer
-        service_matrix_df = self._generate_service_matrix(data)
+        service_matrix_df = self._generate_service_matrix(df)
 
         # Generate Region Summary
-        region_summary_df = self._generate_region_summary(data, regions)
+        region_summary_df = self._generate_region_summary(df, regions)
 
         # Generate Service Summary
-        service_summary_df = self._generate_service_summary(data)
+        service_summary_df = self._generate_service_summary(df)
 
         # Generate Statistics
-        statistics_df = self._generate_statistics(data)
+        statistics_df = self._generate_statistics(df)
 
         return {
             "Regional Services": regional_services_df,
@@ -133,17 +141,15 @@ class ExcelGenerator(BaseOutputGenerator):
             "Statistics": statistics_df,
         }
 
-    def _generate_service_matrix(self, data: List[Dict]) -> pd.DataFrame:
+    def _generate_service_matrix(self, df: pd.DataFrame) -> pd.DataFrame:
         """Generate service availability matrix.
 
         Args:
-            data: Regional service data
+            df: Regional service data as a DataFrame
 
         Returns:
             DataFrame with services vs regions matrix
         """
-        df = pd.DataFrame(data)
-
         # Get unique services and regions
         services = (
             sorted(df["Service Name"].unique()) if "Service Name" in df.columns else []
@@ -171,18 +177,17 @@ class ExcelGenerator(BaseOutputGenerator):
         return pd.DataFrame(matrix_data)
 
     def _generate_region_summary(
-        self, data: List[Dict], regions: List[str]
+        self, df: pd.DataFrame, regions: List[str]
     ) -> pd.DataFrame:
         """Generate region summary with statistics.
 
         Args:
-            data: Regional service data
+            df: Regional service data as a DataFrame
             regions: List of region codes
 
         Returns:
             DataFrame with region summary
         """
-        df = pd.DataFrame(data)
         summary_data = []
 
         for region in regions:
@@ -218,17 +223,15 @@ class ExcelGenerator(BaseOutputGenerator):
 
         return pd.DataFrame(summary_data)
 
-    def _generate_service_summary(self, data: List[Dict]) -> pd.DataFrame:
+    def _generate_service_summary(self, df: pd.DataFrame) -> pd.DataFrame:
         """Generate service summary with coverage statistics.
 
         Args:
-            data: Regional service data
+            df: Regional service data as a DataFrame
 
         Returns:
             DataFrame with service summary
         """
-        df = pd.DataFrame(data)
-
         if df.empty or "Service Name" not in df.columns:
             return pd.DataFrame({"Service": [], "Note": ["No data available"]})
 
@@ -264,17 +267,15 @@ class ExcelGenerator(BaseOutputGenerator):
 
         return pd.DataFrame(summary_data).sort_values("Coverage %", ascending=False)
 
-    def _generate_statistics(self, data: List[Dict]) -> pd.DataFrame:
+    def _generate_statistics(self, df: pd.DataFrame) -> pd.DataFrame:
         """Generate comprehensive statistics.
 
         Args:
-            data: Regional service data
+            df: Regional service data as a DataFrame
 
         Returns:
             DataFrame with statistics
         """
-        df = pd.DataFrame(data)
-
         if df.empty:
             return pd.DataFrame({"Metric": ["No data"], "Value": ["N/A"]})
 
@@ -350,10 +351,9 @@ class ExcelGenerator(BaseOutputGenerator):
             self._format_headers(worksheet)
 
             # Apply sheet-specific formatting
-            if sheet_name == "Service Matrix":
-                self._format_service_matrix(worksheet)
-            elif sheet_name == "Service Summary":
-                self._format_service_summary(worksheet)
+            sheet_formatter = self._sheet_formatters.get(sheet_name)
+            if sheet_formatter is not None:
+                sheet_formatter(worksheet)
 
             # Auto-adjust column widths
             self._adjust_column_widths(worksheet, df)
@@ -424,28 +424,22 @@ class ExcelGenerator(BaseOutputGenerator):
             worksheet: openpyxl worksheet
             df: DataFrame for this sheet
         """
-        for column in worksheet.columns:
-            column_letter = column[0].column_letter
-            column_index = column[0].column - 1
-
-            # Get column name
-            column_name = (
-                df.columns[column_index] if column_index < len(df.columns) else ""
-            )
-
+        # Widths come from the DataFrame, so there is no need to walk the
+        # worksheet's cells column by column
+        for column_index, column_name in enumerate(df.columns, start=1):
             # Calculate optimal width
-            max_length = len(str(column_name)) if column_name else 0
+            max_length = len(str(column_name))
 
             # Check data content length (sample first 100 rows for performance)
-            if column_index < len(df.columns):
-                col_data = df.iloc[: min(100, len(df)), column_index]
-                for cell_value in col_data:
-                    if cell_value is not None:
-                        max_length = max(max_length, len(str(cell_value)))
+            for cell_value in df.iloc[:100, column_index - 1]:
+                if cell_value is not None:
+                    max_length = max(max_length, len(str(cell_value)))
 
             # Set column width with reasonable limits (min 10, max 50 characters)
             adjusted_width = min(max(max_length + 2, 10), 50)
-            worksheet.column_dimensions[column_letter].width = adjusted_width
+            worksheet.column_dimensions[get_column_letter(column_index)].width = (
+                adjusted_width
+            )
 
     def _log_excel_details(
         self, sheets_data: Dict[str, pd.DataFrame], stats: Dict[str, int]
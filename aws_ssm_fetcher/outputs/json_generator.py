@@ -2,13 +2,44 @@
 
 import json
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import pytz
 
+try:
+    import orjson
+except ImportError:  # Optional dependency - fall back to stdlib json
+    orjson = None
+
 from .base import BaseOutputGenerator, OutputContext, OutputError
 
 
+def _write_json(filepath: str, json_data: Dict[str, Any], indent: bool) -> None:
+    """Write JSON to a file, using orjson when it is installed.
+
+    Args:
+        filepath: Destination file path
+        json_data: JSON-serializable structure
+        indent: Pretty-print with two-space indentation if True, else compact
+    """
+    if orjson is not None:
+        # orjson emits UTF-8 bytes directly (non-ASCII kept as-is)
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        with open(filepath, "wb") as f:
+            f.write(orjson.dumps(json_data, option=option))
+        return
+
+    # Encode in one go and write once; json.dump would call write() per token
+    if indent:
+        text = json.dumps(json_data, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(json_data, separators=(",", ":"), ensure_ascii=False)
+    with open(filepath, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
 class JSONGenerator(BaseOutputGenerator):
     """Generate comprehensive JSON output with metadata."""
 
@@ -72,15 +103,16 @@ class JSONGenerator(BaseOutputGenerator):
 
             self.logger.info(f"Generating JSON output: {filepath}")
 
+            # One pass over the data feeds both the metadata and the summary log
+            stats = self._get_data_statistics(data)
+
             # Create comprehensive JSON structure
-            json_data = self._create_json_structure(data)
+            json_data = self._create_json_structure(data, stats)
 
             # Write JSON file
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
+            _write_json(filepath, json_data, indent=True)
 
             # Log summary
-            stats = self._get_data_statistics(data)
             self._log_output_summary(filepath, stats)
 
             return filepath
@@ -88,16 +120,20 @@ class JSONGenerator(BaseOutputGenerator):
         except Exception as e:
             raise OutputError(f"JSON generation failed: {e}") from e
 
-    def _create_json_structure(self, data: List[Dict]) -> Dict[str, Any]:
+    def _create_json_structure(
+        self, data: List[Dict], stats: Optional[Dict[str, int]] = None
+    ) -> Dict[str, Any]:
         """Create comprehensive JSON structure with metadata.
 
         Args:
             data: Regional service data
+            stats: Precomputed data statistics (computed from data if omitted)
 
         Returns:
             Complete JSON structure
         """
-        stats = self._get_data_statistics(data)
+        if stats is None:
+            stats = self._get_data_statistics(data)
 
         # Create enhanced metadata with EST timezone
         base_metadata: Dict[str, Any] = self.context.metadata or {}
@@ -293,15 +329,16 @@ class CompactJSONGenerator(JSONGenerator):
 
             self.logger.info(f"Generating compact JSON output: {filepath}")
 
+            # One pass over the data feeds both the metadata and the summary log
+            stats = self._get_data_statistics(data)
+
             # Create JSON structure
-            json_data = self._create_json_structure(data)
+            json_data = self._create_json_structure(data, stats)
 
             # Write compact JSON file (no indentation)
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(json_data, f, separators=(",", ":"), ensure_ascii=False)
+            _write_json(filepath, json_data, indent=False)
 
             # Log summary
-            stats = self._get_data_statistics(data)
             self._log_output_summary(filepath, stats)
 
             return filepath
@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Optional, Type
 
 from ..core.cache import CacheManager
 from ..core.config import Config
+from ..core.error_handling import RateLimiter
 from ..core.logging import get_logger
 
 
@@ -19,6 +20,8 @@ class ProcessingContext:
     logger_name: str = "processor"
     start_time: Optional[datetime] = None
     metadata: Dict[str, Any] = None
+    # Paces the SSM calls of every processor sharing this context
+    ssm_limiter: Optional[RateLimiter] = None
 
     def __post_init__(self):
         """Initialize context after creation."""
@@ -26,6 +29,10 @@ class ProcessingContext:
             self.start_time = datetime.now()
         if self.metadata is None:
             self.metadata = {}
+        if self.ssm_limiter is None:
+            self.ssm_limiter = RateLimiter(
+                rate=getattr(self.config, "ssm_rate_limit", 10.0)
+            )
 
 
 class ProcessingError(Exception):
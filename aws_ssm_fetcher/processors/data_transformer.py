@@ -313,30 +313,33 @@ class DataTransformer(BaseProcessor):
 
         self.logger.info(f"Generating statistics for {len(data)} data points")
 
-        # Calculate various statistics
+        # Calculate various statistics; one groupby per axis, summarized in a
+        # single agg each
         region_groups = df.groupby("Region Code").size()
         service_groups = df.groupby("Service Name").size()
+        region_stats = region_groups.agg(["mean", "max", "min", "std"])
+        service_stats = service_groups.agg(["mean", "max", "min", "std"])
 
         stats = [
             ["Generator", "AWS SSM Data Fetcher - Modular Architecture v3.0"],
             ["Generated At", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
             ["", ""],
             ["Summary Statistics", ""],
-            ["Total Regions", df["Region Code"].nunique()],
+            ["Total Regions", len(region_groups)],
             ["Total Services", total_services],
             ["Total Combinations", len(df)],
             ["", ""],
             ["Regional Service Distribution", ""],
-            ["Avg Services per Region", round(region_groups.mean(), 1)],
-            ["Max Services (Region)", region_groups.max()],
-            ["Min Services (Region)", region_groups.min()],
-            ["Std Dev Services per Region", round(region_groups.std(), 1)],
+            ["Avg Services per Region", round(region_stats["mean"], 1)],
+            ["Max Services (Region)", int(region_stats["max"])],
+            ["Min Services (Region)", int(region_stats["min"])],
+            ["Std Dev Services per Region", round(region_stats["std"], 1)],
             ["", ""],
             ["Service Distribution", ""],
-            ["Avg Regions per Service", round(service_groups.mean(), 1)],
-            ["Max Regions (Service)", service_groups.max()],
-            ["Min Regions (Service)", service_groups.min()],
-            ["Std Dev Regions per Service", round(service_groups.std(), 1)],
+            ["Avg Regions per Service", round(service_stats["mean"], 1)],
+            ["Max Regions (Service)", int(service_stats["max"])],
+            ["Min Regions (Service)", int(service_stats["min"])],
+            ["Std Dev Regions per Service", round(service_stats["std"], 1)],
         ]
 
         stats_df = pd.DataFrame(stats, columns=["Metric", "Value"])
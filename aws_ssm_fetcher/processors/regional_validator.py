@@ -52,7 +52,9 @@ class RegionDiscoverer(BaseProcessor):
         self.ssm_client = context.ssm_client
 
         # Configure retry and circuit breaker for AWS operations
-        retry_config = self.error_handler.get_aws_retry_config()
+        retry_config = self.error_handler.get_aws_retry_config(
+            rate_limiter=context.ssm_limiter
+        )
         circuit_config = self.error_handler.get_aws_circuit_breaker_config()
 
         self._get_parameters_by_path_with_reliability = with_retry_and_circuit_breaker(
@@ -142,7 +144,7 @@ class RegionDiscoverer(BaseProcessor):
                 regions.update(self._discover_regions_from_parameters())
 
             # Convert to sorted list
-            discovered_regions = sorted(list(regions))
+            discovered_regions = sorted(regions)
 
             # Validate discovered regions
             if validate_regions:
@@ -283,7 +285,9 @@ class ServiceDiscoverer(BaseProcessor):
         self.ssm_client = context.ssm_client
 
         # Configure retry and circuit breaker
-        retry_config = self.error_handler.get_aws_retry_config()
+        retry_config = self.error_handler.get_aws_retry_config(
+            rate_limiter=context.ssm_limiter
+        )
         circuit_config = self.error_handler.get_aws_circuit_breaker_config()
 
         self._get_parameters_by_path_with_reliability = with_retry_and_circuit_breaker(
@@ -383,7 +387,7 @@ class ServiceDiscoverer(BaseProcessor):
                 services.update(self._discover_services_from_parameters())
 
             # Convert to sorted list
-            discovered_services = sorted(list(services))
+            discovered_services = sorted(services)
 
             # Validate discovered services
             if validate_services:
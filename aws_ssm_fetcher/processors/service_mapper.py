@@ -2,7 +2,7 @@
 
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from ..core.error_handling import ErrorHandler, with_retry_and_circuit_breaker
 from .base import (
@@ -32,7 +32,9 @@ class ServiceMapper(BaseProcessor):
         self.ssm_client = context.ssm_client
 
         # Configure retry and circuit breaker for AWS operations
-        retry_config = self.error_handler.get_aws_retry_config()
+        retry_config = self.error_handler.get_aws_retry_config(
+            rate_limiter=context.ssm_limiter
+        )
         circuit_config = self.error_handler.get_aws_circuit_breaker_config()
 
         # Decorate SSM operations with reliability patterns
@@ -96,7 +98,9 @@ class ServiceMapper(BaseProcessor):
             f"Mapping {len(input_data)} services to regions using AWS SSM data"
         )
 
-        region_services = {}
+        # Collected as sets so repeated (region, service) pairs are O(1) to
+        # skip; converted to sorted lists once at the end
+        region_service_sets: Dict[str, Set[str]] = {}
         processing_stats = {
             "services_processed": 0,
             "services_failed": 0,
@@ -118,11 +122,9 @@ class ServiceMapper(BaseProcessor):
 
                     # Add service to each region it's available in
                     for region_code in service_regions:
-                        if region_code not in region_services:
-                            region_services[region_code] = []
-
-                        if service_code not in region_services[region_code]:
-                            region_services[region_code].append(service_code)
+                        region_set = region_service_sets.setdefault(region_code, set())
+                        if service_code not in region_set:
+                            region_set.add(service_code)
                             processing_stats["total_mappings"] += 1
 
                     processing_stats["services_processed"] += 1
@@ -142,8 +144,10 @@ class ServiceMapper(BaseProcessor):
                     continue
 
             # Sort services within each region for consistent output
-            for region_code in region_services:
-                region_services[region_code].sort()
+            region_services = {
+                region_code: sorted(service_set)
+                for region_code, service_set in region_service_sets.items()
+            }
 
             processing_stats["regions_discovered"] = len(region_services)
 
@@ -199,7 +203,7 @@ class ServiceMapper(BaseProcessor):
                         service_regions.append(region_code.strip())
 
             # Remove duplicates and sort
-            service_regions = sorted(list(set(service_regions)))
+            service_regions = sorted(set(service_regions))
 
         except Exception as e:
             # Let retry/circuit breaker handle the error
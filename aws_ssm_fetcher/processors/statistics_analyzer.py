@@ -16,6 +16,11 @@ from .base import (
     ProcessingValidationError,
 )
 
+# AZ ID from an AZ parameter path, and the region prefix of an AZ ID
+# ("use1-az2" -> "use1")
+_AZ_CODE_RE = re.compile(r"/availability-zones/([^/]+)/")
+_AZ_PREFIX_RE = re.compile(r"^([a-z]+\d+)")
+
 
 class StatisticsAnalysisError(ProcessingError):
     """Exception raised during statistics analysis operations."""
@@ -95,7 +100,9 @@ class AvailabilityZoneAnalyzer(BaseProcessor):
         }
 
         # Configure retry for AWS operations
-        retry_config = self.error_handler.get_aws_retry_config()
+        retry_config = self.error_handler.get_aws_retry_config(
+            rate_limiter=context.ssm_limiter
+        )
         self._get_parameter_with_retry = with_retry(retry_config)(self._get_parameter)
 
     def validate_input(self, input_data: Any) -> bool:
@@ -158,10 +165,13 @@ class AvailabilityZoneAnalyzer(BaseProcessor):
                 "/aws/service/global-infrastructure/availability-zones"
             )
 
+            # Filter to the AZ region parameters once rather than per region
+            region_params = [p for p in all_az_params if "/region" in p]
+
             az_data = {}
 
             for region in input_data:
-                az_count = self._count_azs_for_region(region, all_az_params)
+                az_count = self._count_azs_for_region(region, region_params)
                 if az_count > 0:
                     az_data[region] = az_count
                     self.logger.debug(f"Found {az_count} AZs for {region}")
@@ -205,21 +215,25 @@ class AvailabilityZoneAnalyzer(BaseProcessor):
 
         return parameter_names
 
-    def _count_azs_for_region(self, region: str, all_az_params: List[str]) -> int:
-        """Count availability zones for a specific region."""
+    def _count_azs_for_region(self, region: str, region_params: List[str]) -> int:
+        """Count availability zones for a specific region.
+
+        Args:
+            region: Region code to count AZs for
+            region_params: AZ parameter names already filtered to '/region' entries
+        """
         az_count = 0
 
         # Look for AZ parameters that belong to this region
-        for param_name in all_az_params:
-            if "/region" in param_name:
-                try:
-                    # Get the region for this AZ parameter
-                    response = self._get_parameter_with_retry(param_name)
-                    if response and response["Parameter"]["Value"] == region:
-                        az_count += 1
-                except Exception:
-                    # Try pattern matching as fallback
-                    az_count += self._pattern_match_az_to_region(param_name, region)
+        for param_name in region_params:
+            try:
+                # Get the region for this AZ parameter
+                response = self._get_parameter_with_retry(param_name)
+                if response and response["Parameter"]["Value"] == region:
+                    az_count += 1
+            except Exception:
+                # Try pattern matching as fallback
+                az_count += self._pattern_match_az_to_region(param_name, region)
 
         return az_count
 
@@ -233,10 +247,11 @@ class AvailabilityZoneAnalyzer(BaseProcessor):
 
     def _pattern_match_az_to_region(self, param_name: str, region: str) -> int:
         """Pattern match AZ parameter to region as fallback."""
-        az_match = re.search(r"/availability-zones/([^/]+)/", param_name)
+        az_match = _AZ_CODE_RE.search(param_name)
         if az_match:
             az_code = az_match.group(1)
-            az_region_prefix = az_code.rstrip("0123456789-az")
+            prefix_match = _AZ_PREFIX_RE.match(az_code)
+            az_region_prefix = prefix_match.group(1) if prefix_match else az_code
             if self.region_mappings.get(az_region_prefix) == region:
                 return 1
         return 0
@@ -4,24 +4,119 @@ AWS SSM Data Fetcher
 Fetches AWS service and region data from SSM Parameter Store and generates Excel and JSON outputs.
 """
 
+import functools
 import json
 import logging
 import os
 import pickle
 import re
 import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import boto3
 import feedparser
+import numpy as np
 import pandas as pd
 import requests
-from botocore.exceptions import ClientError, NoCredentialsError
+from botocore.config import Config as BotoConfig
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill
+from openpyxl.utils import get_column_letter
+
+try:
+    import orjson
+except ImportError:  # Optional dependency - fall back to stdlib json
+    orjson = None
+
+try:
+    import xlsxwriter
+except ImportError:  # Optional dependency - fall back to openpyxl
+    xlsxwriter = None
 
 from aws_ssm_fetcher.core.cache import CacheManager
 from aws_ssm_fetcher.core.config import Config
 
+# Patterns used in the RSS and SSM discovery loops, compiled once
+_REGION_CODE_RE = re.compile(r"([a-z]{2}-[a-z]+-[0-9]{1,2})")
+_REGIONS_PATH_RE = re.compile(r"/regions/([a-z0-9-]+)$")
+_REGIONS_PATH_MID_RE = re.compile(r"/regions/([a-z0-9-]+)/")
+_SERVICES_PATH_RE = re.compile(r"/services/([a-z0-9-]+)$")
+_SERVICES_PATH_MID_RE = re.compile(r"/services/([a-z0-9-]+)/")
+_SERVICE_REGION_EDGE_RE = re.compile(r"/services/([a-z0-9-]+)/regions/([a-z0-9-]+)$")
+_DATE_TEXT_RE = re.compile(r"(\w+ \d{1,2}, \d{4})")
+
+# Seconds before a region/service that had no longName in SSM is looked up again
+_NEGATIVE_NAME_TTL = 3600
+
+# Excel report colors and fonts, matching the original file
+_GREEN_FILL = PatternFill(
+    start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"
+)  # Light green for ✓
+_RED_FILL = PatternFill(
+    start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"
+)  # Light red for ✗
+_HEADER_FILL = PatternFill(
+    start_color="366092", end_color="366092", fill_type="solid"
+)  # Dark blue for headers
+_WHITE_FONT = Font(color="FFFFFF")  # White font for headers
+
+# The same styles as XlsxWriter format properties
+_XLSX_FORMATS = {
+    "green": {"bg_color": "#C6EFCE", "pattern": 1},
+    "red": {"bg_color": "#FFC7CE", "pattern": 1},
+    "header": {"bg_color": "#366092", "pattern": 1, "font_color": "#FFFFFF"},
+    "percent": {"num_format": "0.0%"},
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _region_name_re(region_code: str) -> "re.Pattern[str]":
+    """Return the compiled 'Region Name - region-code' pattern for a region."""
+    return re.compile(r"^(.+?)\s*-\s*" + re.escape(region_code))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_rss_date(date_text: str) -> str:
+    """Normalize a 'Month D, YYYY' date to YYYY-MM-DD, or 'N/A' if unparseable."""
+    try:
+        return datetime.strptime(date_text, "%B %d, %Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return "N/A"
+
+
+def _encode_json_indented(obj: Any) -> bytes:
+    """Encode a value as UTF-8 JSON with two-space indentation."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _excel_column_widths(sheet_df: pd.DataFrame) -> List[int]:
+    """Return column widths fitted to the header and the first 100 rows."""
+    # Content length is sampled from the first 100 rows for performance
+    data_widths = (
+        sheet_df.head(100).astype(str).apply(lambda col: col.str.len()).max().fillna(0)
+    )
+    return [
+        # Reasonable limits: min 10, max 50 characters
+        min(max(max(len(str(column_name)), int(data_width)) + 2, 10), 50)
+        for column_name, data_width in data_widths.items()
+    ]
+
+
+def _excel_rows(sheet_df: pd.DataFrame):
+    """Yield sheet rows as tuples, with missing values as empty cells."""
+    return (
+        sheet_df.astype(object)
+        .where(sheet_df.notna(), None)
+        .itertuples(index=False, name=None)
+    )
+
 
 class AWSSSMDataFetcher:
     def __init__(
@@ -57,7 +152,17 @@ class AWSSSMDataFetcher:
         self.cache_manager = CacheManager(self.config)
 
         try:
-            self.ssm = boto3.client("ssm", region_name=self.config.aws_region)
+            # Size the connection pool for the worker threads sharing this
+            # client; adaptive retries let botocore back off on throttling
+            self.ssm = boto3.client(
+                "ssm",
+                region_name=self.config.aws_region,
+                config=BotoConfig(
+                    max_pool_connections=max(50, self.config.max_workers),
+                    retries={"max_attempts": 20, "mode": "adaptive"},
+                    tcp_keepalive=True,
+                ),
+            )
 
             logging.info(f"Initialized SSM client for region: {self.config.aws_region}")
             logging.info(
@@ -78,32 +183,83 @@ class AWSSSMDataFetcher:
             logging.warning(f"Failed to get parameter {parameter_path}: {e}")
             return None
 
-    def get_parameters_batch(self, parameter_paths: List[str]) -> Dict[str, str]:
-        """Get multiple parameters in batches (max 10 per request)."""
+    @functools.cached_property
+    def _ssm_executor(self) -> ThreadPoolExecutor:
+        """Worker pool shared by every SSM fan-out on this fetcher.
+
+        Threads are started on first use and reused across calls. Work
+        submitted here must not itself wait on this pool.
+        """
+        return ThreadPoolExecutor(
+            max_workers=self.config.max_workers or 16,
+            thread_name_prefix="ssm",
+        )
+
+    def _get_parameters_chunk(self, batch: List[str]) -> Dict[str, Optional[str]]:
+        """Get up to 10 parameters with a single GetParameters call.
+
+        Parameters SSM reports as invalid map to None. If the call itself
+        fails, the batch's paths are left out so callers can tell "no such
+        parameter" from "not fetched".
+        """
         results = {}
+        try:
+            response = self.ssm.get_parameters(Names=batch)
 
-        # Process in batches of 10 (SSM limit)
-        for i in range(0, len(parameter_paths), 10):
-            batch = parameter_paths[i : i + 10]
-            try:
-                response = self.ssm.get_parameters(Names=batch)
+            # Process successful parameters
+            for param in response["Parameters"]:
+                results[param["Name"]] = param["Value"]
+
+            # Log any failed parameters
+            for invalid in response["InvalidParameters"]:
+                logging.warning(f"Invalid parameter: {invalid}")
+                results[invalid] = None
 
-                # Process successful parameters
-                for param in response["Parameters"]:
-                    results[param["Name"]] = param["Value"]
+        except ClientError as e:
+            logging.error(f"Batch parameter request failed: {e}")
+
+        return results
 
-                # Log any failed parameters
-                for invalid in response["InvalidParameters"]:
-                    logging.warning(f"Invalid parameter: {invalid}")
-                    results[invalid] = None
+    def get_parameters_batch(self, parameter_paths: List[str]) -> Dict[str, str]:
+        """Get multiple parameters in batches (max 10 per request)."""
+        # Process in batches of 10 (SSM limit)
+        batches = [
+            parameter_paths[i : i + 10] for i in range(0, len(parameter_paths), 10)
+        ]
+        if len(batches) <= 1:
+            return self._get_parameters_chunk(batches[0]) if batches else {}
 
-            except ClientError as e:
-                logging.error(f"Batch parameter request failed: {e}")
-                for path in batch:
-                    results[path] = None
+        # The calls are network-bound, so fan the batches out over the shared
+        # client; its adaptive retry mode backs off when SSM throttles
+        results = {}
+        for batch_results in self._ssm_executor.map(
+            self._get_parameters_chunk, batches
+        ):
+            results.update(batch_results)
 
         return results
 
+    def get_parameters_batch_mapped(
+        self, codes: Sequence[str], path_format: str
+    ) -> Dict[str, Optional[str]]:
+        """Get one parameter per code, keyed by code rather than full SSM path.
+
+        Args:
+            codes: Region or service codes
+            path_format: Parameter path with a ``{}`` placeholder for the code
+
+        Returns:
+            Mapping of code to parameter value (None if the parameter doesn't
+            exist); codes whose batch failed are left out
+        """
+        code_by_path = {path_format.format(code): code for code in codes}
+        results = self.get_parameters_batch(list(code_by_path))
+        return {
+            code: results[path]
+            for path, code in code_by_path.items()
+            if path in results
+        }
+
     def _get_cache_path(self, cache_key: str) -> str:
         """Get the file path for a cache key. (Delegated to cache manager)"""
         return str(self.cache_manager._get_cache_path(cache_key))
@@ -143,13 +299,38 @@ class AWSSSMDataFetcher:
         logging.info("Fetching AWS regions RSS data...")
         rss_url = "https://docs.aws.amazon.com/global-infrastructure/latest/regions/regions.rss"
 
+        # Revalidate the expired copy (if any) instead of re-downloading it
+        validators_key = f"{cache_key}_validators"
+        stale_data = self.cache_manager.get_stale(cache_key)
+        validators = self.cache_manager.get_stale(validators_key) or {}
+        headers = {}
+        if stale_data is not None:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
         try:
-            # Fetch RSS feed
-            response = requests.get(rss_url, timeout=30)
+            # Fetch RSS feed without buffering the body
+            response = requests.get(rss_url, headers=headers, stream=True, timeout=30)
+
+            if response.status_code == 304 and stale_data is not None:
+                response.close()
+                logging.info("RSS feed not modified, refreshing cached region data")
+                self._save_to_cache(cache_key, stale_data)
+                self._save_to_cache(validators_key, validators)
+                return stale_data
+
             response.raise_for_status()
+            validators = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
 
-            # Parse RSS feed
-            feed = feedparser.parse(response.content)
+            # Parse RSS feed straight from the response stream
+            response.raw.decode_content = True
+            with response:
+                feed = feedparser.parse(response.raw)
 
             region_data = {}
 
@@ -158,58 +339,37 @@ class AWSSSMDataFetcher:
                     # Extract information from RSS entry
                     title = entry.title
                     description = getattr(entry, "description", "")
-                    published = getattr(entry, "published", "")
                     link = getattr(entry, "link", "")
 
                     # Parse region code from title or description
                     # Example titles: "Asia Pacific (New Zealand) - ap-southeast-6"
-                    region_code_match = re.search(
-                        r"([a-z]{2}-[a-z]+-[0-9]{1,2})", title + " " + description
+                    region_code_match = _REGION_CODE_RE.search(
+                        title + " " + description
                     )
 
                     if region_code_match:
                         region_code = region_code_match.group(1)
 
                         # Extract region name (everything before the dash and region code)
-                        region_name_match = re.search(
-                            r"^(.+?)\s*-\s*" + re.escape(region_code), title
-                        )
+                        region_name_match = _region_name_re(region_code).search(title)
                         region_name = (
                             region_name_match.group(1).strip()
                             if region_name_match
                             else title.split("-")[0].strip()
                         )
 
-                        # Parse launch date from published date
-                        launch_date = "N/A"
-                        if published:
-                            try:
-                                # Try to parse various date formats
-                                parsed_date = datetime.strptime(
-                                    published, "%a, %d %b %Y %H:%M:%S %z"
-                                )
-                                launch_date = parsed_date.strftime("%Y-%m-%d")
-                            except ValueError:
-                                try:
-                                    parsed_date = datetime.strptime(
-                                        published, "%a, %d %b %Y %H:%M:%S GMT"
-                                    )
-                                    launch_date = parsed_date.strftime("%Y-%m-%d")
-                                except ValueError:
-                                    # Extract date from description if available
-                                    date_match = re.search(
-                                        r"(\w+ \d{1,2}, \d{4})", description
-                                    )
-                                    if date_match:
-                                        try:
-                                            parsed_date = datetime.strptime(
-                                                date_match.group(1), "%B %d, %Y"
-                                            )
-                                            launch_date = parsed_date.strftime(
-                                                "%Y-%m-%d"
-                                            )
-                                        except ValueError:
-                                            pass
+                        # feedparser has already parsed the published date
+                        published_parsed = getattr(entry, "published_parsed", None)
+                        if published_parsed:
+                            launch_date = time.strftime("%Y-%m-%d", published_parsed)
+                        else:
+                            # Extract date from description if available
+                            date_match = _DATE_TEXT_RE.search(description)
+                            launch_date = (
+                                _parse_rss_date(date_match.group(1))
+                                if date_match
+                                else "N/A"
+                            )
 
                         region_data[region_code] = {
                             "region_name": region_name,
@@ -229,6 +389,7 @@ class AWSSSMDataFetcher:
 
             # Save to cache
             self._save_to_cache(cache_key, region_data)
+            self._save_to_cache(validators_key, validators)
 
             logging.info(
                 f"Successfully fetched RSS data for {len(region_data)} regions"
@@ -239,68 +400,159 @@ class AWSSSMDataFetcher:
             logging.error(f"Failed to fetch RSS data: {e}")
             return {}
 
-    def fetch_all_ssm_parameters_by_path(
-        self, parameter_path: str, max_retries: int = 3, base_delay: float = 1.0
-    ) -> List[str]:
-        """Fetch all SSM parameters using get_parameters_by_path with pagination and throttling protection."""
-        logging.info(f"Fetching all SSM parameters by path: {parameter_path}")
+    def _list_parameter_names(self, parameter_path: str, recursive: bool) -> List[str]:
+        """List parameter names under a single path.
 
-        all_parameters = []
-        retry_count = 0
+        Throttling is handled by the client's adaptive retry mode, so errors
+        reaching here are final. They are logged and re-raised rather than
+        returning a truncated list that callers could mistake for a short one.
+        """
+        names = []
+        try:
+            paginator = self.ssm.get_paginator("get_parameters_by_path")
+            page_iterator = paginator.paginate(
+                Path=parameter_path,
+                Recursive=recursive,
+                PaginationConfig={"PageSize": 10},  # AWS limit
+            )
 
-        while retry_count <= max_retries:
-            try:
-                paginator = self.ssm.get_paginator("get_parameters_by_path")
-                page_iterator = paginator.paginate(
-                    Path=parameter_path,
-                    Recursive=True,
-                    MaxResults=10,  # Reduced to minimize throttling
-                )
+            for page in page_iterator:
+                for param in page["Parameters"]:
+                    names.append(param["Name"])
 
-                total_params = 0
-                page_count = 0
-                for page in page_iterator:
-                    for param in page["Parameters"]:
-                        all_parameters.append(param["Name"])
-                        total_params += 1
+        except (ClientError, BotoCoreError) as e:
+            logging.error(f"Failed to fetch parameters at path {parameter_path}: {e}")
+            raise
 
-                    page_count += 1
+        return names
 
-                    # Add delay between pages to avoid throttling
-                    if page_count % 5 == 0:  # Every 5 pages
-                        time.sleep(0.5)
+    def _walk_parameter_names(
+        self, parameter_path: str, fan_out: bool = False
+    ) -> Tuple[List[str], Optional[Exception]]:
+        """Walk all parameter names under a path.
 
-                    # Log progress every 50 parameters
-                    if total_params % 50 == 0:
-                        logging.info(f"Processed {total_params} parameters...")
+        NextTokens within one paginated walk are strictly sequential. With
+        fan_out, the tree is split instead: the first level is listed
+        non-recursively and each child is then walked recursively on its own
+        worker thread. A non-recursive listing only returns nodes that are
+        parameters themselves, so fan_out is only safe for trees where every
+        first-level child is one (e.g. /services/<code>).
 
+        Returns:
+            The names that were listed, and the first SSM error hit (None if
+            the walk completed). A failed subtree doesn't stop the others.
+        """
+        logging.info(f"Fetching all SSM parameters by path: {parameter_path}")
+
+        try:
+            top_level = (
+                self._list_parameter_names(parameter_path, False) if fan_out else []
+            )
+            if not top_level:
+                # Nothing to fan out over; walk the whole tree in one pagination
+                return self._list_parameter_names(parameter_path, True), None
+        except (ClientError, BotoCoreError) as e:
+            return [], e
+
+        all_parameters = list(top_level)
+        error: Optional[Exception] = None
+        futures = [
+            self._ssm_executor.submit(self._list_parameter_names, path, True)
+            for path in top_level
+        ]
+        for i, future in enumerate(futures, 1):
+            try:
+                all_parameters.extend(future.result())
+            except (ClientError, BotoCoreError) as e:
+                error = error or e
+
+            # Log progress every 50 subtrees
+            if i % 50 == 0:
                 logging.info(
-                    f"Found {total_params} total parameters at path {parameter_path}"
+                    f"Processed {i}/{len(top_level)} subtrees, {len(all_parameters)} parameters..."
                 )
-                break  # Success, exit retry loop
-
-            except ClientError as e:
-                if "ThrottlingException" in str(e) and retry_count < max_retries:
-                    retry_count += 1
-                    delay = base_delay * (2**retry_count)  # Exponential backoff
-                    logging.warning(
-                        f"Throttling detected, retrying in {delay}s (attempt {retry_count}/{max_retries})"
-                    )
-                    time.sleep(delay)
-                else:
-                    logging.error(
-                        f"Failed to fetch parameters at path {parameter_path}: {e}"
-                    )
-                    break
-            except Exception as e:
-                logging.error(
-                    f"Failed to fetch parameters at path {parameter_path}: {e}"
-                )
-                break
 
+        logging.info(
+            f"Found {len(all_parameters)} total parameters at path {parameter_path}"
+            + (" (incomplete)" if error else "")
+        )
+        return all_parameters, error
+
+    def fetch_all_ssm_parameters_by_path(self, parameter_path: str) -> List[str]:
+        """Fetch all SSM parameter names under a path.
+
+        Raises:
+            ClientError, BotoCoreError: If any part of the tree failed to list
+        """
+        all_parameters, error = self._walk_parameter_names(parameter_path)
+        if error is not None:
+            raise error
         return all_parameters
 
-    def discover_regions_from_ssm(self) -> List[str]:
+    @functools.cached_property
+    def _global_infrastructure(self) -> Dict[str, Any]:
+        """Regions, services and service-to-region edges from one SSM traversal.
+
+        A single recursive walk of the services subtree yields every service
+        code and every /services/<code>/regions/<region> edge, so service
+        discovery and region mapping share it. Regions only need the first
+        level of the regions subtree (walking it recursively would list every
+        region/service pair a second time).
+
+        The "regions_complete" and "services_complete" flags are False when a
+        listing failed part-way; callers must not cache results derived from
+        an incomplete walk.
+        """
+        regions = set()
+        regions_complete = True
+        try:
+            region_names = self._list_parameter_names(
+                "/aws/service/global-infrastructure/regions", False
+            )
+        except (ClientError, BotoCoreError):
+            region_names = []
+            regions_complete = False
+        for name in region_names:
+            # Extract region code from paths like /aws/service/global-infrastructure/regions/us-east-1
+            region_match = _REGIONS_PATH_RE.search(name)
+            if region_match:
+                regions.add(region_match.group(1))
+
+        services = set()
+        service_regions: Dict[str, List[str]] = defaultdict(list)
+        # Every /services/<code> node is itself a parameter, so the subtrees
+        # can be walked in parallel
+        service_names, services_error = self._walk_parameter_names(
+            "/aws/service/global-infrastructure/services", fan_out=True
+        )
+        services_complete = services_error is None
+        for name in service_names:
+            edge_match = _SERVICE_REGION_EDGE_RE.search(name)
+            if edge_match:
+                service_regions[edge_match.group(1)].append(edge_match.group(2))
+
+            # Matches both /services/ec2 and /services/ec2/...
+            service_match = _SERVICES_PATH_MID_RE.search(name)
+            if not service_match:
+                service_match = _SERVICES_PATH_RE.search(name)
+            if service_match:
+                services.add(service_match.group(1))
+
+        # Fill gaps in the region listing from the service edges
+        if len(regions) < 20:
+            for edge_regions in service_regions.values():
+                regions.update(edge_regions)
+            regions_complete = regions_complete and services_complete
+
+        return {
+            "regions": regions,
+            "services": services,
+            "service_regions": dict(service_regions),
+            "regions_complete": regions_complete,
+            "services_complete": services_complete,
+        }
+
+    def discover_regions_from_ssm(self) -> Sequence[str]:
         """Discover all AWS regions from SSM parameters with targeted approach."""
         cache_key = "discovered_regions"
 
@@ -312,51 +564,16 @@ class AWSSSMDataFetcher:
 
         logging.info("Discovering all regions from SSM parameters...")
 
-        # Get region parameters with limited pagination for efficiency
         try:
-            regions = set()
-            paginator = self.ssm.get_paginator("get_parameters_by_path")
-            page_iterator = paginator.paginate(
-                Path="/aws/service/global-infrastructure/regions",
-                Recursive=False,  # Only first level to get region directories
-                MaxResults=10,  # AWS limit for get_parameters_by_path
-            )
-
-            # Process only first few pages to get most regions efficiently
-            pages_processed = 0
-            for page in page_iterator:
-                for param in page["Parameters"]:
-                    # Extract region code from paths like /aws/service/global-infrastructure/regions/us-east-1
-                    region_match = re.search(r"/regions/([a-z0-9-]+)$", param["Name"])
-                    if region_match:
-                        region_code = region_match.group(1)
-                        regions.add(region_code)
-
-                pages_processed += 1
-                if pages_processed >= 10:  # Limit to first 10 pages for efficiency
-                    break
-
-            # If we didn't get many regions, try the recursive approach but with more targeted extraction
-            if len(regions) < 20:
-                logging.info(
-                    "Limited regions found, trying targeted parameter sampling..."
-                )
-                sample_page = self.ssm.get_parameters_by_path(
-                    Path="/aws/service/global-infrastructure/regions",
-                    Recursive=True,
-                    MaxResults=10,
-                )
-
-                for param in sample_page["Parameters"]:
-                    region_match = re.search(r"/regions/([a-z0-9-]+)/", param["Name"])
-                    if region_match:
-                        region_code = region_match.group(1)
-                        regions.add(region_code)
-
-            discovered_regions = sorted(list(regions))
+            # Frozen so callers can't mutate the cached value
+            infrastructure = self._global_infrastructure
+            discovered_regions = tuple(sorted(infrastructure["regions"]))
 
-            # Save to cache
-            self._save_to_cache(cache_key, discovered_regions)
+            # Save to cache, unless the walk behind it failed part-way
+            if infrastructure["regions_complete"]:
+                self._save_to_cache(cache_key, discovered_regions)
+            else:
+                logging.warning("Region listing incomplete; not caching regions")
 
             logging.info(f"Discovered {len(discovered_regions)} regions from SSM")
             return discovered_regions
@@ -365,7 +582,7 @@ class AWSSSMDataFetcher:
             logging.error(f"Failed to discover regions from SSM: {e}")
             return []
 
-    def discover_services_from_ssm(self) -> List[str]:
+    def discover_services_from_ssm(self) -> Sequence[str]:
         """Discover all AWS services from SSM parameters with targeted approach."""
         cache_key = "discovered_services"
 
@@ -377,59 +594,16 @@ class AWSSSMDataFetcher:
 
         logging.info("Discovering all services from SSM parameters...")
 
-        # Get service parameters with limited pagination for efficiency
         try:
-            services = set()
-            paginator = self.ssm.get_paginator("get_parameters_by_path")
-            page_iterator = paginator.paginate(
-                Path="/aws/service/global-infrastructure/services",
-                Recursive=False,  # Only first level to get service directories
-                MaxResults=10,  # AWS limit for get_parameters_by_path
-            )
-
-            # Process ALL pages to get complete service list
-            pages_processed = 0
-            for page in page_iterator:
-                for param in page["Parameters"]:
-                    # Extract service code from paths like /aws/service/global-infrastructure/services/ec2
-                    service_match = re.search(r"/services/([a-z0-9-]+)$", param["Name"])
-                    if service_match:
-                        service_code = service_match.group(1)
-                        services.add(service_code)
-
-                pages_processed += 1
-
-                # Log progress every 50 pages
-                if pages_processed % 50 == 0:
-                    logging.info(
-                        f"Processed {pages_processed} pages, found {len(services)} unique services so far..."
-                    )
+            # Frozen so callers can't mutate the cached value
+            infrastructure = self._global_infrastructure
+            discovered_services = tuple(sorted(infrastructure["services"]))
 
-                # Add small delay every 25 pages to avoid throttling
-                if pages_processed % 25 == 0:
-                    time.sleep(0.2)
-
-            # If we still don't have many services, try recursive approach to fill gaps
-            if len(services) < 300:
-                logging.info(
-                    f"Found {len(services)} services with non-recursive scan, trying recursive approach to find more..."
-                )
-
-                # Use the full pagination method we created earlier
-                all_service_params = self.fetch_all_ssm_parameters_by_path(
-                    "/aws/service/global-infrastructure/services"
-                )
-
-                for param in all_service_params:
-                    service_match = re.search(r"/services/([a-z0-9-]+)/", param)
-                    if service_match:
-                        service_code = service_match.group(1)
-                        services.add(service_code)
-
-            discovered_services = sorted(list(services))
-
-            # Save to cache
-            self._save_to_cache(cache_key, discovered_services)
+            # Save to cache, unless the walk behind it failed part-way
+            if infrastructure["services_complete"]:
+                self._save_to_cache(cache_key, discovered_services)
+            else:
+                logging.warning("Services walk incomplete; not caching services")
 
             logging.info(f"Discovered {len(discovered_services)} services from SSM")
             return discovered_services
@@ -439,7 +613,7 @@ class AWSSSMDataFetcher:
             return []
 
     def get_services_per_region_proper(
-        self, all_services: List[str]
+        self, all_services: Sequence[str]
     ) -> Dict[str, List[str]]:
         """Map services to regions using actual AWS SSM data like the AWS services project."""
         cache_key = "region_services_mapping"
@@ -451,69 +625,95 @@ class AWSSSMDataFetcher:
             return cached_data
 
         logging.info("Mapping services to regions using actual AWS SSM data...")
-        region_services = {}
+        region_services: Dict[str, set] = defaultdict(set)
 
-        try:
-            for i, service_code in enumerate(all_services, 1):
-                logging.info(
-                    f"Processing service {i:3d}/{len(all_services)}: {service_code}"
-                )
-
-                # Get regions where this service is available using AWS SSM path
-                service_path = f"/aws/service/global-infrastructure/services/{service_code}/regions"
+        def _fetch_service_regions(service_code: str) -> Tuple[str, List[str]]:
+            """Return the region codes where a single service is available."""
+            # Get regions where this service is available using AWS SSM path
+            service_path = (
+                f"/aws/service/global-infrastructure/services/{service_code}/regions"
+            )
+            paginator = self.ssm.get_paginator("get_parameters_by_path")
+            page_iterator = paginator.paginate(
+                Path=service_path,
+                Recursive=False,
+                PaginationConfig={"PageSize": 10},
+            )
 
-                try:
-                    paginator = self.ssm.get_paginator("get_parameters_by_path")
-                    page_iterator = paginator.paginate(
-                        Path=service_path, Recursive=False, MaxResults=10
-                    )
+            service_regions = []
+            for page in page_iterator:
+                for param in page["Parameters"]:
+                    # Parameter value contains the region code
+                    if param["Value"]:
+                        service_regions.append(param["Value"])
+            return service_code, service_regions
 
-                    service_regions = []
-                    for page in page_iterator:
-                        for param in page["Parameters"]:
-                            # Parameter value contains the region code
-                            region_code = param["Value"]
-                            if region_code:
-                                service_regions.append(region_code)
-                                # Add to region_services mapping
-                                if region_code not in region_services:
-                                    region_services[region_code] = []
-                                if service_code not in region_services[region_code]:
-                                    region_services[region_code].append(service_code)
+        failed_services = 0
+        try:
+            # Reuse the edges collected by the shared services walk, but only
+            # if it completed; a failed subtree would leave a service with no
+            # edges while others still have some
+            infrastructure = self._global_infrastructure
+            service_edges = infrastructure["service_regions"]
+            if infrastructure["services_complete"] and service_edges:
+                for service_code in all_services:
+                    for region_code in service_edges.get(service_code, []):
+                        region_services[region_code].add(service_code)
+            else:
+                # Walk failed or returned nothing; query each service directly
+                futures = {
+                    self._ssm_executor.submit(
+                        _fetch_service_regions, service_code
+                    ): service_code
+                    for service_code in all_services
+                }
 
-                    logging.info(
-                        f"  {service_code} available in {len(service_regions)} regions"
-                    )
+                for i, future in enumerate(as_completed(futures), 1):
+                    service_code = futures[future]
+                    try:
+                        _, service_regions = future.result()
+                    except Exception as e:
+                        logging.warning(
+                            f"Failed to get regions for service {service_code}: {e}"
+                        )
+                        failed_services += 1
+                        continue
 
-                    # Small delay to avoid throttling
-                    if i % 10 == 0:
-                        time.sleep(0.5)
+                    # Merge into region_services mapping (main thread only)
+                    for region_code in service_regions:
+                        region_services[region_code].add(service_code)
 
-                except Exception as e:
-                    logging.warning(
-                        f"Failed to get regions for service {service_code}: {e}"
+                    logging.info(
+                        f"Processed service {i:3d}/{len(all_services)}: "
+                        f"{service_code} available in {len(service_regions)} regions"
                     )
-                    continue
 
             # Sort services within each region
-            for region_code in region_services:
-                region_services[region_code].sort()
+            region_mapping = {
+                region_code: sorted(services)
+                for region_code, services in region_services.items()
+            }
 
-            # Cache the results
-            self._save_to_cache(cache_key, region_services)
+            # Cache the results only if every service was mapped
+            if failed_services:
+                logging.warning(
+                    f"{failed_services} services failed to map; not caching mapping"
+                )
+            else:
+                self._save_to_cache(cache_key, region_mapping)
 
-            total_mappings = sum(len(services) for services in region_services.values())
+            total_mappings = sum(len(services) for services in region_mapping.values())
             logging.info(
-                f"Successfully mapped {len(region_services)} regions with {total_mappings} total service mappings"
+                f"Successfully mapped {len(region_mapping)} regions with {total_mappings} total service mappings"
             )
 
-            return region_services
+            return region_mapping
 
         except Exception as e:
             logging.error(f"Failed to map services to regions: {e}")
             return {}
 
-    def fetch_availability_zones(self, regions: List[str]) -> Dict[str, int]:
+    def fetch_availability_zones(self, regions: Sequence[str]) -> Dict[str, int]:
         """Fetch availability zone counts for regions from SSM with full pagination."""
         cache_key = "availability_zones"
 
@@ -526,100 +726,57 @@ class AWSSSMDataFetcher:
         logging.info("Fetching availability zone data with full pagination...")
 
         # Get ALL availability zone parameters with pagination
-        all_az_params = self.fetch_all_ssm_parameters_by_path(
-            "/aws/service/global-infrastructure/availability-zones"
-        )
-
-        az_data = {}
-
-        # Process each region to count its AZs
-        for region in regions:
-            az_count = 0
+        walk_complete = True
+        try:
+            all_az_params = self.fetch_all_ssm_parameters_by_path(
+                "/aws/service/global-infrastructure/availability-zones"
+            )
+        except (ClientError, BotoCoreError):
+            # Serve the fallback counts for this run only; a failed walk must
+            # not be cached as if SSM had no AZ data
+            logging.warning("AZ parameter walk failed, using fallback AZ counts")
+            all_az_params = []
+            walk_complete = False
+
+        # Resolve each AZ's parent region once, in batches of 10 (SSM limit)
+        region_param_names = [p for p in all_az_params if "/region" in p]
+        region_results = self.get_parameters_batch(region_param_names)
+        az_to_region = {name: value for name, value in region_results.items() if value}
+
+        # Fallback to known AZ counts for established regions
+        common_az_counts = {
+            "us-east-1": 6,
+            "us-east-2": 3,
+            "us-west-1": 3,
+            "us-west-2": 4,
+            "eu-west-1": 3,
+            "eu-west-2": 3,
+            "eu-west-3": 3,
+            "eu-central-1": 3,
+            "ap-northeast-1": 3,
+            "ap-northeast-2": 4,
+            "ap-southeast-1": 3,
+            "ap-southeast-2": 3,
+            "ap-south-1": 3,
+            "ca-central-1": 3,
+            "sa-east-1": 3,
+        }
 
-            # Look for AZ parameters that belong to this region
-            for param_name in all_az_params:
-                if "/region" in param_name:
-                    try:
-                        # Get the region for this AZ parameter
-                        response = self.ssm.get_parameter(Name=param_name)
-                        if response["Parameter"]["Value"] == region:
-                            az_count += 1
-                    except Exception as e:
-                        # If we can't get the parameter, try pattern matching as fallback
-                        az_match = re.search(
-                            r"/availability-zones/([^/]+)/", param_name
-                        )
-                        if az_match:
-                            az_code = az_match.group(1)
-                            # Common AZ to region mappings
-                            region_mappings = {
-                                "use1": "us-east-1",
-                                "use2": "us-east-2",
-                                "usw1": "us-west-1",
-                                "usw2": "us-west-2",
-                                "euw1": "eu-west-1",
-                                "euw2": "eu-west-2",
-                                "euw3": "eu-west-3",
-                                "euc1": "eu-central-1",
-                                "euc2": "eu-central-2",
-                                "eun1": "eu-north-1",
-                                "eus1": "eu-south-1",
-                                "eus2": "eu-south-2",
-                                "apne1": "ap-northeast-1",
-                                "apne2": "ap-northeast-2",
-                                "apne3": "ap-northeast-3",
-                                "aps1": "ap-south-1",
-                                "aps2": "ap-south-2",
-                                "apse1": "ap-southeast-1",
-                                "apse2": "ap-southeast-2",
-                                "apse3": "ap-southeast-3",
-                                "apse4": "ap-southeast-4",
-                                "ape1": "ap-east-1",
-                                "ape2": "ap-east-2",
-                                "cac1": "ca-central-1",
-                                "caw1": "ca-west-1",
-                                "sae1": "sa-east-1",
-                                "afs1": "af-south-1",
-                                "mes1": "me-south-1",
-                                "mec1": "me-central-1",
-                                "ilc1": "il-central-1",
-                            }
-
-                            az_region_prefix = az_code.rstrip("0123456789-az")
-                            if region_mappings.get(az_region_prefix) == region:
-                                az_count += 1
-
-            if az_count > 0:
-                az_data[region] = az_count
-                logging.debug(f"Found {az_count} AZs for {region}")
-            else:
-                # Fallback to known AZ counts for established regions
-                common_az_counts = {
-                    "us-east-1": 6,
-                    "us-east-2": 3,
-                    "us-west-1": 3,
-                    "us-west-2": 4,
-                    "eu-west-1": 3,
-                    "eu-west-2": 3,
-                    "eu-west-3": 3,
-                    "eu-central-1": 3,
-                    "ap-northeast-1": 3,
-                    "ap-northeast-2": 4,
-                    "ap-southeast-1": 3,
-                    "ap-southeast-2": 3,
-                    "ap-south-1": 3,
-                    "ca-central-1": 3,
-                    "sa-east-1": 3,
-                }
-                az_data[region] = common_az_counts.get(region, 3)  # Default to 3 AZs
+        # Count AZs per region, defaulting to 3 AZs for unknown regions
+        az_counts = Counter(az_to_region.values())
+        az_data = {
+            region: az_counts.get(region, common_az_counts.get(region, 3))
+            for region in regions
+        }
 
         # Save to cache
-        self._save_to_cache(cache_key, az_data)
+        if walk_complete:
+            self._save_to_cache(cache_key, az_data)
 
         logging.info(f"Successfully fetched AZ data for {len(az_data)} regions")
         return az_data
 
-    def fetch_regions(self) -> List[str]:
+    def fetch_regions(self) -> Sequence[str]:
         """Get list of AWS regions by discovering them from SSM parameters."""
         logging.info("Discovering AWS regions from SSM parameters...")
 
@@ -670,7 +827,7 @@ class AWSSSMDataFetcher:
             logging.info(f"Using {len(fallback_regions)} fallback regions")
             return fallback_regions
 
-    def fetch_services(self) -> List[str]:
+    def fetch_services(self) -> Sequence[str]:
         """Get list of AWS services by discovering them from SSM parameters."""
         logging.info("Discovering AWS services from SSM parameters...")
 
@@ -864,284 +1021,75 @@ class AWSSSMDataFetcher:
             logging.info(f"Using {len(fallback_services)} fallback services")
             return fallback_services
 
-    def fetch_region_names(self, regions: List[str]) -> Dict[str, str]:
-        """Fetch human-readable names for all regions."""
-        cache_key = "region_names"
-
-        # Try to load from cache first
-        cached_data = self._load_from_cache(cache_key)
-        if cached_data is not None:
-            # Filter cached data to only include requested regions
-            filtered_data = {k: v for k, v in cached_data.items() if k in regions}
-            if len(filtered_data) == len(regions):
-                logging.info(f"Using cached region names for {len(regions)} regions")
-                return filtered_data
-
-        logging.info("Fetching region display names...")
-
-        # Build parameter paths for region names
-        region_name_paths = [
-            f"/aws/service/global-infrastructure/regions/{region}/longName"
-            for region in regions
-        ]
-
-        # Get all region names in batches
-        region_name_results = self.get_parameters_batch(region_name_paths)
-
-        # Map region codes to names
-        region_names = {}
-        for region in regions:
-            path = f"/aws/service/global-infrastructure/regions/{region}/longName"
-            name = region_name_results.get(path)
-            if name:
-                region_names[region] = name
-            else:
-                logging.warning(f"No display name found for region: {region}")
-                region_names[region] = region  # Fallback to code
-
-        # Save to cache
-        self._save_to_cache(cache_key, region_names)
-
-        logging.info(f"Successfully fetched names for {len(region_names)} regions")
-        return region_names
-
-    def fetch_service_names(self, services: List[str]) -> Dict[str, str]:
-        """Fetch human-readable names for all services."""
-        cache_key = "service_names"
-
-        # Try to load from cache first
-        cached_data = self._load_from_cache(cache_key)
-        if cached_data is not None:
-            # Filter cached data to only include requested services
-            filtered_data = {k: v for k, v in cached_data.items() if k in services}
-            if len(filtered_data) == len(services):
-                logging.info(f"Using cached service names for {len(services)} services")
-                return filtered_data
-
-        logging.info("Fetching service display names...")
-
-        # Build parameter paths for service names
-        service_name_paths = [
-            f"/aws/service/global-infrastructure/services/{service}/longName"
-            for service in services
-        ]
-
-        # Get all service names in batches
-        service_name_results = self.get_parameters_batch(service_name_paths)
-
-        # Map service codes to names
-        service_names = {}
-        for service in services:
-            path = f"/aws/service/global-infrastructure/services/{service}/longName"
-            name = service_name_results.get(path)
-            if name:
-                service_names[service] = name
-            else:
-                logging.warning(f"No display name found for service: {service}")
-                service_names[service] = service  # Fallback to code
-
-        # Save to cache
-        self._save_to_cache(cache_key, service_names)
+    def _fetch_display_names(self, kind: str, codes: Sequence[str]) -> Dict[str, str]:
+        """Fetch longName values for regions or services, one cache entry per code.
 
-        logging.info(f"Successfully fetched names for {len(service_names)} services")
-        return service_names
+        Entries are stored as {code: {"value": name, "ts": epoch}} so only codes
+        that are new or expired are requested from SSM. Codes SSM has no name for
+        are stored with a None value and retried after a shorter TTL; codes whose
+        request failed are not stored at all. Either way callers get the code
+        itself as the display name.
 
-    def fetch_regional_services(
-        self, regions: List[str], services: List[str]
-    ) -> Dict[str, List[str]]:
-        """DEPRECATED: Test which services are available in each region by checking service names.
+        Args:
+            kind: "region" or "service"
+            codes: Region or service codes to resolve
 
-        This method has been replaced by get_services_per_region_proper() which uses actual AWS SSM data
-        instead of estimation patterns. This method is kept for backward compatibility but should not be used.
+        Returns:
+            Mapping of every requested code to its display name
         """
-        logging.info("Testing regional service availability...")
-
-        regional_services = {}
-
-        for region in regions:
-            logging.info(f"Testing services for region: {region}")
-            available_services = []
-
-            # Use all discovered services
-            test_services = services  # Use all discovered services
-
-            # Build parameter paths to test
-            test_paths = [
-                f"/aws/service/global-infrastructure/services/{service}/longName"
-                for service in test_services
-            ]
-
-            # Get service names (this validates the service exists)
-            service_name_results = self.get_parameters_batch(test_paths)
-
-            # Implement realistic regional service availability based on AWS patterns
-            # Since regional service parameters don't exist in SSM, use service availability logic
-
-            # Core services available in all regions
-            core_services = {
-                "ec2",
-                "s3",
-                "iam",
-                "cloudformation",
-                "cloudwatch",
-                "sns",
-                "sqs",
-                "lambda",
-                "dynamodb",
-                "rds",
-                "elasticloadbalancing",
-                "autoscaling",
-                "route53",
-                "cloudtrail",
-                "config",
-                "kms",
-                "ssm",
-                "sts",
-            }
+        cache_key = f"{kind}_name_entries"
+        ttl = self.config.cache_hours * 3600
+        now = time.time()
+
+        entries = self.cache_manager.get_stale(cache_key) or {}
+        names = {}
+        misses = []
+        for code in codes:
+            entry = entries.get(code)
+            if entry is not None:
+                age = now - entry["ts"]
+                if age < (ttl if entry["value"] is not None else _NEGATIVE_NAME_TTL):
+                    names[code] = entry["value"] or code
+                    continue
+            misses.append(code)
 
-            # Extended services for established regions
-            extended_services = {
-                "acm",
-                "apigateway",
-                "backup",
-                "batch",
-                "codebuild",
-                "codecommit",
-                "codedeploy",
-                "codepipeline",
-                "ecr",
-                "ecs",
-                "efs",
-                "eks",
-                "elasticache",
-                "emr",
-                "events",
-                "firehose",
-                "glue",
-                "kinesis",
-                "logs",
-                "secretsmanager",
-                "stepfunctions",
-                "xray",
-                "application-autoscaling",
-                "elasticfilesystem",
-                "elasticmapreduce",
-                "waf",
-                "shield",
-                "guardduty",
-                "inspector",
-            }
+        if not misses:
+            logging.info(f"Using cached {kind} names for {len(codes)} {kind}s")
+            return names
 
-            # Premium services for major regions only
-            premium_services = {
-                "sagemaker",
-                "bedrock",
-                "comprehend",
-                "rekognition",
-                "textract",
-                "translate",
-                "transcribe",
-                "polly",
-                "lex",
-                "personalize",
-                "forecast",
-                "frauddetector",
-                "kendra",
-                "connect",
-                "chime",
-                "workspaces",
-                "workdocs",
-                "workmail",
-                "appstream",
-                "worklink",
-                "gamelift",
-                "robomaker",
-                "groundstation",
-            }
+        logging.info(
+            f"Fetching {kind} display names for {len(misses)} of {len(codes)} {kind}s..."
+        )
 
-            # Determine service availability based on region tier
-            if region in ["us-east-1", "us-west-2", "eu-west-1"]:
-                # Tier 1: Major global regions - get most services
-                available_service_set = (
-                    core_services | extended_services | premium_services
-                )
-                # Add some additional cutting-edge services
-                additional_services = {
-                    "amplify",
-                    "appsync",
-                    "cognito-idp",
-                    "pinpoint",
-                    "mobiletargeting",
-                }
-                available_service_set |= additional_services
+        results = self.get_parameters_batch_mapped(
+            misses, f"/aws/service/global-infrastructure/{kind}s/{{}}/longName"
+        )
 
-            elif region in [
-                "us-east-2",
-                "ap-southeast-1",
-                "ap-northeast-1",
-                "eu-central-1",
-                "ca-central-1",
-            ]:
-                # Tier 2: Major regional hubs - get core + extended + some premium
-                available_service_set = core_services | extended_services
-                # Add subset of premium services
-                available_service_set |= {
-                    "sagemaker",
-                    "comprehend",
-                    "rekognition",
-                    "connect",
-                }
+        for code in misses:
+            if code not in results:
+                # Request failed; retry next run instead of caching a miss
+                names[code] = code
+                continue
 
-            elif region in [
-                "ap-south-1",
-                "ap-northeast-2",
-                "eu-west-2",
-                "us-west-1",
-                "sa-east-1",
-            ]:
-                # Tier 3: Established regions - get core + extended services
-                available_service_set = core_services | extended_services
+            name = results[code]
+            if not name:
+                logging.warning(f"No display name found for {kind}: {code}")
+            entries[code] = {"value": name or None, "ts": now}
+            names[code] = name or code  # Fallback to code
 
-            elif region in [
-                "af-south-1",
-                "ap-east-1",
-                "eu-south-1",
-                "me-south-1",
-                "me-central-1",
-            ]:
-                # Tier 4: Newer regions - get core services + some extended
-                available_service_set = core_services
-                basic_extended = {
-                    "acm",
-                    "apigateway",
-                    "backup",
-                    "ecr",
-                    "ecs",
-                    "efs",
-                    "elasticache",
-                    "logs",
-                }
-                available_service_set |= basic_extended
+        # Save the merged entries, including ones not requested this run
+        self._save_to_cache(cache_key, entries)
 
-            else:
-                # Tier 5: Newest/smallest regions - core services only
-                available_service_set = core_services
-
-            # Filter to only include services that actually exist in our discovered list
-            for service in test_services:
-                path = f"/aws/service/global-infrastructure/services/{service}/longName"
-                if (
-                    service_name_results.get(path) is not None
-                    and service in available_service_set
-                ):
-                    available_services.append(service)
+        logging.info(f"Successfully fetched names for {len(misses)} {kind}s")
+        return names
 
-            regional_services[region] = sorted(available_services)
-            logging.info(
-                f"Regional availability: {len(available_services)} services available in {region}"
-            )
+    def fetch_region_names(self, regions: Sequence[str]) -> Dict[str, str]:
+        """Fetch human-readable names for all regions."""
+        return self._fetch_display_names("region", regions)
 
-        return regional_services
+    def fetch_service_names(self, services: Sequence[str]) -> Dict[str, str]:
+        """Fetch human-readable names for all services."""
+        return self._fetch_display_names("service", services)
 
     def generate_data_matrix(
         self,
@@ -1149,74 +1097,72 @@ class AWSSSMDataFetcher:
         region_names: Dict[str, str],
         service_names: Dict[str, str],
         regional_services: Dict[str, List[str]],
-    ) -> List[Dict]:
-        """Generate the data matrix in the same format as the Excel file."""
+    ) -> Dict[str, List[str]]:
+        """Generate the data matrix in the same format as the Excel file.
+
+        The matrix is built column-wise ({column name: values}) rather than as
+        one dict per row, so it wraps into a DataFrame without per-row overhead.
+        """
         logging.info("Generating data matrix...")
 
-        data = []
-        total_combinations = 0
+        region_code_col = []
+        region_name_col = []
+        service_code_col = []
+        service_name_col = []
 
         for region_code in regions:
             region_name = region_names.get(region_code, region_code)
             services_in_region = regional_services.get(region_code, [])
 
-            for service_code in services_in_region:
-                service_name = service_names.get(service_code, service_code)
-
-                data.append(
-                    {
-                        "Region Code": region_code,
-                        "Region Name": region_name,
-                        "Service Code": service_code,
-                        "Service Name": service_name,
-                    }
-                )
-                total_combinations += 1
+            region_code_col.extend([region_code] * len(services_in_region))
+            region_name_col.extend([region_name] * len(services_in_region))
+            service_code_col.extend(services_in_region)
+            service_name_col.extend(
+                service_names.get(service_code, service_code)
+                for service_code in services_in_region
+            )
 
-        logging.info(f"Generated {total_combinations} region-service combinations")
-        return data
+        logging.info(f"Generated {len(region_code_col)} region-service combinations")
+        return {
+            "Region Code": region_code_col,
+            "Region Name": region_name_col,
+            "Service Code": service_code_col,
+            "Service Name": service_name_col,
+        }
 
-    def generate_service_matrix(self, data: List[Dict]) -> pd.DataFrame:
+    def generate_service_matrix(self, df: pd.DataFrame) -> pd.DataFrame:
         """Generate service matrix showing which services are available in which regions."""
-        # Create a pivot table
-        df = pd.DataFrame(data)
-
-        # Create matrix with services as rows and regions as columns
-        matrix_data = []
-
-        # Get unique services and regions
-        services = sorted(df["Service Name"].unique())
-        regions = sorted(df["Region Code"].unique())
-
-        for service in services:
-            row = {"Service": service}
-            service_regions = set(df[df["Service Name"] == service]["Region Code"])
-
-            for region in regions:
-                row[region] = "✓" if region in service_regions else "✗"
-
-            matrix_data.append(row)
+        # One crosstab pass counts every service/region pair; rows and columns
+        # come back sorted, matching the previous per-service loop
+        counts = pd.crosstab(df["Service Name"], df["Region Code"])
+        counts = counts.reindex(columns=sorted(df["Region Code"].unique()))
+
+        matrix = pd.DataFrame(
+            np.where(counts.values > 0, "✓", "✗"),
+            index=counts.index,
+            columns=list(counts.columns),
+        )
+        matrix.index.name = "Service"
 
-        return pd.DataFrame(matrix_data)
+        return matrix.reset_index()
 
     def generate_region_summary(
         self,
-        data: List[Dict],
+        df: pd.DataFrame,
         region_names: Dict[str, str],
         rss_data: Dict[str, Dict] = None,
         az_data: Dict[str, int] = None,
         all_services: List[str] = None,
+        by_region: pd.Series = None,
     ) -> pd.DataFrame:
         """Generate region summary with service counts and RSS launch dates."""
-        df = pd.DataFrame(data)
+        if by_region is None:
+            by_region = df.groupby("Region Code", observed=True).size()
 
         summary_data = []
-        for region_code in sorted(df["Region Code"].unique()):
-            region_data = df[df["Region Code"] == region_code]
-
-            # Use the actual number of services in the data for this region
-            service_count = len(region_data)
-
+        # Each row is a service available in the region, and the groupby index
+        # is already sorted by region code
+        for region_code, service_count in by_region.items():
             # Get RSS data for this region
             rss_region_data = (rss_data or {}).get(region_code, {})
 
@@ -1244,154 +1190,16 @@ class AWSSSMDataFetcher:
 
         return pd.DataFrame(summary_data)
 
-    def estimate_service_regional_availability(
-        self, service_code: str, service_names: Dict[str, str]
-    ) -> int:
-        """DEPRECATED: Estimate how many regions a service is available in based on service patterns and SSM data.
-
-        This method has been replaced by the proper AWS SSM data mapping approach in get_services_per_region_proper()
-        and generate_service_summary(). This method is kept for backward compatibility but should not be used.
-        """
-
-        # Check if service exists globally by checking its longName parameter
-        try:
-            service_param = (
-                f"/aws/service/global-infrastructure/services/{service_code}/longName"
-            )
-            service_exists = self.get_parameter_value(service_param)
-
-            if not service_exists:
-                return 0  # Service doesn't exist
-
-        except:
-            return 0  # Service doesn't exist or not accessible
-
-        # Service exists globally, now estimate regional availability based on service type and patterns
-        service_name = service_names.get(service_code, service_code).lower()
-
-        # Global/Universal services (available in all regions)
-        universal_services = {
-            # Global AWS services
-            "iam",
-            "cloudfront",
-            "route53",
-            "waf",
-            "shield",
-            "cloudformation",
-            "cloudwatch",
-            "cloudtrail",
-            "config",
-            "sns",
-            "sqs",
-            "s3",
-            "sts",
-            # Core compute/storage services that are truly universal
-            "ec2",
-            "lambda",
-            "dynamodb",
-            "rds",
-            "elasticloadbalancing",
-            "autoscaling",
-            "ebs",
-            "kms",
-            "ssm",
-            "secretsmanager",
-        }
-
-        # Core regional services (available in most regions ~92%)
-        core_regional_services = {
-            "elasticache",
-            "efs",
-            "fsx",
-            "backup",
-            "batch",
-            "ecr",
-            "ecs",
-        }
-
-        # Developer/integration services (available in major regions)
-        developer_services = {
-            "apigateway",
-            "codebuild",
-            "codecommit",
-            "codedeploy",
-            "codepipeline",
-            "ecr",
-            "ecs",
-            "eks",
-            "batch",
-            "stepfunctions",
-            "eventbridge",
-            "backup",
-        }
-
-        # Analytics/ML services (available in fewer regions)
-        analytics_ml_services = {
-            "sagemaker",
-            "comprehend",
-            "rekognition",
-            "textract",
-            "translate",
-            "transcribe",
-            "polly",
-            "lex",
-            "bedrock",
-            "kendra",
-            "forecast",
-        }
-
-        # Specialized/new services (limited availability)
-        specialized_services = {
-            "braket",
-            "groundstation",
-            "robomaker",
-            "deeplens",
-            "devicefarm",
-            "gamelift",
-            "lumberyard",
-            "sumerian",
-            "honeycode",
-        }
-
-        # Determine availability based on service type
-        if service_code in universal_services or "global" in service_name:
-            return 38  # Available in all regions (100%)
-        elif service_code in core_regional_services:
-            return 35  # Available in most regions (92%)
-        elif service_code in developer_services or any(
-            keyword in service_name
-            for keyword in ["api", "code", "container", "serverless"]
-        ):
-            return 25  # Available in major regions (66%)
-        elif service_code in analytics_ml_services or any(
-            keyword in service_name
-            for keyword in ["ml", "ai", "machine learning", "analytics"]
-        ):
-            return 8  # Available in ML regions (21%)
-        elif service_code in specialized_services or any(
-            keyword in service_name
-            for keyword in ["iot", "game", "quantum", "satellite"]
-        ):
-            return 3  # Available in few regions (8%)
-        else:
-            # For unknown services, make educated guess based on name patterns
-            if any(keyword in service_name for keyword in ["aws", "amazon", "elastic"]):
-                return 20  # Likely mainstream service (53%)
-            elif "beta" in service_name or "preview" in service_name:
-                return 2  # Limited beta service (5%)
-            else:
-                return 12  # Default moderate availability (32%)
-
-        return 0
-
     def generate_service_summary(
         self,
-        data: List[Dict],
+        df: pd.DataFrame,
         all_services: List[str] = None,
         service_names: Dict[str, str] = None,
+        by_service: pd.Series = None,
     ) -> pd.DataFrame:
         """Generate service summary with region counts and coverage for ALL discovered services."""
-        df = pd.DataFrame(data)
+        if by_service is None:
+            by_service = df.groupby("Service Code", observed=True).size()
         total_regions = 38  # Use known total region count
         all_regions = [
             "af-south-1",
@@ -1439,42 +1247,34 @@ class AWSSSMDataFetcher:
         # If all_services provided, check actual regional availability for each service
         if all_services and service_names:
             logging.info(
-                "Checking actual regional availability for all 395 services..."
+                f"Checking actual regional availability for all {len(all_services)} services..."
             )
 
-            for i, service_code in enumerate(sorted(all_services)):
-                # Get service name from service_names dict
-                service_name = service_names.get(service_code, service_code)
+            # Count actual regions where each service appears in the data; each
+            # row is a region where the service is available
+            service_codes = sorted(all_services)
+            region_counts = by_service.reindex(service_codes, fill_value=0)
+            coverage_pct = (region_counts / total_regions * 100).round(1)
 
-                # Count actual regions where this service appears in the data
-                service_data = df[df["Service Code"] == service_code]
-                region_count = len(
-                    service_data
-                )  # Each row is a region where the service is available
-                coverage_pct = round((region_count / total_regions) * 100, 1)
-
-                summary_data.append(
-                    {
-                        "Service Code": service_code,
-                        "Service Name": service_name,
-                        "Region Count": region_count,
-                        "Coverage %": coverage_pct / 100,  # Store as decimal
-                    }
-                )
-
-                # Log progress every 50 services
-                if (i + 1) % 50 == 0:
-                    logging.info(f"Processed {i + 1}/{len(all_services)} services...")
+            return pd.DataFrame(
+                {
+                    "Service Code": service_codes,
+                    "Service Name": [
+                        service_names.get(code, code) for code in service_codes
+                    ],
+                    "Region Count": region_counts.to_numpy(),
+                    "Coverage %": coverage_pct.to_numpy() / 100,  # Store as decimal
+                }
+            )
         else:
             # Fallback to old method if all_services not provided
-            for service_name in sorted(df["Service Name"].unique()):
-                service_data = df[df["Service Name"] == service_name]
-                region_count = len(service_data)
+            # Region count and first service code per name in one pass
+            by_name = df.groupby("Service Name", observed=True)["Service Code"].agg(
+                ["size", "first"]
+            )
+            for service_name, region_count, service_code in by_name.itertuples():
                 coverage_pct = round((region_count / total_regions) * 100, 1)
 
-                # Get service code (take first occurrence)
-                service_code = service_data.iloc[0]["Service Code"]
-
                 summary_data.append(
                     {
                         "Service Code": service_code,
@@ -1487,10 +1287,22 @@ class AWSSSMDataFetcher:
         return pd.DataFrame(summary_data)
 
     def generate_statistics(
-        self, data: List[Dict], all_services: List[str] = None
+        self,
+        df: pd.DataFrame,
+        all_services: List[str] = None,
+        by_region: pd.Series = None,
+        by_service: pd.Series = None,
+        generated_at: Optional[datetime] = None,
     ) -> pd.DataFrame:
         """Generate statistics sheet."""
-        df = pd.DataFrame(data)
+        if generated_at is None:
+            generated_at = datetime.now()
+        if by_region is None:
+            by_region = df.groupby("Region Code", observed=True).size()
+        if by_service is None:
+            by_service = df.groupby("Service Code", observed=True).size()
+        region_stats = by_region.agg(["mean", "max", "min"])
+        service_stats = by_service.agg(["mean", "max", "min"])
 
         # Use total discovered services count if available
         total_services = (
@@ -1507,42 +1319,37 @@ class AWSSSMDataFetcher:
             ["Generator", "AWS SSM Data Fetcher with Caching v2.0"],
             ["", ""],
             ["Summary Statistics", ""],
-            ["Total Regions", df["Region Code"].nunique()],
+            ["Total Regions", len(by_region)],
             ["Total Services", total_services],
             ["Total Combinations", len(df)],
             ["", ""],
             ["Regional Service Distribution", ""],
-            [
-                "Avg Services per Region",
-                round(df.groupby("Region Code").size().mean(), 1),
-            ],
-            ["Max Services (Region)", df.groupby("Region Code").size().max()],
-            ["Min Services (Region)", df.groupby("Region Code").size().min()],
+            ["Avg Services per Region", round(region_stats["mean"], 1)],
+            ["Max Services (Region)", int(region_stats["max"])],
+            ["Min Services (Region)", int(region_stats["min"])],
             ["", ""],
             ["Service Distribution", ""],
-            [
-                "Avg Regions per Service",
-                round(df.groupby("Service Name").size().mean(), 1),
-            ],
-            ["Max Regions (Service)", df.groupby("Service Name").size().max()],
-            ["Min Regions (Service)", df.groupby("Service Name").size().min()],
+            ["Avg Regions per Service", round(service_stats["mean"], 1)],
+            ["Max Regions (Service)", int(service_stats["max"])],
+            ["Min Regions (Service)", int(service_stats["min"])],
         ]
 
         stats_df = pd.DataFrame(
             stats,
-            columns=["Generated At", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
+            columns=["Generated At", generated_at.strftime("%Y-%m-%d %H:%M:%S")],
         )
         return stats_df
 
     def save_to_excel(
         self,
-        data: List[Dict],
+        data: Dict[str, List[str]],
         filename: str = None,
         output_dir: str = "output",
         region_names: Dict[str, str] = None,
         rss_data: Dict[str, Dict] = None,
         all_services: List[str] = None,
         service_names: Dict[str, str] = None,
+        generated_at: Optional[datetime] = None,
     ):
         """Save data to Excel file with multiple sheets matching the original format."""
         # Create output directory if it doesn't exist
@@ -1562,144 +1369,55 @@ class AWSSSMDataFetcher:
 
         logging.info(f"Saving comprehensive Excel report: {filepath}")
 
-        # Fetch availability zone data for regions
+        # Build the frame and the per-region/per-service counts once and share
+        # them across every sheet
         df = pd.DataFrame(data)
-        regions = df["Region Code"].unique().tolist()
-        az_data = self.fetch_availability_zones(regions)
+        # Ordered categoricals sort once up front and let the groupbys and the
+        # crosstab below run on integer codes instead of Python strings
+        for column in ("Region Code", "Service Code", "Service Name"):
+            df[column] = pd.Categorical(
+                df[column], categories=sorted(set(df[column])), ordered=True
+            )
+        by_region = df.groupby("Region Code", observed=True).size()
+        by_service = df.groupby("Service Code", observed=True).size()
+
+        # Fetch availability zone data for regions
+        az_data = self.fetch_availability_zones(by_region.index.tolist())
 
         # Generate all sheets
-        regional_services_df = pd.DataFrame(data)
-        service_matrix_df = self.generate_service_matrix(data)
+        regional_services_df = df
+        service_matrix_df = self.generate_service_matrix(df)
         region_summary_df = self.generate_region_summary(
-            data, region_names or {}, rss_data, az_data, all_services
+            df, region_names or {}, rss_data, az_data, all_services, by_region
         )
         service_summary_df = self.generate_service_summary(
-            data, all_services, service_names
+            df, all_services, service_names, by_service
+        )
+        statistics_df = self.generate_statistics(
+            df, all_services, by_region, by_service, generated_at
         )
-        statistics_df = self.generate_statistics(data, all_services)
-
-        # Save to Excel with multiple sheets and auto-adjust column widths
-        with pd.ExcelWriter(filepath, engine="openpyxl") as writer:
-            # Write all sheets
-            regional_services_df.to_excel(
-                writer, sheet_name="Regional Services", index=False
-            )
-            service_matrix_df.to_excel(writer, sheet_name="Service Matrix", index=False)
-            region_summary_df.to_excel(writer, sheet_name="Region Summary", index=False)
-            service_summary_df.to_excel(
-                writer, sheet_name="Service Summary", index=False
-            )
-            statistics_df.to_excel(writer, sheet_name="Statistics", index=False)
-
-            # Auto-adjust column widths and apply formatting for all sheets
-            from openpyxl.styles import Font, PatternFill
-
-            # Define colors and fonts to match the original file
-            green_fill = PatternFill(
-                start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"
-            )  # Light green for ✓
-            red_fill = PatternFill(
-                start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"
-            )  # Light red for ✗
-            header_fill = PatternFill(
-                start_color="366092", end_color="366092", fill_type="solid"
-            )  # Dark blue for headers
-            white_font = Font(color="FFFFFF")  # White font for headers
-
-            for sheet_name in writer.sheets:
-                worksheet = writer.sheets[sheet_name]
-
-                # Get the dataframe for this sheet to calculate optimal widths
-                if sheet_name == "Regional Services":
-                    df = regional_services_df
-                elif sheet_name == "Service Matrix":
-                    df = service_matrix_df
-                elif sheet_name == "Region Summary":
-                    df = region_summary_df
-                elif sheet_name == "Service Summary":
-                    df = service_summary_df
-                elif sheet_name == "Statistics":
-                    df = statistics_df
-
-                # Apply header formatting to ALL sheets (matching sample file)
-                logging.info(f"Applying header formatting to {sheet_name}...")
-
-                # Color the header row (row 1) for all sheets with blue background and white font
-                for col in range(1, worksheet.max_column + 1):
-                    cell = worksheet.cell(row=1, column=col)
-                    cell.fill = header_fill
-                    cell.font = white_font
-
-                # Apply special formatting for Service Matrix
-                if sheet_name == "Service Matrix":
-                    logging.info(
-                        "Applying color formatting to Service Matrix data cells..."
-                    )
-
-                    # Color the data cells based on ✓ or ✗ values
-                    for row in range(
-                        2, worksheet.max_row + 1
-                    ):  # Start from row 2 (skip header)
-                        for col in range(
-                            2, worksheet.max_column + 1
-                        ):  # Start from col 2 (skip service name)
-                            cell = worksheet.cell(row=row, column=col)
-                            if cell.value == "✓":
-                                cell.fill = green_fill
-                            elif cell.value == "✗":
-                                cell.fill = red_fill
-
-                # Apply percentage formatting for Service Summary
-                elif sheet_name == "Service Summary":
-                    logging.info("Applying percentage formatting to Service Summary...")
-
-                    # Find the Coverage % column (should be column D)
-                    coverage_col = None
-                    for col in range(1, worksheet.max_column + 1):
-                        header_cell = worksheet.cell(row=1, column=col)
-                        if header_cell.value == "Coverage %":
-                            coverage_col = col
-                            break
-
-                    if coverage_col:
-                        # Apply percentage format to the Coverage % column
-                        from openpyxl.styles import NamedStyle
-
-                        # Create percentage style
-                        percentage_style = NamedStyle(name="percentage")
-                        percentage_style.number_format = "0.0%"
-
-                        # Apply to all data cells in Coverage % column
-                        for row in range(2, worksheet.max_row + 1):
-                            cell = worksheet.cell(row=row, column=coverage_col)
-                            cell.style = percentage_style
-
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    column_letter = column[0].column_letter
-                    column_name = (
-                        df.columns[column[0].column - 1]
-                        if column[0].column <= len(df.columns)
-                        else ""
-                    )
-
-                    # Calculate optimal width based on content
-                    max_length = 0
 
-                    # Check header length
-                    if column_name:
-                        max_length = max(max_length, len(str(column_name)))
+        # Stream every sheet through a write-only workbook so rows are appended
+        # once instead of being held as a full openpyxl cell tree
+        sheets = {
+            "Regional Services": regional_services_df,
+            "Service Matrix": service_matrix_df,
+            "Region Summary": region_summary_df,
+            "Service Summary": service_summary_df,
+            "Statistics": statistics_df,
+        }
 
-                    # Check data content length (sample first 100 rows for performance)
-                    if column[0].column <= len(df.columns):
-                        col_data = df.iloc[: min(100, len(df)), column[0].column - 1]
-                        for cell_value in col_data:
-                            if cell_value is not None:
-                                max_length = max(max_length, len(str(cell_value)))
+        engine = self.config.excel_engine
+        if engine == "auto":
+            engine = "xlsxwriter" if xlsxwriter is not None else "openpyxl"
+        elif engine == "xlsxwriter" and xlsxwriter is None:
+            logging.warning("xlsxwriter is not installed, falling back to openpyxl")
+            engine = "openpyxl"
 
-                    # Set column width with reasonable limits (min 10, max 50 characters)
-                    adjusted_width = min(max(max_length + 2, 10), 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
+        if engine == "xlsxwriter":
+            self._write_excel_xlsxwriter(filepath, sheets)
+        else:
+            self._write_excel_openpyxl(filepath, sheets)
 
         # Get stats for logging
         stats = {
@@ -1719,8 +1437,110 @@ class AWSSSMDataFetcher:
 
         return filepath
 
+    def _write_excel_openpyxl(self, filepath: str, sheets: Dict[str, pd.DataFrame]):
+        """Write the report sheets through an openpyxl write-only workbook."""
+        # Stream every sheet through a write-only workbook so rows are appended
+        # once instead of being held as a full openpyxl cell tree
+        workbook = Workbook(write_only=True)
+        for sheet_name, sheet_df in sheets.items():
+            worksheet = workbook.create_sheet(sheet_name)
+            logging.info(f"Writing {sheet_name}...")
+
+            # Write-only sheets need column widths set before any rows are added
+            for col_idx, width in enumerate(_excel_column_widths(sheet_df), start=1):
+                worksheet.column_dimensions[get_column_letter(col_idx)].width = width
+
+            # Color the header row for all sheets with blue background and white font
+            header = []
+            for column_name in sheet_df.columns:
+                cell = WriteOnlyCell(worksheet, value=column_name)
+                cell.fill = _HEADER_FILL
+                cell.font = _WHITE_FONT
+                header.append(cell)
+            worksheet.append(header)
+
+            rows = _excel_rows(sheet_df)
+
+            if sheet_name == "Service Matrix":
+                # Color the data cells based on ✓ or ✗ values, skipping the
+                # service name column; the matrix only holds those two glyphs,
+                # so one comparison over the array picks every cell's fill
+                available = sheet_df.iloc[:, 1:].to_numpy() == "✓"
+                for row, row_available in zip(rows, available):
+                    cells = [row[0]]
+                    for value, is_available in zip(row[1:], row_available):
+                        cell = WriteOnlyCell(worksheet, value=value)
+                        cell.fill = _GREEN_FILL if is_available else _RED_FILL
+                        cells.append(cell)
+                    worksheet.append(cells)
+
+            elif sheet_name == "Service Summary" and "Coverage %" in sheet_df:
+                # Apply percentage format to the Coverage % column
+                coverage_idx = sheet_df.columns.get_loc("Coverage %")
+                for row in rows:
+                    cells = list(row)
+                    cell = WriteOnlyCell(worksheet, value=cells[coverage_idx])
+                    cell.number_format = "0.0%"
+                    cells[coverage_idx] = cell
+                    worksheet.append(cells)
+
+            else:
+                for row in rows:
+                    worksheet.append(row)
+
+        workbook.save(filepath)
+
+    def _write_excel_xlsxwriter(self, filepath: str, sheets: Dict[str, pd.DataFrame]):
+        """Write the report sheets with XlsxWriter in constant-memory mode."""
+        workbook = xlsxwriter.Workbook(filepath, {"constant_memory": True})
+        formats = {
+            name: workbook.add_format(props) for name, props in _XLSX_FORMATS.items()
+        }
+
+        for sheet_name, sheet_df in sheets.items():
+            worksheet = workbook.add_worksheet(sheet_name)
+            logging.info(f"Writing {sheet_name}...")
+
+            # Column formats apply to every unformatted cell in the column
+            coverage_idx = (
+                sheet_df.columns.get_loc("Coverage %")
+                if sheet_name == "Service Summary" and "Coverage %" in sheet_df
+                else None
+            )
+            for col_idx, width in enumerate(_excel_column_widths(sheet_df)):
+                cell_format = formats["percent"] if col_idx == coverage_idx else None
+                worksheet.set_column(col_idx, col_idx, width, cell_format)
+
+            worksheet.write_row(0, 0, sheet_df.columns.tolist(), formats["header"])
+            rows = _excel_rows(sheet_df)
+
+            if sheet_name == "Service Matrix":
+                available = sheet_df.iloc[:, 1:].to_numpy() == "✓"
+                for row_idx, (row, row_available) in enumerate(
+                    zip(rows, available), start=1
+                ):
+                    worksheet.write(row_idx, 0, row[0])
+                    for col_idx, (value, is_available) in enumerate(
+                        zip(row[1:], row_available), start=1
+                    ):
+                        worksheet.write(
+                            row_idx,
+                            col_idx,
+                            value,
+                            formats["green" if is_available else "red"],
+                        )
+            else:
+                for row_idx, row in enumerate(rows, start=1):
+                    worksheet.write_row(row_idx, 0, row)
+
+        workbook.close()
+
     def save_to_json(
-        self, data: List[Dict], filename: str = None, output_dir: str = "output"
+        self,
+        data: Dict[str, List[str]],
+        filename: str = None,
+        output_dir: str = "output",
+        generated_at: Optional[datetime] = None,
     ):
         """Save data to JSON file."""
         # Create output directory if it doesn't exist
@@ -1740,20 +1560,28 @@ class AWSSSMDataFetcher:
 
         logging.info(f"Saving data to JSON: {filepath}")
 
-        # Create comprehensive JSON structure
-        json_data = {
-            "metadata": {
-                "generated_at": datetime.now().isoformat(),
-                "total_combinations": len(data),
-                "unique_regions": len(set(item["Region Code"] for item in data)),
-                "unique_services": len(set(item["Service Code"] for item in data)),
-                "source": "AWS SSM Parameter Store",
-            },
-            "data": data,
+        metadata = {
+            "generated_at": (generated_at or datetime.now()).isoformat(),
+            "total_combinations": len(data["Region Code"]),
+            "unique_regions": len(set(data["Region Code"])),
+            "unique_services": len(set(data["Service Code"])),
+            "source": "AWS SSM Parameter Store",
         }
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
+        # Stream {"metadata": ..., "data": [...]} one combination at a time so
+        # the full list of row objects and its encoding never sit in memory
+        # together; the output matches a single indent=2 dump of the document
+        rows = (dict(zip(data, row)) for row in zip(*data.values()))
+        with open(filepath, "wb", buffering=1 << 20) as f:
+            f.write(b'{\n  "metadata": ')
+            f.write(_encode_json_indented(metadata).replace(b"\n", b"\n  "))
+            f.write(b',\n  "data": [')
+            separator = b"\n    "
+            for row in rows:
+                f.write(separator)
+                f.write(_encode_json_indented(row).replace(b"\n", b"\n    "))
+                separator = b",\n    "
+            f.write(b"]\n}" if separator == b"\n    " else b"\n  ]\n}")
 
         logging.info(f"JSON file saved: {filepath}")
         return filepath
@@ -1779,6 +1607,11 @@ def main():
     parser.add_argument(
         "--no-cache", action="store_true", help="Disable caching for this run"
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached data for this run but refresh the cache with new results",
+    )
     parser.add_argument(
         "--cache-dir",
         type=str,
@@ -1791,12 +1624,35 @@ def main():
         default="output",
         help="Output directory for generated files (default: output)",
     )
+    parser.add_argument(
+        "--excel-engine",
+        choices=["auto", "openpyxl", "xlsxwriter"],
+        help="Excel writer (default: auto, xlsxwriter when installed)",
+    )
+    parser.add_argument(
+        "--formats",
+        type=str,
+        default="excel,json",
+        help="Comma-separated output formats to write: excel, json (default: excel,json)",
+    )
+
+    parser.add_argument(
+        "--log-level",
+        type=str.upper,
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        help="Logging verbosity (default: INFO)",
+    )
 
     args = parser.parse_args()
 
+    formats = {fmt.strip().lower() for fmt in args.formats.split(",") if fmt.strip()}
+    if not formats or not formats <= {"excel", "json"}:
+        parser.error(f"--formats must list excel and/or json, got {args.formats!r}")
+
     # Set up logging
     logging.basicConfig(
-        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+        level=args.log_level, format="%(asctime)s - %(levelname)s - %(message)s"
     )
 
     try:
@@ -1807,20 +1663,28 @@ def main():
         # Handle cache management commands
         if args.cache_info:
             cache_info = fetcher.get_cache_info()
-            print("\n" + "=" * 60)
-            print("CACHE INFORMATION")
-            print("=" * 60)
-            print(f"Cache Directory: {cache_info['cache_dir']}")
-            print(f"TTL Hours: {cache_info['ttl_hours']}")
-            print(f"Total Files: {cache_info['total_files']}")
-            print(f"Total Size: {cache_info['total_size_kb']} KB")
-            print("\nCached Files:")
+            lines = [
+                "",
+                "=" * 60,
+                "CACHE INFORMATION",
+                "=" * 60,
+                f"Cache Directory: {cache_info['cache_dir']}",
+                f"TTL Hours: {cache_info['ttl_hours']}",
+                f"Total Files: {cache_info['total_files']}",
+                f"Total Size: {cache_info['total_size_kb']} KB",
+                "",
+                "Cached Files:",
+            ]
             for file_info in cache_info["files"]:
                 status = "✅ Valid" if file_info["valid"] else "❌ Expired"
-                print(f"  {file_info['file']}: {file_info['size_kb']} KB, {status}")
-                print(f"    Created: {file_info['created']}")
-                print(f"    Expires: {file_info['expires']}")
-            print("=" * 60)
+                lines.append(
+                    f"  {file_info['file']}: {file_info['size_kb']} KB, {status}"
+                )
+                lines.append(f"    Created: {file_info['created']}")
+                lines.append(f"    Expires: {file_info['expires']}")
+            lines.append("=" * 60)
+            # One write keeps the report together under tee/log capture
+            print("\n".join(lines))
             return
 
         if args.clear_cache:
@@ -1844,8 +1708,8 @@ def main():
         region_names = fetcher.fetch_region_names(regions)
         service_names = fetcher.fetch_service_names(services)
 
-        # Fetch RSS data for region launch dates
-        rss_data = fetcher.fetch_region_rss_data()
+        # Fetch RSS data for region launch dates (only the Excel report uses it)
+        rss_data = fetcher.fetch_region_rss_data() if "excel" in formats else {}
 
         # Fetch regional service availability using proper AWS SSM mapping
         logging.info("Using proper AWS SSM data for regional service mapping...")
@@ -1856,20 +1720,37 @@ def main():
             regions, region_names, service_names, regional_services
         )
 
-        if not data:
+        if not data["Region Code"]:
             logging.error("No data generated")
             return
 
-        # Save to both formats
-        excel_file = fetcher.save_to_excel(
-            data,
-            output_dir=args.output_dir,
-            region_names=region_names,
-            rss_data=rss_data,
-            all_services=services,
-            service_names=service_names,
-        )
-        json_file = fetcher.save_to_json(data, output_dir=args.output_dir)
+        # Save the requested formats. The writers share no mutable state, so
+        # running them side by side makes the save stage as long as the
+        # slower writer instead of the sum of both.
+        os.makedirs(args.output_dir, exist_ok=True)
+        # Both reports carry the same generation timestamp
+        generated_at = datetime.now()
+        writers = {}
+        with ThreadPoolExecutor(max_workers=len(formats)) as executor:
+            if "excel" in formats:
+                writers["Excel"] = executor.submit(
+                    fetcher.save_to_excel,
+                    data,
+                    output_dir=args.output_dir,
+                    region_names=region_names,
+                    rss_data=rss_data,
+                    all_services=services,
+                    service_names=service_names,
+                    generated_at=generated_at,
+                )
+            if "json" in formats:
+                writers["JSON"] = executor.submit(
+                    fetcher.save_to_json,
+                    data,
+                    output_dir=args.output_dir,
+                    generated_at=generated_at,
+                )
+        output_files = {label: future.result() for label, future in writers.items()}
 
         # Print summary
         print("\n" + "=" * 60)
@@ -1877,9 +1758,9 @@ def main():
         print("=" * 60)
         print(f"Regions processed: {len(regions)}")
         print(f"Services processed: {len(services)}")
-        print(f"Total region-service combinations: {len(data)}")
-        print(f"Excel file: {excel_file}")
-        print(f"JSON file: {json_file}")
+        print(f"Total region-service combinations: {len(data['Region Code'])}")
+        for label, filepath in output_files.items():
+            print(f"{label} file: {filepath}")
         print("=" * 60)
 
     except Exception as e:
@@ -3,6 +3,7 @@ AWS Lambda Function: Data Fetcher
 Fetches AWS SSM data and RSS feed data for processing.
 """
 
+import dataclasses
 import json
 import logging
 import os
@@ -56,8 +57,9 @@ def lambda_handler(event: Dict[str, Any], context) -> Dict[str, Any]:
         from aws_ssm_fetcher.processors import RegionDiscoverer, ServiceDiscoverer
 
         # Create Lambda-optimized configuration
-        lambda_config = Config.for_lambda("data_fetcher")
-        lambda_config.aws_region = config["aws_region"]
+        lambda_config = dataclasses.replace(
+            Config.for_lambda("data_fetcher"), aws_region=config["aws_region"]
+        )
 
         # Initialize cache manager with S3 backend
         cache_manager = CacheManager(lambda_config)
@@ -19,18 +19,17 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     packages=find_packages(exclude=["tests", "tests.*"]),
+    package_data={"aws_ssm_fetcher.data_sources": ["_az_fallbacks.json"]},
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=[
         "boto3>=1.26.0",
         "pandas>=1.5.0",
@@ -49,6 +48,11 @@ setup(
         "lambda": [
             "aws-lambda-powertools>=2.0.0",
         ],
+        "performance": [
+            "orjson>=3.8.0",
+            "zstandard>=0.21.0",
+            "xlsxwriter>=3.0.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Test the standalone AWSSSMDataFetcher script in examples/."""
+
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from botocore.exceptions import ClientError
+
+# Add project root and examples to path
+PROJECT_ROOT = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "examples"))
+
+import aws_ssm_data_fetcher
+from aws_ssm_data_fetcher import _NEGATIVE_NAME_TTL, AWSSSMDataFetcher
+
+from aws_ssm_fetcher.core.config import Config
+
+LONG_NAME = "/aws/service/global-infrastructure/regions/{}/longName"
+
+
+def create_fetcher(cache_dir: str, ssm: Mock) -> AWSSSMDataFetcher:
+    """Create a fetcher caching under cache_dir and calling a stubbed SSM."""
+    fetcher = AWSSSMDataFetcher(config=Config(cache_dir=cache_dir, cache_hours=24))
+    fetcher.ssm = ssm
+    return fetcher
+
+
+def create_ssm(names: dict) -> Mock:
+    """Stub GetParameters: known region codes resolve, others are invalid."""
+
+    def get_parameters(Names):
+        return {
+            "Parameters": [
+                {"Name": name, "Value": names[name]} for name in Names if name in names
+            ],
+            "InvalidParameters": [name for name in Names if name not in names],
+        }
+
+    ssm = Mock()
+    ssm.get_parameters.side_effect = get_parameters
+    return ssm
+
+
+def requested_codes(ssm: Mock) -> list:
+    """Region codes requested from the stub, in call order."""
+    return [
+        name.split("/")[-2]
+        for call in ssm.get_parameters.call_args_list
+        for name in call.kwargs["Names"]
+    ]
+
+
+def test_invalid_names_use_short_ttl():
+    """Test that codes SSM reports invalid are negative-cached briefly."""
+    ssm = create_ssm({LONG_NAME.format("us-east-1"): "US East (N. Virginia)"})
+    clock = [1_000_000.0]
+
+    with (
+        tempfile.TemporaryDirectory() as cache_dir,
+        patch.object(aws_ssm_data_fetcher.time, "time", lambda: clock[0]),
+    ):
+        fetcher = create_fetcher(cache_dir, ssm)
+        names = fetcher.fetch_region_names(["us-east-1", "xx-none-1"])
+        assert names == {"us-east-1": "US East (N. Virginia)", "xx-none-1": "xx-none-1"}
+
+        entries = fetcher.cache_manager.get("region_name_entries")
+        assert entries["xx-none-1"] == {"value": None, "ts": clock[0]}
+
+        # Within the negative TTL nothing is requested again
+        clock[0] += _NEGATIVE_NAME_TTL - 1
+        fetcher.fetch_region_names(["us-east-1", "xx-none-1"])
+        assert requested_codes(ssm) == ["us-east-1", "xx-none-1"]
+
+        # After it only the invalid code is retried
+        clock[0] += 2
+        fetcher.fetch_region_names(["us-east-1", "xx-none-1"])
+        assert requested_codes(ssm) == ["us-east-1", "xx-none-1", "xx-none-1"]
+
+
+def test_failed_batch_is_not_cached():
+    """Test that codes from a failed GetParameters call are never stored."""
+    ssm = create_ssm({LONG_NAME.format("us-east-1"): "US East (N. Virginia)"})
+    ssm.get_parameters.side_effect = ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+        "GetParameters",
+    )
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        fetcher = create_fetcher(cache_dir, ssm)
+        names = fetcher.fetch_region_names(["us-east-1"])
+        assert names == {"us-east-1": "us-east-1"}
+
+        entries = fetcher.cache_manager.get("region_name_entries") or {}
+        assert "us-east-1" not in entries
+
+        # The next run asks again and caches the real name
+        ssm.get_parameters.side_effect = create_ssm(
+            {LONG_NAME.format("us-east-1"): "US East (N. Virginia)"}
+        ).get_parameters.side_effect
+        names = fetcher.fetch_region_names(["us-east-1"])
+        assert names == {"us-east-1": "US East (N. Virginia)"}
+        entries = fetcher.cache_manager.get("region_name_entries")
+        assert entries["us-east-1"]["value"] == "US East (N. Virginia)"
+
+
+def test_expired_names_are_requested_again():
+    """Test that only names older than cache_hours are re-requested."""
+    ssm = create_ssm(
+        {
+            LONG_NAME.format("us-east-1"): "US East (N. Virginia)",
+            LONG_NAME.format("eu-west-1"): "Europe (Ireland)",
+        }
+    )
+    clock = [1_000_000.0]
+
+    with (
+        tempfile.TemporaryDirectory() as cache_dir,
+        patch.object(aws_ssm_data_fetcher.time, "time", lambda: clock[0]),
+    ):
+        fetcher = create_fetcher(cache_dir, ssm)
+        fetcher.fetch_region_names(["us-east-1"])
+
+        clock[0] += 23 * 3600
+        fetcher.fetch_region_names(["us-east-1", "eu-west-1"])
+        assert requested_codes(ssm) == ["us-east-1", "eu-west-1"]
+
+        # us-east-1 is now past 24 hours old; eu-west-1 is still fresh
+        clock[0] += 2 * 3600
+        names = fetcher.fetch_region_names(["us-east-1", "eu-west-1"])
+        assert requested_codes(ssm) == ["us-east-1", "eu-west-1", "us-east-1"]
+        assert names == {
+            "us-east-1": "US East (N. Virginia)",
+            "eu-west-1": "Europe (Ireland)",
+        }
+
+
+def _expected_json(data: dict, generated_at: datetime) -> str:
+    """Reference encoding: one indent=2 dump of the whole document."""
+    document = {
+        "metadata": {
+            "generated_at": generated_at.isoformat(),
+            "total_combinations": len(data["Region Code"]),
+            "unique_regions": len(set(data["Region Code"])),
+            "unique_services": len(set(data["Service Code"])),
+            "source": "AWS SSM Parameter Store",
+        },
+        "data": [dict(zip(data, row)) for row in zip(*data.values())],
+    }
+    return json.dumps(document, indent=2, ensure_ascii=False)
+
+
+def test_save_to_json_matches_single_dump():
+    """Test the streamed JSON output byte-for-byte, with and without orjson."""
+    generated_at = datetime(2024, 1, 2, 3, 4, 5)
+    matrix = {
+        "Region Code": ["us-east-1", "us-east-1", "sa-east-1"],
+        "Region Name": [
+            "US East (N. Virginia)",
+            "US East (N. Virginia)",
+            "América do Sul (São Paulo)",
+        ],
+        "Service Code": ["ec2", "s3", "ec2"],
+        "Service Name": ["Amazon EC2", "Amazon S3", "Amazon EC2"],
+    }
+    empty = {key: [] for key in matrix}
+
+    encoders = [None]
+    if aws_ssm_data_fetcher.orjson is not None:
+        encoders.append(aws_ssm_data_fetcher.orjson)
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        fetcher = create_fetcher(output_dir, Mock())
+        for encoder in encoders:
+            with patch.object(aws_ssm_data_fetcher, "orjson", encoder):
+                for data in (matrix, empty):
+                    filepath = fetcher.save_to_json(
+                        data,
+                        output_dir=output_dir,
+                        generated_at=generated_at,
+                    )
+                    with open(filepath, encoding="utf-8") as f:
+                        assert f.read() == _expected_json(data, generated_at)
+
+
+if __name__ == "__main__":
+    test_invalid_names_use_short_ttl()
+    test_failed_batch_is_not_cached()
+    test_expired_names_are_requested_again()
+    test_save_to_json_matches_single_dump()
+    print("✅ AWSSSMDataFetcher tests passed")
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Test the multi-tier CacheManager."""
+
+import os
+import pickle
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from aws_ssm_fetcher.core import cache
+from aws_ssm_fetcher.core.cache import CacheManager
+from aws_ssm_fetcher.core.config import Config
+
+SAMPLE = {"regions": ["us-east-1", "eu-west-1"], "services": {"ec2": "Amazon EC2"}}
+
+
+def _age_file(path, hours: float):
+    """Move a cache file's modification time into the past."""
+    mtime = time.time() - hours * 3600
+    os.utime(path, (mtime, mtime))
+
+
+def test_round_trip():
+    """Test set/get through the memory and local tiers."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        manager = CacheManager(Config(cache_dir=cache_dir))
+        assert manager.set("regions", SAMPLE)
+        assert manager.get("regions") == SAMPLE
+
+        # A new manager has an empty memory tier and reads the file back
+        path = manager._get_cache_path("regions")
+        assert path.name == f"regions{cache.CACHE_SUFFIX}"
+        assert CacheManager(Config(cache_dir=cache_dir)).get("regions") == SAMPLE
+
+        if cache.zstandard is not None:
+            assert path.name.endswith(".pkl.zst")
+            assert path.read_bytes()[:4] == b"\x28\xb5\x2f\xfd"  # zstd magic
+
+
+def test_round_trip_without_zstandard():
+    """Test that caching falls back to plain pickles without zstandard."""
+    with (
+        tempfile.TemporaryDirectory() as cache_dir,
+        patch.multiple(cache, zstandard=None, CACHE_SUFFIX=".pkl"),
+    ):
+        manager = CacheManager(Config(cache_dir=cache_dir))
+        assert manager.set("regions", SAMPLE)
+
+        path = manager._get_cache_path("regions")
+        assert path.name == "regions.pkl"
+        assert pickle.loads(path.read_bytes()) == SAMPLE
+        assert CacheManager(Config(cache_dir=cache_dir)).get("regions") == SAMPLE
+
+
+def test_per_key_ttl_expiry():
+    """Test that an explicit ttl_hours overrides cache_hours for one key."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        config = Config(cache_dir=cache_dir, cache_hours=24)
+        manager = CacheManager(config)
+        manager.set("short", "short-lived", ttl_hours=1)
+        manager.set("default", "long-lived")
+
+        _age_file(manager._get_cache_path("short"), 2)
+        _age_file(manager._get_cache_path("default"), 2)
+
+        reader = CacheManager(config)
+        assert reader.get("short", ttl_hours=1) is None
+        assert reader.get("default") == "long-lived"
+
+        files = {entry["file"]: entry for entry in reader.get_info()["files"]}
+        short = files[f"short{cache.CACHE_SUFFIX}"]
+        default = files[f"default{cache.CACHE_SUFFIX}"]
+        assert (short["ttl_hours"], short["valid"]) == (1, False)
+        assert (default["ttl_hours"], default["valid"]) == (24, True)
+
+        # Rewriting with the default TTL drops the explicit one
+        manager.set("short", "now default")
+        files = {entry["file"]: entry for entry in reader.get_info()["files"]}
+        assert files[f"short{cache.CACHE_SUFFIX}"]["ttl_hours"] == 24
+
+
+def test_memory_tier_expires_with_ttl():
+    """Test that the memory tier honours the same per-key TTL."""
+    clock = [1_000_000.0]
+    with (
+        tempfile.TemporaryDirectory() as cache_dir,
+        patch.object(cache.time, "time", lambda: clock[0]),
+    ):
+        manager = CacheManager(Config(cache_dir=cache_dir))
+        manager.set("short", "value", ttl_hours=1)
+        assert manager._get_from_memory("short") == "value"
+
+        clock[0] += 3601
+        assert manager._get_from_memory("short") is None
+        assert "short" not in manager._memory_cache
+
+
+def test_refresh_bypasses_reads():
+    """Test that refresh mode skips reads but still writes."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        CacheManager(Config(cache_dir=cache_dir)).set("regions", SAMPLE)
+
+        refreshing = CacheManager(Config(cache_dir=cache_dir, cache_refresh=True))
+        assert refreshing.get("regions") is None
+        assert refreshing.get_stale("regions") is None
+
+        assert refreshing.set("regions", ["fresh"])
+        assert CacheManager(Config(cache_dir=cache_dir)).get("regions") == ["fresh"]
+
+
+def test_get_stale_returns_expired_entries():
+    """Test that get_stale ignores the TTL while get does not."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        config = Config(cache_dir=cache_dir, cache_hours=1)
+        manager = CacheManager(config)
+        manager.set("regions", SAMPLE)
+        _age_file(manager._get_cache_path("regions"), 2)
+
+        reader = CacheManager(config)
+        assert reader.get("regions") is None
+        assert reader.get_stale("regions") == SAMPLE
+        assert reader.get_stale("missing") is None
+
+        # Disabled caching never returns anything
+        disabled = CacheManager(
+            Config(cache_dir=cache_dir, cache_hours=1, cache_enabled=False)
+        )
+        assert disabled.get_stale("regions") is None
+
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_round_trip_without_zstandard()
+    test_per_key_ttl_expiry()
+    test_memory_tier_expires_with_ttl()
+    test_refresh_bypasses_reads()
+    test_get_stale_returns_expired_entries()
+    print("✅ Cache tests passed")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Test the immutable Config and its constructors."""
+
+import argparse
+import os
+import sys
+from dataclasses import FrozenInstanceError, replace
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from aws_ssm_fetcher.core.config import Config
+
+
+def test_config_is_frozen():
+    """Test that assignment is rejected and replace() derives a copy."""
+    config = Config()
+    try:
+        config.cache_hours = 1
+        raise AssertionError("Config assignment should raise")
+    except FrozenInstanceError:
+        pass
+
+    derived = replace(config, cache_hours=1)
+    assert (config.cache_hours, derived.cache_hours) == (24, 1)
+
+
+def test_from_env():
+    """Test that environment variables populate the config."""
+    env = {
+        "CACHE_DIR": "/var/cache/ssm",
+        "CACHE_HOURS": "6",
+        "CACHE_REFRESH": "true",
+        "SSM_RATE_LIMIT": "2.5",
+        "EXCEL_ENGINE": "xlsxwriter",
+    }
+    with patch.dict(os.environ, env, clear=True):
+        config = Config.from_env()
+
+    assert config.cache_dir == "/var/cache/ssm"
+    assert config.cache_hours == 6
+    assert config.cache_refresh is True
+    assert config.ssm_rate_limit == 2.5
+    assert config.excel_engine == "xlsxwriter"
+
+
+def test_from_args_with_partial_namespace():
+    """Test from_args with a Namespace lacking newer options."""
+    # Older callers build a Namespace without refresh or excel_engine
+    args = argparse.Namespace(cache_dir="/tmp/ssm", cache_hours=12, no_cache=False)
+    with patch.dict(os.environ, {}, clear=True):
+        config = Config.from_args(args)
+
+    assert config.cache_dir == "/tmp/ssm"
+    assert config.cache_hours == 12
+    assert config.cache_enabled is True
+    assert config.cache_refresh is False
+    assert config.excel_engine == "auto"
+
+    args = argparse.Namespace(no_cache=True, refresh=True, excel_engine="openpyxl")
+    with patch.dict(os.environ, {}, clear=True):
+        config = Config.from_args(args)
+
+    assert config.cache_enabled is False
+    assert config.cache_refresh is True
+    assert config.excel_engine == "openpyxl"
+
+
+def test_for_lambda_overrides():
+    """Test the Lambda paths, shared memory tier and per-function workers."""
+    with patch.dict(os.environ, {"CACHE_HOURS": "48"}, clear=True):
+        fetcher = Config.for_lambda()
+        processor = Config.for_lambda("processor")
+        reporter = Config.for_lambda("report_generator")
+
+    for config in (fetcher, processor, reporter):
+        assert config.cache_dir == "/tmp/cache"
+        assert config.output_dir == "/tmp/output"
+        assert config.memory_cache_shared is True
+        # Settings without a Lambda override still come from the environment
+        assert config.cache_hours == 48
+
+    assert fetcher.max_workers == 20
+    assert processor.max_workers == 10
+    assert reporter.max_workers == 5
+
+
+if __name__ == "__main__":
+    test_config_is_frozen()
+    test_from_env()
+    test_from_args_with_partial_namespace()
+    test_for_lambda_overrides()
+    print("✅ Config tests passed")
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""Test error classification, circuit breaking and rate limiting."""
+
+import os
+import sys
+import threading
+from unittest.mock import patch
+
+from botocore.exceptions import ClientError
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from aws_ssm_fetcher.core import error_handling
+from aws_ssm_fetcher.core.error_handling import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerOpenError,
+    CircuitState,
+    ErrorHandler,
+    RateLimiter,
+)
+
+
+def _client_error(code: str, message: str) -> ClientError:
+    """Build a botocore ClientError like the SSM client raises."""
+    return ClientError(
+        {"Error": {"Code": code, "Message": message}}, "GetParametersByPath"
+    )
+
+
+def test_classify_aws_error():
+    """Test retry decisions for retryable and non-retryable AWS errors."""
+    handler = ErrorHandler()
+
+    cases = [
+        (_client_error("ThrottlingException", "Rate exceeded"), (True, "throttling")),
+        (Exception("Connection reset by peer"), (True, "network")),
+        (Exception("503 Service Unavailable"), (True, "service_unavailable")),
+        (
+            _client_error("AccessDeniedException", "Access denied"),
+            (False, "authentication"),
+        ),
+        (
+            _client_error("ParameterNotFound", "Parameter not found"),
+            (False, "not_found"),
+        ),
+        (
+            _client_error("ValidationException", "Invalid parameter name"),
+            (False, "validation"),
+        ),
+        (Exception("something odd happened"), (True, "unknown")),
+    ]
+    for error, expected in cases:
+        assert handler.classify_aws_error(error) == expected, str(error)
+
+
+def test_classify_aws_error_precedence():
+    """Test that the highest-precedence category wins, wherever it appears."""
+    handler = ErrorHandler()
+
+    # Overlapping keywords: "404" and "403" share the middle "4"
+    assert handler.classify_aws_error(Exception("RequestId 40403 failed")) == (
+        False,
+        "authentication",
+    )
+    # Retryable categories outrank non-retryable ones
+    assert handler.classify_aws_error(Exception("ThrottlingException 404")) == (
+        True,
+        "throttling",
+    )
+    assert handler.classify_aws_error(Exception("Access denied: timeout")) == (
+        True,
+        "network",
+    )
+    # Matching is case-insensitive
+    assert handler.classify_aws_error(Exception("NOT FOUND")) == (False, "not_found")
+
+
+def _call_concurrently(breaker: CircuitBreaker, func, threads: int = 8) -> list:
+    """Call func through the breaker from several threads at once.
+
+    Returns:
+        The exception raised in each thread (None for successful calls)
+    """
+    barrier = threading.Barrier(threads)
+    outcomes = []
+    outcomes_lock = threading.Lock()
+
+    def worker():
+        barrier.wait()
+        try:
+            breaker.call(func)
+            outcome = None
+        except Exception as e:
+            outcome = e
+        with outcomes_lock:
+            outcomes.append(outcome)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for worker_thread in workers:
+        worker_thread.start()
+    for worker_thread in workers:
+        worker_thread.join()
+    return outcomes
+
+
+def _fail():
+    raise ConnectionError("boom")
+
+
+def test_circuit_breaker_opens_once_under_concurrent_failures():
+    """Test the threshold transition when failures arrive concurrently."""
+    breaker = CircuitBreaker(
+        CircuitBreakerConfig(failure_threshold=3, recovery_timeout=60.0)
+    )
+
+    # Every thread passes the closed-state check before any of them fails
+    barrier = threading.Barrier(8)
+
+    def fail_together():
+        barrier.wait()
+        _fail()
+
+    outcomes = _call_concurrently(breaker, fail_together)
+
+    assert all(isinstance(e, ConnectionError) for e in outcomes)
+    stats = breaker.get_stats()
+    assert stats["state"] == CircuitState.OPEN.value
+    assert stats["failed_calls"] == 8
+    assert stats["circuit_opens"] == 1
+
+    # Further calls fail fast without reaching the function
+    calls = []
+    try:
+        breaker.call(calls.append, "x")
+        raise AssertionError("Open circuit should fail fast")
+    except CircuitBreakerOpenError:
+        pass
+    assert calls == []
+
+
+def test_circuit_breaker_half_open_recovery():
+    """Test half-open probing after the recovery timeout, then closing."""
+    clock = [1000.0]
+    with patch.object(error_handling.time, "monotonic", lambda: clock[0]):
+        breaker = CircuitBreaker(
+            CircuitBreakerConfig(
+                failure_threshold=2, recovery_timeout=30.0, half_open_max_calls=3
+            )
+        )
+        _call_concurrently(breaker, _fail, threads=4)
+        assert breaker.state == CircuitState.OPEN
+
+        # Still inside the recovery window
+        clock[0] += 29.0
+        outcomes = _call_concurrently(breaker, lambda: "ok", threads=4)
+        assert all(isinstance(e, CircuitBreakerOpenError) for e in outcomes)
+
+        # After the window the next calls probe; enough successes close it
+        clock[0] += 2.0
+        outcomes = _call_concurrently(breaker, lambda: "ok", threads=4)
+        assert outcomes == [None] * 4
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.get_stats()["circuit_opens"] == 1
+
+
+def test_circuit_breaker_half_open_failure_reopens():
+    """Test that a failed half-open probe opens the circuit again."""
+    clock = [1000.0]
+    with patch.object(error_handling.time, "monotonic", lambda: clock[0]):
+        breaker = CircuitBreaker(
+            CircuitBreakerConfig(failure_threshold=1, recovery_timeout=10.0)
+        )
+        _call_concurrently(breaker, _fail, threads=1)
+        assert breaker.state == CircuitState.OPEN
+
+        clock[0] += 10.0
+        _call_concurrently(breaker, _fail, threads=1)
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.get_stats()["circuit_opens"] == 2
+
+        # The failed probe restarted the recovery window
+        clock[0] += 5.0
+        outcomes = _call_concurrently(breaker, lambda: "ok", threads=1)
+        assert isinstance(outcomes[0], CircuitBreakerOpenError)
+
+
+class _FakeClock:
+    """Monotonic clock that only moves when the limiter sleeps."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _patched_clock(clock: _FakeClock):
+    return patch.multiple(
+        error_handling.time, monotonic=clock.monotonic, sleep=clock.sleep
+    )
+
+
+def test_rate_limiter_paces_after_burst():
+    """Test that a full bucket allows a burst, then paces at the rate."""
+    clock = _FakeClock()
+    with _patched_clock(clock):
+        limiter = RateLimiter(rate=2.0, capacity=2)
+
+        waits = [limiter.acquire() for _ in range(5)]
+
+    assert waits == [0.0, 0.0, 0.5, 0.5, 0.5]
+    assert clock.sleeps == [0.5, 0.5, 0.5]
+
+
+def test_rate_limiter_refills_while_idle():
+    """Test that idle time refills the bucket up to its capacity."""
+    clock = _FakeClock()
+    with _patched_clock(clock):
+        limiter = RateLimiter(rate=4.0, capacity=2)
+        limiter.acquire()
+        limiter.acquire()
+
+        # Ten seconds idle refill to capacity (2), not to 40 tokens
+        clock.now += 10.0
+        waits = [limiter.acquire() for _ in range(3)]
+
+    assert waits == [0.0, 0.0, 0.25]
+
+
+def test_rate_limiter_set_rate():
+    """Test that set_rate applies the new rate and starts the bucket full."""
+    clock = _FakeClock()
+    with _patched_clock(clock):
+        limiter = RateLimiter(rate=1.0)
+        limiter.acquire()
+        assert limiter.acquire() == 1.0
+
+        limiter.set_rate(10.0, capacity=1)
+        assert limiter.acquire() == 0.0
+        assert limiter.acquire() == 0.1
+
+        # Zero or negative rates disable pacing entirely
+        limiter.set_rate(0)
+        assert [limiter.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+
+def test_rate_limiter_queues_concurrent_callers():
+    """Test that concurrent callers each reserve a distinct slot."""
+    clock = _FakeClock()
+    with patch.object(error_handling.time, "monotonic", clock.monotonic):
+        # Real sleeps are skipped so the reserved waits can be compared
+        with patch.object(error_handling.time, "sleep", lambda seconds: None):
+            limiter = RateLimiter(rate=10.0, capacity=1)
+            barrier = threading.Barrier(5)
+            waits = []
+            waits_lock = threading.Lock()
+
+            def worker():
+                barrier.wait()
+                wait = limiter.acquire()
+                with waits_lock:
+                    waits.append(round(wait, 6))
+
+            workers = [threading.Thread(target=worker) for _ in range(5)]
+            for worker_thread in workers:
+                worker_thread.start()
+            for worker_thread in workers:
+                worker_thread.join()
+
+    assert sorted(waits) == [0.0, 0.1, 0.2, 0.3, 0.4]
+
+
+if __name__ == "__main__":
+    test_classify_aws_error()
+    test_classify_aws_error_precedence()
+    test_circuit_breaker_opens_once_under_concurrent_failures()
+    test_circuit_breaker_half_open_recovery()
+    test_circuit_breaker_half_open_failure_reopens()
+    test_rate_limiter_paces_after_burst()
+    test_rate_limiter_refills_while_idle()
+    test_rate_limiter_set_rate()
+    test_rate_limiter_queues_concurrent_callers()
+    print("✅ Error handling tests passed")
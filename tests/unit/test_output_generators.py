@@ -7,6 +7,8 @@ import sys
 import tempfile
 from unittest.mock import Mock
 
+import pandas as pd
+
 # Add project root to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
@@ -116,6 +118,65 @@ def test_excel_generator():
     return True
 
 
+def test_excel_generator_reuse():
+    """Test that a reused ExcelGenerator reflects only the latest data."""
+
+    print("\n🧪 Testing ExcelGenerator reuse...")
+
+    second_data = [
+        {
+            "Region Code": "ap-south-1",
+            "Region Name": "Asia Pacific (Mumbai)",
+            "Service Code": "rds",
+            "Service Name": "Amazon RDS",
+        },
+        {
+            "Region Code": "ap-south-1",
+            "Region Name": "Asia Pacific (Mumbai)",
+            "Service Code": "dynamodb",
+            "Service Name": "Amazon DynamoDB",
+        },
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        context = create_test_context(temp_dir)
+        generator = ExcelGenerator(context)
+
+        context.filename = "first.xlsx"
+        generator.generate(create_test_data())
+        context.filename = "second.xlsx"
+        filepath = generator.generate(second_data)
+
+        sheets = pd.read_excel(filepath, sheet_name=None, engine="openpyxl")
+
+        regional = sheets["Regional Services"]
+        assert regional["Region Code"].tolist() == ["ap-south-1", "ap-south-1"]
+        assert sorted(regional["Service Code"]) == ["dynamodb", "rds"]
+
+        matrix = sheets["Service Matrix"]
+        assert list(matrix.columns) == ["Service", "ap-south-1"]
+        assert sorted(matrix["Service"]) == ["Amazon DynamoDB", "Amazon RDS"]
+
+        region_summary = sheets["Region Summary"]
+        assert region_summary["Region Code"].tolist() == ["ap-south-1"]
+        assert region_summary["Service Count"].tolist() == [2]
+
+        service_summary = sheets["Service Summary"]
+        assert len(service_summary) == 2
+        assert service_summary["Region Count"].tolist() == [1, 1]
+
+        statistics = dict(
+            zip(sheets["Statistics"]["Metric"], sheets["Statistics"]["Value"])
+        )
+        assert statistics["Total Service-Region Combinations"] == 2
+        assert statistics["Unique Regions"] == 1
+
+        print("✅ Second workbook contains only the second dataset")
+
+    print("🎉 ExcelGenerator reuse test completed successfully!")
+    return True
+
+
 def test_json_generator():
     """Test JSON output generation."""
 
@@ -276,6 +337,7 @@ if __name__ == "__main__":
 
     success = True
     success &= test_excel_generator()
+    success &= test_excel_generator_reuse()
     success &= test_json_generator()
     success &= test_csv_generators()
     success &= test_error_handling()
@@ -219,6 +219,34 @@ def test_availability_zone_analyzer():
     return True
 
 
+def test_az_pattern_fallback():
+    """Test AZ-to-region pattern matching used when get_parameter fails."""
+
+    print("\n🧪 Testing AZ pattern fallback...")
+
+    config = Config()
+    cache_manager = CacheManager(config)
+    context = ProcessingContext(config=config, cache_manager=cache_manager)
+    context.ssm_client = Mock()
+
+    az_analyzer = AvailabilityZoneAnalyzer(context)
+    base = "/aws/service/global-infrastructure/availability-zones"
+
+    assert az_analyzer._pattern_match_az_to_region(
+        f"{base}/use1-az2/region", "us-east-1"
+    )
+    assert az_analyzer._pattern_match_az_to_region(
+        f"{base}/apse2-az3/region", "ap-southeast-2"
+    )
+    assert not az_analyzer._pattern_match_az_to_region(
+        f"{base}/usw2-az1/region", "us-east-1"
+    )
+    print("✅ AZ IDs map to their region prefixes")
+
+    print("🎉 AZ pattern fallback test completed successfully!")
+    return True
+
+
 def test_statistics_analyzer():
     """Test StatisticsAnalyzer processor."""
 
@@ -496,6 +524,7 @@ if __name__ == "__main__":
 
     success = True
     success &= test_availability_zone_analyzer()
+    success &= test_az_pattern_fallback()
     success &= test_statistics_analyzer()
     success &= test_error_handling()
 